@@ -0,0 +1,225 @@
+"""Análise textual das páginas de um processo: termos e bigramas em uma matriz esparsa
+
+O extracted_text de cada página, sem o timbre (ver timbre.py), é
+tokenizado uma única vez. Cada palavra recebe um número no vocabulário e o
+texto do processo vira um vetor NumPy de números de termos; a partir dele,
+sem laços em Python:
+
+- a matriz página × termo no formato CSR (como scipy.sparse.csr_matrix):
+  indptr (páginas + 1), indices (termo) e contagens;
+- os bigramas, pares de palavras consecutivas na mesma página, com o
+  total de ocorrências e de páginas. Palavras vazias, números e palavras
+  de menos de 3 letras não entram nas contagens, mas interrompem os
+  bigramas: "tutela de urgência" não vira "tutela urgência".
+
+A análise pode ser salva em um .npz, pelo hash do conteúdo do arquivo, e
+reaberta sem ler as páginas.
+"""
+import os
+import re
+from collections import defaultdict
+
+import numpy as np
+
+from timbre import com_timbre
+
+VERSAO_ANALISE = 1
+
+_palavra = re.compile(r"\w+")
+TAMANHO_MINIMO = 3
+
+PALAVRAS_VAZIAS = frozenset("""
+    que com não uma para por mais como mas foi ele das tem seu sua ser quando muito nos está também
+    pelo pela até isso ela entre era depois sem mesmo aos ter seus quem nas esse eles estão tinha foram
+    essa num nem suas meu minha têm numa pelos elas havia seja qual será tenho lhe deles essas esses
+    pelas este fosse dele dela delas esta estes estas aquele aquela aqueles aquelas isto aquilo sobre
+    sob são conforme onde bem ainda apenas após assim cada desde tal toda todo todos todas caso vez
+    pois porque nosso nossa outro outra outros outras qualquer sendo sido seria tais tanto nesse nessa
+    neste nesta deste desta desse dessa quanto razão forma termos parte
+""".split())
+
+
+def tokenizar(texto):
+    """Palavras e números do texto em minúsculas, na ordem em que aparecem"""
+    return _palavra.findall(texto.lower())
+
+
+def termo_valido(palavra):
+    """Indica se a palavra entra nas contagens (letras, tamanho mínimo e fora das palavras vazias)"""
+    return len(palavra) >= TAMANHO_MINIMO and palavra.isalpha() and palavra not in PALAVRAS_VAZIAS
+
+
+def caminho_analise(diretorio, hash_conteudo):
+    """Arquivo .npz da análise de um conteúdo, no diretório dos instantâneos"""
+    return os.path.join(diretorio, hash_conteudo[:2], f"{hash_conteudo}.analise-{VERSAO_ANALISE}.npz")
+
+
+def _principais(valores, limite):
+    """Posições dos maiores valores, em ordem decrescente (desempate pela posição)"""
+    if limite >= len(valores):
+        return np.lexsort((np.arange(len(valores)), -valores))
+    candidatos = np.argpartition(-valores, limite)[:limite]
+    return candidatos[np.lexsort((candidatos, -valores[candidatos]))]
+
+
+class AnaliseTextual:
+    """Contagens de termos e bigramas por página de um processo"""
+
+    def __init__(self, page_ids, vocabulario, indptr, indices, contagens, bigramas, ocorrencias_bigramas, paginas_bigramas):
+        self.page_ids = page_ids
+        # Termo de cada número de termo (array de str do NumPy)
+        self.vocabulario = vocabulario
+        self.indptr = indptr
+        self.indices = indices
+        self.contagens = contagens
+        # Bigrama = termo_a * len(vocabulario) + termo_b, em ordem crescente
+        self.bigramas = bigramas
+        self.ocorrencias_bigramas = ocorrencias_bigramas
+        self.paginas_bigramas = paginas_bigramas
+
+        termos = len(vocabulario)
+        self.ocorrencias = np.bincount(indices, weights=contagens, minlength=termos).astype(np.int64)
+        self.paginas_com_termo = np.bincount(indices, minlength=termos)
+        self._numeros = {termo: numero for numero, termo in enumerate(vocabulario.tolist())}
+
+    @classmethod
+    def construir(cls, paginas):
+        """Tokeniza as páginas (iterável de PageResult) e monta as contagens"""
+        timbre, paginas = com_timbre(paginas)
+        vocabulario = defaultdict()
+        vocabulario.default_factory = vocabulario.__len__
+        numero_termo = vocabulario.__getitem__
+        page_ids = []
+        numeros = []
+        fins = []
+        for pagina in paginas:
+            page_ids.append(pagina.page_id)
+            numeros.extend(map(numero_termo, tokenizar(timbre.remover(pagina.extracted_text))))
+            fins.append(len(numeros))
+
+        total_paginas = len(page_ids)
+        numeros = np.array(numeros, dtype=np.int64)
+        linhas = np.repeat(np.arange(total_paginas, dtype=np.int64), np.diff(np.array([0] + fins, dtype=np.int64)))
+
+        # Só os termos válidos ficam no vocabulário, renumerados em sequência
+        validos = np.fromiter(map(termo_valido, vocabulario), dtype=bool, count=len(vocabulario))
+        termos = np.array([termo for termo in vocabulario if termo_valido(termo)], dtype=str)
+        total_termos = max(len(termos), 1)
+        valido = validos[numeros]
+        numeros = np.cumsum(validos)[numeros] - 1
+
+        # Matriz página × termo: chaves (linha, termo) únicas já saem ordenadas por linha
+        chaves, contagens = np.unique(linhas[valido] * total_termos + numeros[valido], return_counts=True)
+        indices = chaves % total_termos
+        indptr = np.searchsorted(chaves // total_termos, np.arange(total_paginas + 1))
+
+        # Bigramas: palavras vizinhas, ambas válidas e na mesma página
+        par = valido[:-1] & valido[1:] & (linhas[:-1] == linhas[1:])
+        bigramas = numeros[:-1][par] * total_termos + numeros[1:][par]
+        # return_counts força o caminho por ordenação, bem mais rápido aqui que o por hash
+        por_pagina = np.unique(linhas[:-1][par] * total_termos ** 2 + bigramas, return_counts=True)[0]
+        bigramas, ocorrencias_bigramas = np.unique(bigramas, return_counts=True)
+        paginas_bigramas = np.unique(por_pagina % total_termos ** 2, return_counts=True)[1]
+
+        return cls(
+            np.array(page_ids, dtype=np.int64), termos, indptr.astype(np.int64), indices.astype(np.int32),
+            contagens.astype(np.int32), bigramas, ocorrencias_bigramas.astype(np.int64), paginas_bigramas.astype(np.int64),
+        )
+
+    def __len__(self):
+        return len(self.page_ids)
+
+    @property
+    def total_palavras(self):
+        return int(self.contagens.sum())
+
+    @property
+    def nbytes(self):
+        """Memória dos arrays da análise"""
+        return sum(array.nbytes for array in (
+            self.page_ids, self.vocabulario, self.indptr, self.indices, self.contagens, self.bigramas,
+            self.ocorrencias_bigramas, self.paginas_bigramas, self.ocorrencias, self.paginas_com_termo,
+        ))
+
+    def numero(self, termo):
+        """Número do termo no vocabulário, ou None se ele não aparece no processo"""
+        return self._numeros.get(termo.strip().lower())
+
+    def principais_termos(self, limite=20):
+        """[(termo, ocorrências, páginas)] dos termos mais frequentes"""
+        melhores = _principais(self.ocorrencias, limite)
+        return list(zip(self.vocabulario[melhores].tolist(), self.ocorrencias[melhores].tolist(),
+                        self.paginas_com_termo[melhores].tolist()))
+
+    def principais_bigramas(self, limite=20):
+        """[(bigrama, ocorrências, páginas)] dos bigramas mais frequentes"""
+        melhores = _principais(self.ocorrencias_bigramas, limite)
+        total_termos = max(len(self.vocabulario), 1)
+        primeiros = self.vocabulario[self.bigramas[melhores] // total_termos]
+        segundos = self.vocabulario[self.bigramas[melhores] % total_termos]
+        return [(f"{a} {b}", int(o), int(p)) for a, b, o, p in zip(
+            primeiros.tolist(), segundos.tolist(), self.ocorrencias_bigramas[melhores], self.paginas_bigramas[melhores])]
+
+    def distribuicao(self, termo):
+        """Ocorrências do termo em cada página (array alinhado a page_ids), ou None se ele não aparece"""
+        numero = self.numero(termo)
+        if numero is None:
+            return None
+        posicoes = np.flatnonzero(self.indices == numero)
+        linhas = np.searchsorted(self.indptr, posicoes, side="right") - 1
+        return np.bincount(linhas, weights=self.contagens[posicoes], minlength=len(self)).astype(np.int64)
+
+    def termos_da_pagina(self, indice, limite=10):
+        """[(termo, ocorrências)] mais frequentes de uma página (posição em page_ids)"""
+        inicio, fim = self.indptr[indice], self.indptr[indice + 1]
+        contagens = self.contagens[inicio:fim]
+        melhores = _principais(contagens, limite)
+        return list(zip(self.vocabulario[self.indices[inicio:fim][melhores]].tolist(), contagens[melhores].tolist()))
+
+    def salvar(self, destino):
+        os.makedirs(os.path.dirname(destino), exist_ok=True)
+        temporario = f"{destino}.{os.getpid()}.tmp.npz"
+        np.savez(
+            temporario, page_ids=self.page_ids, vocabulario=self.vocabulario, indptr=self.indptr, indices=self.indices,
+            contagens=self.contagens, bigramas=self.bigramas, ocorrencias_bigramas=self.ocorrencias_bigramas,
+            paginas_bigramas=self.paginas_bigramas,
+        )
+        os.replace(temporario, destino)
+
+    @classmethod
+    def abrir(cls, origem):
+        """Lê uma análise salva; devolve None se ela não existir ou estiver corrompida"""
+        try:
+            with np.load(origem, allow_pickle=False) as dados:
+                return cls(*(dados[nome] for nome in (
+                    "page_ids", "vocabulario", "indptr", "indices", "contagens", "bigramas",
+                    "ocorrencias_bigramas", "paginas_bigramas",
+                )))
+        except (OSError, ValueError, KeyError):
+            return None
+
+
+def analise_do_processo(paginas, hash_conteudo=None, diretorio=None):
+    """Abre a análise salva para o hash do conteúdo ou a constrói (e salva)
+
+    paginas é chamado só quando é preciso construir a análise e devolve um
+    iterável de PageResult.
+    """
+    destino = caminho_analise(diretorio, hash_conteudo) if diretorio and hash_conteudo else None
+    analise = AnaliseTextual.abrir(destino) if destino else None
+    if analise is None:
+        analise = AnaliseTextual.construir(paginas())
+        if destino:
+            try:
+                analise.salvar(destino)
+            except OSError:
+                pass
+    return analise
+
+
+def remover_analise(diretorio, hash_conteudo):
+    """Apaga a análise salva de um conteúdo que deixou de existir no acervo"""
+    try:
+        os.remove(caminho_analise(diretorio, hash_conteudo))
+    except OSError:
+        pass
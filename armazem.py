@@ -0,0 +1,151 @@
+"""Armazém compartilhado e somente leitura de processos validados"""
+import os
+import threading
+from collections import OrderedDict
+from typing import NamedTuple
+
+from armazem_binario import PaginasMapeadas, binario_atualizado, caminho_binario
+from compressao import PaginasEmBlocos, compactado, em_blocos
+from corpus import carregar_processo
+from modelos import ProcessoJudicial
+from paginas import PaginasSobDemanda, TAMANHO_MEDIO_CABECALHO
+from tabela_paginas import TabelaPaginas
+
+# Limite padrão do armazém, em megabytes de arquivo de origem
+LIMITE_PADRAO_MB = 512
+
+# Arquivos acima deste tamanho são abertos no modo sob demanda
+LIMIAR_SOB_DEMANDA_MB = 50
+
+
+def assinatura_arquivo(caminho):
+    """Identifica a versão de um arquivo pelo mtime e pelo tamanho"""
+    info = os.stat(caminho)
+    return info.st_mtime_ns, info.st_size
+
+
+class ArmazemProcessos:
+    """LRU de processos validados, limitado pelo total de bytes dos arquivos de origem
+
+    Uma única instância é compartilhada por todas as sessões (via
+    st.cache_resource), então cada processo existe uma vez só em memória.
+    O tamanho do arquivo JSON é usado como custo aproximado de cada entrada.
+    """
+
+    def __init__(self, limite_bytes=LIMITE_PADRAO_MB * 1024 * 1024, carregar=carregar_processo, medir=None):
+        self.limite_bytes = limite_bytes
+        self._carregar = carregar
+        # Custo de uma entrada; por padrão, o tamanho do arquivo de origem
+        self._medir = medir
+        self._itens = OrderedDict()  # caminho -> (assinatura, processo, custo)
+        self._bytes = 0
+        self._trava = threading.Lock()
+        # Uma trava por caminho evita que várias sessões validem o mesmo arquivo ao mesmo tempo
+        self._travas_carga = {}
+
+    @property
+    def bytes_em_uso(self):
+        return self._bytes
+
+    def __len__(self):
+        return len(self._itens)
+
+    def __contains__(self, caminho):
+        return caminho in self._itens
+
+    def obter(self, caminho):
+        """Devolve o processo do arquivo, recarregando-o se o arquivo mudou"""
+        assinatura = assinatura_arquivo(caminho)
+        processo = self._buscar(caminho, assinatura)
+        if processo is not None:
+            return processo
+
+        with self._trava:
+            trava_carga = self._travas_carga.setdefault(caminho, threading.Lock())
+        with trava_carga:
+            # Outra sessão pode ter carregado o arquivo enquanto esperávamos
+            processo = self._buscar(caminho, assinatura)
+            if processo is None:
+                processo = self._carregar(caminho)
+                custo = self._medir(processo) if self._medir else assinatura[1]
+                self._inserir(caminho, assinatura, processo, custo)
+        return processo
+
+    def _buscar(self, caminho, assinatura):
+        with self._trava:
+            item = self._itens.get(caminho)
+            if item is None:
+                return None
+            if item[0] != assinatura:
+                self._remover(caminho)
+                return None
+            self._itens.move_to_end(caminho)
+            return item[1]
+
+    def _inserir(self, caminho, assinatura, processo, custo):
+        with self._trava:
+            if caminho in self._itens:
+                self._remover(caminho)
+            self._itens[caminho] = (assinatura, processo, custo)
+            self._bytes += custo
+            # Remove os menos usados até caber no limite (mantém ao menos a entrada nova)
+            while self._bytes > self.limite_bytes and len(self._itens) > 1:
+                self._remover(next(iter(self._itens)))
+
+    def _remover(self, caminho):
+        _, _, custo = self._itens.pop(caminho)
+        self._bytes -= custo
+
+    def renovar(self, caminho, anterior, nova):
+        """Troca a assinatura de um processo cujo arquivo mudou de mtime sem mudar de conteúdo"""
+        with self._trava:
+            item = self._itens.get(caminho)
+            if item is not None and item[0] == anterior:
+                self._itens[caminho] = (nova, *item[1:])
+
+    def invalidar(self, caminho=None):
+        """Descarta um processo (ou todos, se nenhum caminho for informado)"""
+        with self._trava:
+            if caminho is None:
+                self._itens.clear()
+                self._bytes = 0
+            elif caminho in self._itens:
+                self._remover(caminho)
+
+
+class Documento(NamedTuple):
+    """Processo aberto, com a fonte de páginas usada pelo navegador"""
+    processo: ProcessoJudicial
+    paginas: object
+    custo: int
+
+
+def abrir_documento(caminho, limiar_sob_demanda=LIMIAR_SOB_DEMANDA_MB * 1024 * 1024, diretorio_instantaneos=None):
+    """Abre um processo no modo mais barato disponível
+
+    - .provai atualizado ao lado do JSON: páginas lidas via mmap, custo quase nulo
+      (a memória fica no cache de páginas do sistema operacional);
+    - .jsonz (compactado em blocos): cada página descompactada ao ser aberta;
+    - JSON acima do limiar: páginas lidas sob demanda do próprio JSON
+      (.json.gz e .json.xz não permitem saltar até uma página e são lidos por inteiro);
+    - demais casos: processo validado por completo (ou lido do instantâneo em
+      diretorio_instantaneos, se o conteúdo já foi validado), com as páginas
+      guardadas na tabela compacta de tabela_paginas.
+    """
+    if binario_atualizado(caminho):
+        paginas = PaginasMapeadas(caminho_binario(caminho))
+        return Documento(paginas.processo, paginas, len(paginas) * TAMANHO_MEDIO_CABECALHO)
+    if em_blocos(caminho):
+        paginas = PaginasEmBlocos(caminho)
+        return Documento(paginas.processo, paginas, paginas.bytes_residentes)
+    tamanho = os.path.getsize(caminho)
+    if tamanho > limiar_sob_demanda and not compactado(caminho):
+        paginas = PaginasSobDemanda(caminho)
+        return Documento(paginas.processo, paginas, paginas.bytes_residentes)
+    processo = carregar_processo(caminho, diretorio_instantaneos)
+    # As páginas validadas passam para a tabela compacta; os PageResult originais são descartados
+    paginas = TabelaPaginas(processo.results)
+    processo = ProcessoJudicial.model_construct(
+        file=processo.file, metadata=processo.metadata, summary=processo.summary, results=paginas,
+    )
+    return Documento(processo, paginas, paginas.bytes_residentes)
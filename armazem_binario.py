@@ -0,0 +1,221 @@
+"""Formato binário de páginas, lido via mmap, convertido do *_resultado.json
+
+Layout do arquivo .provai:
+
+    cabeçalho fixo | textos UTF-8 concatenados | registros das páginas | JSON de topo
+
+Cada registro tem tamanho fixo: page_id, indicadores (has_images e
+presença de extracted_image_text) e (posição, tamanho) de file_name,
+extracted_text, extracted_image_text e summary dentro da área de textos.
+O JSON de topo guarda file, metadata e summary do processo.
+"""
+import argparse
+import json
+import mmap
+import os
+import struct
+from collections.abc import Sequence
+
+from compressao import raiz
+from leitura_incremental import percorrer_resultado
+from modelos import FileInfo, Metadata, PageResult, ProcessoJudicial, Summary
+
+EXTENSAO = ".provai"
+ASSINATURA = b"PROVAI01"
+
+# assinatura, número de páginas, posição dos registros, posição e tamanho do JSON de topo
+_CABECALHO = struct.Struct("<8sIQQQ")
+# page_id, indicadores, 3 bytes de alinhamento, 4 x (posição, tamanho)
+_REGISTRO = struct.Struct("<IB3x" + "QI" * 4)
+
+_COM_IMAGENS = 1
+_COM_TEXTO_IMAGEM = 2
+
+_CAMPOS_TEXTO = ("file_name", "extracted_text", "extracted_image_text", "summary")
+
+# Leitura antecipada da próxima página no sentido da navegação (Linux e macOS)
+_MADVISE = hasattr(mmap, "MADV_WILLNEED")
+
+
+def caminho_binario(caminho_json):
+    """Caminho do arquivo .provai correspondente a um *_resultado.json"""
+    return raiz(caminho_json) + EXTENSAO
+
+
+def binario_atualizado(caminho_json):
+    """Indica se existe um .provai mais novo que o JSON de origem"""
+    destino = caminho_binario(caminho_json)
+    try:
+        return os.stat(destino).st_mtime_ns >= os.stat(caminho_json).st_mtime_ns
+    except OSError:
+        return False
+
+
+def _gravar(destino, paginas, obter_topo):
+    """Grava o arquivo binário a partir de um iterável de PageResult
+
+    obter_topo() é chamado depois das páginas e devolve o dicionário com
+    file, metadata e summary do processo.
+    """
+    temporario = destino + ".tmp"
+    registros = []
+
+    with open(temporario, "wb") as f:
+        f.write(b"\0" * _CABECALHO.size)
+        for pagina in paginas:
+            indicadores = (_COM_IMAGENS if pagina.has_images else 0) | (
+                _COM_TEXTO_IMAGEM if pagina.extracted_image_text is not None else 0
+            )
+            trechos = []
+            for campo in _CAMPOS_TEXTO:
+                dados = (getattr(pagina, campo) or "").encode("utf-8")
+                trechos += [f.tell(), len(dados)]
+                f.write(dados)
+            registros.append(_REGISTRO.pack(pagina.page_id, indicadores, *trechos))
+
+        posicao_registros = f.tell()
+        f.write(b"".join(registros))
+
+        dados_topo = json.dumps(obter_topo(), ensure_ascii=False).encode("utf-8")
+        posicao_topo = f.tell()
+        f.write(dados_topo)
+
+        f.seek(0)
+        f.write(_CABECALHO.pack(ASSINATURA, len(registros), posicao_registros, posicao_topo, len(dados_topo)))
+
+    os.replace(temporario, destino)
+    return destino
+
+
+def converter(caminho_json, destino=None):
+    """Converte um *_resultado.json para o formato binário, página a página"""
+    topo = {}
+
+    def paginas():
+        for chave, valor, _, _ in percorrer_resultado(caminho_json):
+            if chave != "results":
+                topo[chave] = valor
+                continue
+            yield PageResult.model_validate(valor)
+
+    def obter_topo():
+        # Valida o topo antes de gravar, para não produzir um arquivo inutilizável
+        ProcessoJudicial.model_validate({**topo, "results": []})
+        return topo
+
+    return _gravar(destino or caminho_binario(caminho_json), paginas(), obter_topo)
+
+
+def gravar_processo(processo, destino):
+    """Grava no formato binário um processo já validado (sem reler o JSON)"""
+    return _gravar(destino, processo.results, lambda: processo.model_dump(mode="json", exclude={"results"}))
+
+
+class PaginasMapeadas(Sequence):
+    """Páginas de um arquivo .provai mapeado em memória
+
+    Funciona como a lista processo.results (índice e iteração) e como a
+    fonte de páginas do navegador (obter por page_id). Os textos são
+    fatiados do mmap sob demanda; processos diferentes que abrem o mesmo
+    arquivo compartilham as páginas pelo cache do sistema operacional.
+    """
+
+    indexacao_concluida = True
+    progresso = 1.0
+    erro_indexacao = None
+
+    def __init__(self, caminho):
+        self.caminho = caminho
+        with open(caminho, "rb") as f:
+            self._mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._dados = memoryview(self._mapa)
+
+        assinatura, total, self._posicao_registros, posicao_topo, tamanho_topo = _CABECALHO.unpack_from(self._dados, 0)
+        if assinatura != ASSINATURA:
+            raise ValueError(f"{caminho} não é um arquivo {EXTENSAO} válido")
+        self._total = total
+        self._topo = json.loads(bytes(self._dados[posicao_topo:posicao_topo + tamanho_topo]))
+
+        # page_id -> posição do registro; só inteiros ficam residentes
+        self._posicoes = {
+            _REGISTRO.unpack_from(self._dados, self._posicao_registros + i * _REGISTRO.size)[0]: i
+            for i in range(total)
+        }
+
+        # ProcessoJudicial cujas páginas são lidas deste arquivo
+        self.processo = ProcessoJudicial.model_construct(
+            file=FileInfo.model_validate(self._topo["file"]),
+            metadata=Metadata.model_validate(self._topo["metadata"]),
+            summary=Summary.model_validate(self._topo["summary"]),
+            results=self,
+        )
+
+    def __len__(self):
+        return self._total
+
+    def _registro(self, indice):
+        return _REGISTRO.unpack_from(self._dados, self._posicao_registros + indice * _REGISTRO.size)
+
+    def trecho(self, indice, campo):
+        """Bytes UTF-8 de um campo de texto da página, sem cópia (memoryview)"""
+        registro = self._registro(indice)
+        posicao = 2 + 2 * _CAMPOS_TEXTO.index(campo)
+        inicio, tamanho = registro[posicao], registro[posicao + 1]
+        return self._dados[inicio:inicio + tamanho]
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return [self[i] for i in range(*indice.indices(self._total))]
+        if indice < 0:
+            indice += self._total
+        if not 0 <= indice < self._total:
+            raise IndexError(indice)
+
+        page_id, indicadores, *trechos = self._registro(indice)
+        textos = [
+            str(self._dados[trechos[i]:trechos[i] + trechos[i + 1]], "utf-8")
+            for i in range(0, len(trechos), 2)
+        ]
+        # Dados já validados na conversão: dispensa nova validação
+        return PageResult.model_construct(
+            page_id=page_id,
+            file_name=textos[0],
+            has_images=bool(indicadores & _COM_IMAGENS),
+            extracted_text=textos[1],
+            extracted_image_text=textos[2] if indicadores & _COM_TEXTO_IMAGEM else None,
+            summary=textos[3],
+        )
+
+    def _antecipar(self, indice):
+        """Pede ao sistema operacional que traga para a memória os textos da página"""
+        if not 0 <= indice < self._total:
+            return
+        _, _, inicio, *_, posicao_resumo, tamanho_resumo = self._registro(indice)
+        # Os textos de uma página ficam contíguos no arquivo; madvise exige início alinhado
+        alinhado = inicio - inicio % mmap.PAGESIZE
+        self._mapa.madvise(mmap.MADV_WILLNEED, alinhado, posicao_resumo + tamanho_resumo - alinhado)
+
+    def obter(self, page_id, direcao=1):
+        indice = self._posicoes.get(page_id)
+        if indice is None:
+            return None
+        if _MADVISE:
+            self._antecipar(indice + direcao)
+        return self[indice]
+
+    def fechar(self):
+        self._dados.release()
+        self._mapa.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Converte arquivos *_resultado.json para o formato binário .provai")
+    parser.add_argument("arquivos", nargs="+", help="arquivos *_resultado.json")
+    args = parser.parse_args()
+    for caminho in args.arquivos:
+        destino = converter(caminho)
+        print(f"{caminho} -> {destino} ({os.path.getsize(destino) / 1e6:.1f} MB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Benchmark da análise textual (analise_textual.py): construção, reabertura e consultas
+
+Para processos sintéticos de cada tamanho em --paginas, mede a construção
+da matriz página × termo e dos bigramas a partir das páginas validadas, o
+tamanho em memória e do .npz salvo, a reabertura do .npz (o caminho dos
+acessos seguintes, pelo hash do conteúdo) e as consultas da seção "Análise
+Textual": principais termos e bigramas e a distribuição de um termo.
+
+Uso: python -m benchmarks.bench_analise_textual [--paginas 100 1000 5000]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from analise_textual import AnaliseTextual
+from benchmarks.gerador import gerar_processo
+from modelos import ProcessoJudicial
+
+
+def cronometrar(funcao, repeticoes=1):
+    """(resultado, milissegundos por execução)"""
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        resultado = funcao()
+    return resultado, (time.perf_counter() - inicio) * 1000 / repeticoes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--paginas", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--palavras", type=int, default=350, help="média de palavras por página")
+    args = parser.parse_args()
+
+    print(f"{'páginas':>8} {'construção ms':>14} {'memória MB':>11} {'npz MB':>7} {'reabertura ms':>14} "
+          f"{'termos ms':>10} {'bigramas ms':>12} {'distribuição ms':>16}")
+    with tempfile.TemporaryDirectory() as pasta:
+        for paginas in args.paginas:
+            processo = ProcessoJudicial.model_validate(gerar_processo(paginas=paginas, palavras=args.palavras))
+            analise, construcao = cronometrar(lambda: AnaliseTextual.construir(processo.results))
+            destino = os.path.join(pasta, f"{paginas}.npz")
+            analise.salvar(destino)
+            reaberta, reabertura = cronometrar(lambda: AnaliseTextual.abrir(destino), 5)
+            termo = reaberta.principais_termos(1)[0][0]
+            _, termos = cronometrar(lambda: reaberta.principais_termos(20), 20)
+            _, bigramas = cronometrar(lambda: reaberta.principais_bigramas(20), 20)
+            _, distribuicao = cronometrar(lambda: reaberta.distribuicao(termo), 20)
+            print(f"{paginas:>8} {construcao:>14.0f} {analise.nbytes / 1e6:>11.2f} {os.path.getsize(destino) / 1e6:>7.2f} "
+                  f"{reabertura:>14.1f} {termos:>10.2f} {bigramas:>12.2f} {distribuicao:>16.2f}")
+
+
+if __name__ == "__main__":
+    main()
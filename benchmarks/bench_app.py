@@ -0,0 +1,171 @@
+"""Benchmark do visualizador: carga, validação e renderização de cada seção
+
+Gera processos sintéticos (benchmarks.gerador), mede a leitura do JSON, a
+validação com ProcessoJudicial e a renderização de cada seção da barra
+lateral com o AppTest do Streamlit. Para cada etapa registra o tempo
+(mediana das repetições) e o pico de memória alocada (tracemalloc, em uma
+passada separada para não distorcer os tempos).
+
+Os resultados são comparados com um arquivo de referência; a execução
+termina com código 1 se alguma etapa piorar além da tolerância. Sem
+referência, a execução atual é gravada como referência.
+
+Uso: python -m benchmarks.bench_app [--paginas 100 1000] [--repeticoes 3]
+                                    [--referencia benchmarks/referencia_app.json]
+                                    [--tolerancia 0.5] [--atualizar]
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.gerador import gravar_processo
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REFERENCIA_PADRAO = os.path.join(RAIZ, "benchmarks", "referencia_app.json")
+CONSULTA = "contrato de locação"
+
+# Diferenças abaixo destes valores não contam como regressão (ruído de medição)
+FOLGA_MS = 5.0
+FOLGA_MB = 2.0
+
+
+def cronometrar(funcao, repeticoes):
+    """Mediana do tempo de execução, em milissegundos"""
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append(time.perf_counter() - inicio)
+    tempos.sort()
+    return tempos[len(tempos) // 2] * 1000
+
+
+def pico_memoria(funcao):
+    """Pico de memória alocada durante a chamada, em MB"""
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        funcao()
+        return (tracemalloc.get_traced_memory()[1] - base) / 1e6
+    finally:
+        tracemalloc.stop()
+
+
+def etapas_do_app():
+    """Gera (nome, função) para cada interação medida no AppTest"""
+    from streamlit.testing.v1 import AppTest
+
+    from comum import SECOES
+
+    at = AppTest.from_file(os.path.join(RAIZ, "app.py"), default_timeout=600)
+    yield "Abertura", at.run
+    for secao in SECOES:
+        def renderizar(secao=secao):
+            at.switch_page(secao.arquivo)
+            at.run()
+        renderizar()
+        if at.exception:
+            raise RuntimeError(f"{secao.titulo}: {at.exception[0].message}")
+        yield secao.titulo, renderizar
+        if at.text_input:
+            def consultar():
+                at.text_input[0].input(CONSULTA)
+                at.run()
+            consultar()
+            yield f"{secao.titulo} (consulta)", consultar
+            at.text_input[0].input("")
+            at.run()
+
+
+def medir_app(repeticoes):
+    """Tempo e pico de memória de cada etapa do app, já com os caches aquecidos"""
+    medidas = {}
+    for nome, funcao in etapas_do_app():
+        medidas[nome] = {"ms": cronometrar(funcao, repeticoes)}
+    # Segunda passada só para a memória, com caches já aquecidos como na primeira
+    for nome, funcao in etapas_do_app():
+        medidas[nome]["pico_mb"] = pico_memoria(funcao)
+    return medidas
+
+
+def medir_tamanho(paginas, repeticoes, pasta):
+    from modelos import ProcessoJudicial
+
+    # Um diretório por tamanho: o catálogo do app é cacheado por diretório
+    pasta = os.path.join(pasta, str(paginas))
+    os.makedirs(pasta)
+    caminho = os.path.join(pasta, f"sintetico_{paginas}_resultado.json")
+    gravar_processo(caminho, paginas=paginas)
+    with open(caminho, "rb") as f:
+        dados = f.read()
+
+    medidas = {
+        "Leitura do JSON": {
+            "ms": cronometrar(lambda: json.loads(dados), repeticoes),
+            "pico_mb": pico_memoria(lambda: json.loads(dados)),
+        },
+        "Validação": {
+            "ms": cronometrar(lambda: ProcessoJudicial.model_validate_json(dados), repeticoes),
+            "pico_mb": pico_memoria(lambda: ProcessoJudicial.model_validate_json(dados)),
+        },
+    }
+    os.environ["PROVAI_DIRETORIO"] = pasta
+    medidas.update(medir_app(repeticoes))
+    return medidas
+
+
+def comparar(atual, referencia, tolerancia):
+    """Lista de regressões: (etapa, métrica, referência, atual)"""
+    regressoes = []
+    for etapa, medidas in atual.items():
+        anterior = referencia.get(etapa)
+        if not anterior:
+            continue
+        for metrica, folga in (("ms", FOLGA_MS), ("pico_mb", FOLGA_MB)):
+            if metrica in anterior and medidas[metrica] > anterior[metrica] * (1 + tolerancia) + folga:
+                regressoes.append((etapa, metrica, anterior[metrica], medidas[metrica]))
+    return regressoes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--paginas", type=int, nargs="+", default=[100, 1000])
+    parser.add_argument("--repeticoes", type=int, default=3)
+    parser.add_argument("--referencia", default=REFERENCIA_PADRAO)
+    parser.add_argument("--tolerancia", type=float, default=0.5, help="piora relativa aceita (0.5 = 50%%)")
+    parser.add_argument("--atualizar", action="store_true", help="grava a execução atual como referência")
+    args = parser.parse_args()
+
+    # Mede a validação de verdade, sem os instantâneos de processos já validados
+    os.environ["PROVAI_INSTANTANEOS"] = ""
+
+    atual = {}
+    with tempfile.TemporaryDirectory() as pasta:
+        for paginas in args.paginas:
+            for etapa, medidas in medir_tamanho(paginas, args.repeticoes, pasta).items():
+                atual[f"{paginas} páginas / {etapa}"] = medidas
+                print(f"{paginas:>6} páginas  {etapa:<40} {medidas['ms']:9.1f} ms {medidas['pico_mb']:9.1f} MB", flush=True)
+
+    if args.atualizar or not os.path.exists(args.referencia):
+        with open(args.referencia, "w", encoding="utf-8") as f:
+            json.dump(atual, f, ensure_ascii=False, indent=2)
+        print(f"Referência gravada em {args.referencia}")
+        return
+
+    with open(args.referencia, "r", encoding="utf-8") as f:
+        referencia = json.load(f)
+    regressoes = comparar(atual, referencia, args.tolerancia)
+    for etapa, metrica, anterior, novo in regressoes:
+        print(f"REGRESSÃO {etapa} [{metrica}]: {anterior:.1f} -> {novo:.1f}")
+    if regressoes:
+        sys.exit(1)
+    print(f"Sem regressões acima de {args.tolerancia:.0%} em relação a {args.referencia}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Benchmark: st.cache_data (cópia por rerun) x armazém compartilhado
+
+Simula 50 sessões concorrentes (uma thread cada) fazendo reruns sobre um processo grande e
+mede a latência de obtenção do processo por rerun e o pico de RSS.
+
+Uso: python -m benchmarks.bench_armazem [--paginas 1000] [--sessoes 50]
+"""
+import argparse
+import json
+import os
+import pickle
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+ARQUIVO_EXEMPLO = "1016234-60.2025.8.26.0100_resultado.json"
+
+
+def gerar_arquivo(destino, paginas):
+    """Replica as páginas do arquivo de exemplo até o total pedido"""
+    with open(ARQUIVO_EXEMPLO, "r", encoding="utf-8") as f:
+        dados = json.load(f)
+    base = dados["results"]
+    dados["results"] = [
+        dict(base[i % len(base)], page_id=i + 1) for i in range(paginas)
+    ]
+    dados["file"]["total_pages"] = paginas
+    with open(destino, "w", encoding="utf-8") as f:
+        json.dump(dados, f, ensure_ascii=False)
+
+
+def executar_modo(modo, caminho, sessoes, reruns):
+    """Roda um modo isolado no processo atual e imprime o resultado em JSON
+
+    Como no Streamlit, cada sessão roda em uma thread: a cada rodada, as
+    sessões pedem o processo ao mesmo tempo, disputando o GIL e as travas do
+    armazém.
+    """
+    from armazem import ArmazemProcessos
+    from corpus import carregar_processo
+
+    if modo == "cache_data":
+        # st.cache_data guarda o pickle e devolve uma cópia nova a cada chamada
+        armazenado = pickle.dumps(carregar_processo(caminho))
+
+        def obter():
+            return pickle.loads(armazenado)
+    else:
+        armazem = ArmazemProcessos()
+        armazem.obter(caminho)
+
+        def obter():
+            return armazem.obter(caminho)
+
+    vivos = [None] * sessoes
+
+    def rerun(sessao):
+        inicio = time.perf_counter()
+        vivos[sessao] = obter()
+        return time.perf_counter() - inicio
+
+    tempos = []
+    with ThreadPoolExecutor(max_workers=sessoes) as threads:
+        for _ in range(reruns):
+            tempos.extend(threads.map(rerun, range(sessoes)))
+
+    tempos.sort()
+    print(json.dumps({
+        "modo": modo,
+        "rerun_ms_mediana": tempos[len(tempos) // 2] * 1000,
+        "rerun_ms_p95": tempos[int(len(tempos) * 0.95)] * 1000,
+        "rss_pico_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--paginas", type=int, default=1000)
+    parser.add_argument("--sessoes", type=int, default=50)
+    parser.add_argument("--reruns", type=int, default=5)
+    parser.add_argument("--modo", help=argparse.SUPPRESS)
+    parser.add_argument("--arquivo", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.modo:
+        executar_modo(args.modo, args.arquivo, args.sessoes, args.reruns)
+        return
+
+    with tempfile.TemporaryDirectory() as pasta:
+        caminho = os.path.join(pasta, "sintetico_resultado.json")
+        gerar_arquivo(caminho, args.paginas)
+        print(f"{args.paginas} páginas ({os.path.getsize(caminho) / 1e6:.1f} MB), "
+              f"{args.sessoes} sessões x {args.reruns} reruns")
+        for modo in ("cache_data", "armazem"):
+            # Cada modo em um processo separado para que o RSS não se misture
+            saida = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_armazem", "--modo", modo,
+                 "--arquivo", caminho, "--sessoes", str(args.sessoes), "--reruns", str(args.reruns)],
+                capture_output=True, text=True, check=True,
+            ).stdout
+            r = json.loads(saida)
+            print(f"{r['modo']:>10}: rerun mediana {r['rerun_ms_mediana']:8.3f} ms, "
+                  f"p95 {r['rerun_ms_p95']:8.3f} ms, RSS pico {r['rss_pico_mb']:7.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
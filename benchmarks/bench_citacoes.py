@@ -0,0 +1,61 @@
+"""Benchmark das citações legais (citacoes.py e a tabela citacoes do acervo)
+
+Mede a extração e normalização das citações nas páginas de um processo
+sintético de --paginas páginas e, em um acervo sintético de --processos
+processos, a ingestão com a tabela de citações e a consulta "processos
+que citam" por uma lei e por um artigo, comparada à busca da lei no texto
+das páginas (FTS5), que devolve páginas e não reconhece as outras formas
+de escrever a mesma citação.
+
+Uso: python -m benchmarks.bench_citacoes [--paginas 5000] [--processos 40] [--paginas-acervo 250]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.gerador import gerar_processo, gravar_processo
+from busca_acervo import ARQUIVO_BANCO, AcervoBusca
+from citacoes import CitacoesProcesso
+from modelos import ProcessoJudicial
+
+
+def cronometrar(funcao, repeticoes=1):
+    """(resultado, milissegundos por execução)"""
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        resultado = funcao()
+    return resultado, (time.perf_counter() - inicio) * 1000 / repeticoes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--paginas", type=int, default=5000, help="páginas do processo da extração")
+    parser.add_argument("--processos", type=int, default=40, help="processos do acervo sintético")
+    parser.add_argument("--paginas-acervo", type=int, default=250, help="páginas de cada processo do acervo")
+    args = parser.parse_args()
+
+    processo = ProcessoJudicial.model_validate(gerar_processo(paginas=args.paginas))
+    citacoes, extracao = cronometrar(lambda: CitacoesProcesso.construir(processo.results))
+    ocorrencias = sum(total for _, _, total, _ in citacoes.contagens())
+    print(f"Extração ({args.paginas} páginas): {extracao:.0f} ms, {ocorrencias} citações, {len(citacoes)} distintas\n")
+
+    with tempfile.TemporaryDirectory() as pasta:
+        for i in range(args.processos):
+            gravar_processo(os.path.join(pasta, f"{i:05d}_resultado.json"), paginas=args.paginas_acervo, semente=i)
+        acervo = AcervoBusca(os.path.join(pasta, ARQUIVO_BANCO))
+        inicio = time.perf_counter()
+        for nome in sorted(os.listdir(pasta)):
+            if nome.endswith("_resultado.json"):
+                acervo.ingerir(os.path.join(pasta, nome))
+        print(f"Ingestão de {args.processos} processos × {args.paginas_acervo} páginas: {time.perf_counter() - inicio:.1f} s\n")
+
+        print(f"{'consulta':<22} {'processos':>10} {'citando ms':>11} {'páginas FTS':>12} {'FTS ms':>8}")
+        for consulta in ("lei 8245", "art. 300 do CPC", "Súmula 297 STJ"):
+            citantes, citando = cronometrar(lambda: acervo.processos_citando(consulta), 20)
+            paginas, fts = cronometrar(lambda: acervo.buscar(consulta, limite=1_000_000), 5)
+            print(f"{consulta:<22} {len(citantes):>10} {citando:>11.2f} {len(paginas):>12} {fts:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
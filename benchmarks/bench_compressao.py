@@ -0,0 +1,75 @@
+"""Benchmark dos formatos compactados: espaço em disco, carga e acesso a uma página
+
+Gera um processo sintético de --paginas páginas, grava-o em cada formato
+(JSON, .json.gz, .json.xz e .jsonz em blocos) e mede:
+
+- disco: tamanho do arquivo e proporção em relação ao JSON;
+- carga: leitura e validação completa do processo (corpus.carregar_processo);
+- abertura: preparação do acesso por página (índice de páginas do JSON sob
+  demanda ou índice de blocos do .jsonz); .json.gz e .json.xz não têm acesso
+  por página e precisam da carga completa;
+- página: mediana do acesso a uma página aleatória depois da abertura.
+
+Uso: python -m benchmarks.bench_compressao [--paginas 1000] [--acessos 50]
+"""
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from benchmarks.gerador import gravar_processo
+from compressao import PaginasEmBlocos
+from corpus import carregar_processo
+from main import compactar_arquivo
+from paginas import PaginasSobDemanda
+
+
+def cronometrar(funcao):
+    """(resultado, milissegundos)"""
+    inicio = time.perf_counter()
+    resultado = funcao()
+    return resultado, (time.perf_counter() - inicio) * 1000
+
+
+def acesso_pagina(paginas, page_ids):
+    """Mediana, em ms, de obter() para cada page_id"""
+    return statistics.median(cronometrar(lambda: paginas.obter(page_id))[1] for page_id in page_ids)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--paginas", type=int, default=1000)
+    parser.add_argument("--acessos", type=int, default=50, help="páginas aleatórias acessadas")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as pasta:
+        original = os.path.join(pasta, "sintetico_resultado.json")
+        gravar_processo(original, paginas=args.paginas)
+        page_ids = random.Random(0).sample(range(1, args.paginas + 1), min(args.acessos, args.paginas))
+        tamanho_json = os.path.getsize(original)
+
+        print(f"{'formato':<8} {'MB':>7} {'disco':>6} {'carga ms':>9} {'abertura ms':>12} {'página ms':>10}")
+        for formato in ("json", "gz", "xz", "blocos"):
+            caminho = original if formato == "json" else compactar_arquivo(original, formato)
+            tamanho = os.path.getsize(caminho)
+            _, carga = cronometrar(lambda: carregar_processo(caminho))
+
+            if formato == "json":
+                # Capacidade 1: cada acesso lê a página do arquivo
+                paginas, abertura = cronometrar(lambda: PaginasSobDemanda(caminho, capacidade=1, em_segundo_plano=False))
+                pagina = acesso_pagina(paginas, page_ids)
+            elif formato == "blocos":
+                paginas, abertura = cronometrar(lambda: PaginasEmBlocos(caminho))
+                pagina = acesso_pagina(paginas, page_ids)
+                paginas.fechar()
+            else:
+                # Sem acesso por página: abrir uma página exige a carga completa
+                abertura = pagina = carga
+
+            print(f"{formato:<8} {tamanho / 1e6:>7.2f} {tamanho / tamanho_json:>6.0%} {carga:>9.1f} {abertura:>12.1f} {pagina:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Benchmark do índice de datas do acervo (datas.py)
+
+Monta um catálogo sintético com --processos entradas, com as datas nas
+formas que aparecem nos metadados (ISO, DD/MM/AAAA, por extenso, no meio
+de um texto e algumas inválidas), e mede a interpretação e a montagem do
+índice ordenado, consultas por intervalo comparadas a uma varredura de
+todos os processos e a chegada de --novos arquivos (atualização
+incremental comparada à montagem do zero).
+
+Uso: python -m benchmarks.bench_datas [--processos 100000] [--novos 20]
+"""
+import argparse
+import random
+import time
+from datetime import date, timedelta
+
+from corpus import EntradaCatalogo
+from datas import TabelaDatas, interpretar_data
+from vigia import Alteracoes
+
+MESES = ["janeiro", "fevereiro", "março", "abril", "maio", "junho", "julho", "agosto", "setembro", "outubro",
+         "novembro", "dezembro"]
+
+
+def cronometrar(funcao, repeticoes=1):
+    """(resultado, milissegundos por execução)"""
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        resultado = funcao()
+    return resultado, (time.perf_counter() - inicio) * 1000 / repeticoes
+
+
+def gerar_texto_data(rnd, ano_inicial, ano_final):
+    dia = date(ano_inicial, 1, 1) + timedelta(days=rnd.randrange((date(ano_final, 12, 31) - date(ano_inicial, 1, 1)).days))
+    forma = rnd.random()
+    if forma < 0.6:
+        return dia.isoformat()
+    if forma < 0.85:
+        return f"{dia:%d/%m/%Y}"
+    if forma < 0.93:
+        return f"{dia.day} de {MESES[dia.month - 1]} de {dia.year}"
+    if forma < 0.98:
+        return f"Prazo: {dia:%d/%m/%Y}"
+    return rnd.choice(["15 dias úteis", "a definir", "31/02/2025"])
+
+
+def gerar_entrada(rnd, i):
+    datas = {"distribution_date": gerar_texto_data(rnd, 2020, 2025)}
+    if rnd.random() < 0.6:
+        datas["response_deadline"] = gerar_texto_data(rnd, 2025, 2026)
+    if rnd.random() < 0.4:
+        datas["sentence_date"] = gerar_texto_data(rnd, 2021, 2025)
+    return EntradaCatalogo(caminho=f"/acervo/{i:07d}_resultado.json", process_number=f"{i:07d}-00.2025.8.26.0100",
+                           subtemas={}, datas=datas, tamanho=0, mtime_ns=0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--processos", type=int, default=100_000)
+    parser.add_argument("--novos", type=int, default=20, help="arquivos que chegam depois da montagem")
+    args = parser.parse_args()
+
+    rnd = random.Random(0)
+    catalogo = [gerar_entrada(rnd, i) for i in range(args.processos)]
+
+    interpretar_data.cache_clear()
+    tabela, montagem = cronometrar(lambda: TabelaDatas.construir(catalogo))
+    _, remontagem = cronometrar(lambda: TabelaDatas.construir(catalogo))
+    print(f"{len(tabela)} processos, {interpretar_data.cache_info().currsize} textos de data distintos")
+    print(f"Montagem do índice              {montagem:10.1f} ms")
+    print(f"Montagem com as datas em cache  {remontagem:10.1f} ms\n")
+
+    # A mesma consulta por varredura: interpretar o campo de cada processo e comparar
+    def varredura(campo, inicio, fim):
+        return sum(1 for e in catalogo if (d := interpretar_data(e.datas.get(campo)).data) and inicio <= d <= fim)
+
+    print(f"{'consulta':<34} {'processos':>10} {'índice ms':>10} {'varredura ms':>13}")
+    for campo, inicio, fim in (("response_deadline", date(2025, 11, 1), date(2025, 11, 30)),
+                               ("response_deadline", date(2025, 11, 17), date(2025, 11, 17)),
+                               ("distribution_date", date(2020, 1, 1), date(2025, 12, 31))):
+        total, indice = cronometrar(lambda: tabela.contar(campo, inicio, fim), 1000)
+        _, lista = cronometrar(lambda: tabela.entre(campo, inicio, fim, limite=500), 100)
+        _, dias = cronometrar(lambda: tabela.por_dia(campo, inicio, fim), 100)
+        esperado, varrido = cronometrar(lambda: varredura(campo, inicio, fim), 3)
+        assert total == esperado
+        print(f"{campo} {inicio:%d/%m/%y}-{fim:%d/%m/%y} {total:>10} {indice:>10.4f} {varrido:>13.1f}")
+        print(f"{'  primeiros 500 / contagem por dia':<45} {lista:>10.4f} / {dias:.4f}")
+
+    # Arquivos que chegam: alguns novos, alguns alterados e alguns removidos, como o vigia avisa
+    novos = [gerar_entrada(rnd, args.processos + i) for i in range(args.novos)]
+    alterados = [(catalogo[i], gerar_entrada(rnd, i)) for i in rnd.sample(range(args.processos), args.novos)]
+    removidos = [catalogo[i] for i in rnd.sample(range(args.processos), args.novos)
+                 if catalogo[i].caminho not in {anterior.caminho for anterior, _ in alterados}]
+    alteracoes = Alteracoes(novos, alterados, removidos, [])
+    atualizada, incremental = cronometrar(
+        lambda: tabela.atualizar([e.caminho for e in alteracoes.removidas],
+                                 alteracoes.adicionadas + [nova for _, nova in alteracoes.alteradas]), 10)
+    finais = {e.caminho: e for e in catalogo}
+    for entrada in removidos:
+        del finais[entrada.caminho]
+    finais.update((e.caminho, e) for e in novos + [nova for _, nova in alterados])
+    reconstruida, do_zero = cronometrar(lambda: TabelaDatas.construir(finais.values()))
+    for campo in ("response_deadline", "distribution_date", "sentence_date"):
+        assert (atualizada._ordenados[campo][0] == reconstruida._ordenados[campo][0]).all()
+    print(f"\n{len(novos)} novos, {len(alterados)} alterados, {len(removidos)} removidos:")
+    print(f"Atualização incremental         {incremental:10.1f} ms")
+    print(f"Montagem do zero                {do_zero:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Deltas enviados ao navegador por seção e tempo até a interação em um link lento
+
+Para cada seção, executa o app no AppTest (caches já aquecidos) e captura
+as mensagens ForwardMsg que o servidor enviaria pelo websocket: o número
+de deltas (um por elemento) e o total de bytes serializados. O tempo até
+a interação é estimado para um link com --rtt-ms de latência e
+--banda-kbps de banda: uma ida e volta para o pedido de rerun, o tempo do
+script no servidor e a transmissão de todas as mensagens, cada uma com o
+cabeçalho de um quadro websocket.
+
+Uso: python -m benchmarks.bench_deltas [--paginas 100] [--rtt-ms 300] [--banda-kbps 1000]
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+from benchmarks.gerador import gravar_processo
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Cabeçalho de um quadro websocket do servidor para o navegador (payload < 64 KB)
+BYTES_QUADRO = 4
+
+_mensagens = []
+
+
+def _capturar_mensagens():
+    """Guarda as mensagens de cada execução do AppTest em _mensagens"""
+    from streamlit.testing.v1.local_script_runner import LocalScriptRunner
+
+    executar = LocalScriptRunner.run
+
+    def executar_e_capturar(self, *args, **kwargs):
+        arvore = executar(self, *args, **kwargs)
+        _mensagens[:] = list(self.forward_msgs())
+        return arvore
+
+    LocalScriptRunner.run = executar_e_capturar
+
+
+def medir_secoes(repeticoes):
+    """(seção, deltas, bytes, ms no servidor) para cada seção do app"""
+    from streamlit.testing.v1 import AppTest
+
+    from comum import SECOES
+
+    _capturar_mensagens()
+    at = AppTest.from_file(os.path.join(RAIZ, "app.py"), default_timeout=600)
+    at.run()
+    medidas = []
+    for secao in SECOES:
+        tempos = []
+        for _ in range(repeticoes + 1):
+            at.switch_page(secao.arquivo)
+            inicio = time.perf_counter()
+            at.run()
+            tempos.append(time.perf_counter() - inicio)
+            if at.exception:
+                raise RuntimeError(f"{secao.titulo}: {at.exception[0].message}")
+        deltas = sum(1 for m in _mensagens if m.WhichOneof("type") == "delta")
+        tamanho = sum(m.ByteSize() + BYTES_QUADRO for m in _mensagens)
+        # A primeira execução de cada seção aquece os caches
+        medidas.append((secao.titulo, deltas, tamanho, statistics.median(tempos[1:]) * 1000))
+    return medidas
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--paginas", type=int, default=100)
+    parser.add_argument("--repeticoes", type=int, default=5)
+    parser.add_argument("--rtt-ms", type=float, default=300.0, help="ida e volta do link")
+    parser.add_argument("--banda-kbps", type=float, default=1000.0, help="banda do servidor para o navegador")
+    args = parser.parse_args()
+
+    os.environ["PROVAI_INSTANTANEOS"] = ""
+    with tempfile.TemporaryDirectory() as pasta:
+        gravar_processo(os.path.join(pasta, "sintetico_resultado.json"), paginas=args.paginas)
+        os.environ["PROVAI_DIRETORIO"] = pasta
+        medidas = medir_secoes(args.repeticoes)
+
+    print(f"{'Seção':<28} {'deltas':>7} {'KB':>8} {'servidor ms':>12} {'interação ms':>13}")
+    for titulo, deltas, tamanho, servidor_ms in medidas:
+        transmissao_ms = tamanho * 8 / args.banda_kbps
+        interacao_ms = args.rtt_ms + servidor_ms + transmissao_ms
+        print(f"{titulo:<28} {deltas:>7} {tamanho / 1024:>8.1f} {servidor_ms:>12.1f} {interacao_ms:>13.1f}")
+    total_deltas = sum(m[1] for m in medidas)
+    print(f"{'Total':<28} {total_deltas:>7} {sum(m[2] for m in medidas) / 1024:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Benchmark dos identificadores (entidades.py e a tabela entidades do acervo)
+
+Mede a extração de CPF, CNPJ, OAB, números CNJ e e-mails nas páginas de um
+processo sintético de --paginas páginas e a busca "processos em que aparece
+este CNPJ" em um acervo com --paginas-acervo páginas: alguns processos
+sintéticos ingeridos por completo e o restante das páginas inserido direto
+na tabela entidades, com --por-pagina identificadores cada uma.
+
+Uso: python -m benchmarks.bench_entidades [--paginas 5000] [--paginas-acervo 1000000] [--por-pagina 2]
+"""
+import argparse
+import os
+import random
+import sqlite3
+import tempfile
+import time
+from contextlib import closing
+
+from benchmarks.gerador import gerar_cnpj, gerar_cpf, gerar_processo, gravar_processo
+from busca_acervo import ARQUIVO_BANCO, AcervoBusca
+from entidades import extrair_entidades
+from modelos import ProcessoJudicial
+
+PROCESSOS_INGERIDOS = 10
+
+
+def cronometrar(funcao, repeticoes=1):
+    """(resultado, milissegundos por execução)"""
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        resultado = funcao()
+    return resultado, (time.perf_counter() - inicio) * 1000 / repeticoes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--paginas", type=int, default=5000, help="páginas do processo da extração")
+    parser.add_argument("--paginas-acervo", type=int, default=1_000_000, help="páginas do acervo sintético")
+    parser.add_argument("--por-pagina", type=int, default=2, help="identificadores por página inserida direto")
+    args = parser.parse_args()
+
+    processo = ProcessoJudicial.model_validate(gerar_processo(paginas=args.paginas))
+    entidades, extracao = cronometrar(lambda: [extrair_entidades(p.extracted_text) for p in processo.results])
+    print(f"Extração ({args.paginas} páginas): {extracao:.0f} ms, {sum(map(len, entidades))} identificadores válidos\n")
+
+    rnd = random.Random(0)
+    with tempfile.TemporaryDirectory() as pasta:
+        acervo = AcervoBusca(os.path.join(pasta, ARQUIVO_BANCO))
+        for i in range(PROCESSOS_INGERIDOS):
+            caminho = os.path.join(pasta, f"{i:05d}_resultado.json")
+            gravar_processo(caminho, paginas=200, semente=i)
+            acervo.ingerir(caminho)
+
+        # O restante do acervo: processos de 1.000 páginas só com as linhas de identificadores
+        inicio = time.perf_counter()
+        with closing(sqlite3.connect(acervo.caminho_banco)) as conexao, conexao:
+            restantes = max(args.paginas_acervo - PROCESSOS_INGERIDOS * 200, 0)
+            for processo_id in range(1 << 10, (1 << 10) + (restantes + 999) // 1000):
+                conexao.execute("INSERT INTO processos (id, caminho, mtime_ns, tamanho) VALUES (?, ?, 0, 0)",
+                                (processo_id, f"sintetico_{processo_id}"))
+                linhas = {}
+                for page_id in range(1, min(1000, restantes) + 1):
+                    for _ in range(args.por_pagina):
+                        valor = gerar_cpf(rnd) if rnd.random() < 0.7 else gerar_cnpj(rnd)
+                        linhas[(valor, page_id)] = ("cpf" if len(valor) == 14 else "cnpj", processo_id, page_id)
+                restantes -= 1000
+                conexao.executemany("INSERT INTO entidades VALUES (?, ?, ?, ?, 1)",
+                                    [(valor, tipo, pid, page_id) for (valor, _), (tipo, pid, page_id) in linhas.items()])
+            total_linhas = conexao.execute("SELECT COUNT(*) FROM entidades").fetchone()[0]
+        print(f"Acervo: {args.paginas_acervo} páginas, {total_linhas} linhas de identificadores "
+              f"({time.perf_counter() - inicio:.0f} s para inserir), {os.path.getsize(acervo.caminho_banco) / 1e6:.0f} MB\n")
+
+        with closing(sqlite3.connect(acervo.caminho_banco)) as conexao:
+            cnpj_frequente = conexao.execute(
+                "SELECT valor FROM entidades WHERE tipo = 'cnpj' AND processo_id < ? GROUP BY valor ORDER BY COUNT(*) DESC LIMIT 1",
+                (1 << 10,),
+            ).fetchone()[0]
+            cpf_sintetico = conexao.execute(
+                "SELECT valor FROM entidades WHERE tipo = 'cpf' AND processo_id >= ? LIMIT 1", (1 << 10,)).fetchone()[0]
+        print(f"{'consulta':<28} {'processos':>10} {'páginas':>8} {'ms':>7}")
+        # Um CNPJ dos processos ingeridos, um CPF sem pontuação e um CPF válido que não aparece
+        for consulta in (cnpj_frequente, cpf_sintetico.replace(".", "").replace("-", ""), "000.000.001-91"):
+            resultado, ms = cronometrar(lambda: acervo.processos_com_entidade(consulta), 200)
+            print(f"{consulta:<28} {len(resultado):>10} {sum(len(r.paginas) for r in resultado):>8} {ms:>7.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Benchmark das estatísticas por página (estatisticas_paginas.py)
+
+Mede a montagem das séries (imagens e textos; palavras-chave) a partir
+de um processo sintético de --paginas páginas e, para séries de 1 mil a
+1 milhão de páginas, uma consulta por intervalo e a faixa de calor pelas
+somas acumuladas, comparadas à soma direta sobre os valores das páginas.
+
+Uso: python -m benchmarks.bench_estatisticas_paginas [--paginas 5000]
+"""
+import argparse
+import random
+import time
+
+from benchmarks.gerador import gerar_processo
+from estatisticas_paginas import COLUNAS_FAIXA, EstatisticasPaginas
+from modelos import ProcessoJudicial
+
+
+def cronometrar(funcao, repeticoes):
+    """Microssegundos por execução"""
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        funcao()
+    return (time.perf_counter() - inicio) * 1e6 / repeticoes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--paginas", type=int, default=5000, help="páginas do processo sintético da montagem")
+    args = parser.parse_args()
+
+    processo = ProcessoJudicial.model_validate(gerar_processo(paginas=args.paginas))
+    subtemas = processo.metadata.subthemes.items()
+    palavras_chave = [categoria for categoria, _ in subtemas] + [palavra for _, itens in subtemas for palavra in itens]
+    inicio = time.perf_counter()
+    EstatisticasPaginas.construir(processo.results)
+    print(f"Montagem das séries de imagens e textos ({args.paginas} páginas): {(time.perf_counter() - inicio) * 1000:.0f} ms")
+    inicio = time.perf_counter()
+    EstatisticasPaginas.de_palavras_chave(processo.results, palavras_chave)
+    print(f"Montagem da série de palavras-chave: {(time.perf_counter() - inicio) * 1000:.0f} ms\n")
+
+    rnd = random.Random(0)
+    print(f"{'páginas':>9} {'intervalo µs':>13} {'soma direta µs':>15} {'faixa µs':>9} {'faixa direta µs':>16}")
+    for total in (1_000, 10_000, 100_000, 1_000_000):
+        valores = [rnd.random() < 0.25 for _ in range(total)]
+        estatisticas = EstatisticasPaginas(range(1, total + 1), {"imagens": valores})
+        primeira, ultima = total // 5, total * 3 // 5
+        repeticoes = max(1, 100_000 // total)
+
+        intervalo = cronometrar(lambda: estatisticas.paginas_com("imagens", primeira, ultima), 1000)
+        direta = cronometrar(lambda: sum(valores[primeira - 1:ultima]), repeticoes)
+        faixa = cronometrar(lambda: estatisticas.faixa("imagens"), 200)
+        passo = total / COLUNAS_FAIXA
+        faixa_direta = cronometrar(lambda: [sum(valores[round(i * passo):round((i + 1) * passo)]) for i in range(COLUNAS_FAIXA)],
+                                   repeticoes)
+        print(f"{total:>9} {intervalo:>13.1f} {direta:>15.1f} {faixa:>9.1f} {faixa_direta:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Benchmark da ingestão em lote (main.py ingerir) com pools de tamanhos diferentes
+
+Gera --arquivos processos sintéticos de --paginas páginas e os ingere do
+zero (--refazer) com cada número de processos em --processos, mostrando a
+vazão e a eficiência em relação a um processo só (1.0 = escala linear).
+
+Uso: python -m benchmarks.bench_ingestao [--arquivos 32] [--paginas 200] [--processos 1 2 4 8]
+"""
+import argparse
+import os
+import tempfile
+
+from benchmarks.gerador import gravar_processo
+from main import ingerir
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--arquivos", type=int, default=32)
+    parser.add_argument("--paginas", type=int, default=200)
+    parser.add_argument("--processos", type=int, nargs="+",
+                        default=sorted({1, 2, 4, os.cpu_count() or 1}))
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as pasta:
+        for i in range(args.arquivos):
+            gravar_processo(os.path.join(pasta, f"{i:05d}_resultado.json"), paginas=args.paginas, semente=i)
+
+        print(f"{'processos':>9} {'s':>7} {'arquivos/s':>11} {'MB/s':>7} {'eficiência':>11}")
+        base = None
+        for processos in args.processos:
+            relatorio = ingerir(pasta, processos, refazer=True, relatar=lambda _: None)
+            vazao = relatorio.ingeridos / relatorio.segundos
+            base = base or vazao / processos
+            print(f"{processos:>9} {relatorio.segundos:>7.2f} {vazao:>11.1f} "
+                  f"{relatorio.bytes / 1e6 / relatorio.segundos:>7.1f} {vazao / (base * processos):>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
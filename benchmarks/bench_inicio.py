@@ -0,0 +1,130 @@
+"""Benchmark da partida a frio: tempo de importação e tempo até a primeira exibição
+
+Cada medida roda em um interpretador novo, como na primeira sessão de um
+servidor recém-iniciado:
+
+- importação: python -X importtime dos módulos carregados pelo app.py,
+  separando o Streamlit dos módulos do próprio aplicativo;
+- primeira exibição: tempo até o AppTest concluir a primeira execução do
+  app.py (seção "Resumo do Processo"), contando a importação do Streamlit.
+
+Também confere o orçamento de importação: os módulos de MODULOS_PESADOS
+não podem estar carregados depois da primeira exibição. Os resultados são
+comparados com um arquivo de referência, como em benchmarks.bench_app.
+
+Uso: python -m benchmarks.bench_inicio [--repeticoes 5] [--referencia benchmarks/referencia_inicio.json]
+                                       [--tolerancia 0.5] [--atualizar]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+from benchmarks.bench_app import comparar
+from benchmarks.gerador import gravar_processo
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REFERENCIA_PADRAO = os.path.join(RAIZ, "benchmarks", "referencia_inicio.json")
+
+# Módulos importados pelo app.py antes de exibir a primeira seção
+MODULOS_APP = ("streamlit", "comum", "corpus", "instrumentacao")
+
+# Só as seções que precisam deles podem importá-los
+MODULOS_PESADOS = ("pandas", "numpy", "pyarrow", "sqlite3", "busca", "busca_acervo")
+
+PRIMEIRA_EXIBICAO = """
+import json, sys, time
+inicio = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file("app.py", default_timeout=600).run()
+fim = time.perf_counter()
+if at.exception:
+    raise SystemExit(at.exception[0].message)
+print(json.dumps({"ms": (fim - inicio) * 1000, "pesados": [m for m in sys.argv[1:] if m in sys.modules]}))
+"""
+
+
+def medir_importacao():
+    """Tempo de importação (ms) do Streamlit e dos módulos do aplicativo
+
+    Os módulos do aplicativo são importados depois do Streamlit; somam-se os
+    tempos acumulados dos módulos de primeiro nível (sem recuo no nome).
+    """
+    comando = [sys.executable, "-X", "importtime", "-c", f"import {', '.join(MODULOS_APP)}"]
+    saida = subprocess.run(comando, cwd=RAIZ, capture_output=True, text=True, check=True).stderr
+    tempos = {"streamlit": 0.0, "aplicativo": 0.0}
+    grupo = None
+    for linha in saida.splitlines():
+        if not linha.startswith("import time:") or "|" not in linha:
+            continue
+        _, acumulado, nome = linha.split("|")
+        if nome.startswith("  ") or not acumulado.strip().isdigit():
+            continue
+        if nome.strip() == "streamlit":
+            tempos["streamlit"] = int(acumulado) / 1000
+            grupo = "aplicativo"
+        elif grupo:
+            tempos[grupo] += int(acumulado) / 1000
+    return tempos
+
+
+def medir_primeira_exibicao(pasta):
+    """Tempo até a primeira exibição (ms) e módulos pesados já carregados"""
+    ambiente = {**os.environ, "PROVAI_DIRETORIO": pasta, "PROVAI_INSTANTANEOS": ""}
+    comando = [sys.executable, "-c", PRIMEIRA_EXIBICAO, *MODULOS_PESADOS]
+    saida = subprocess.run(comando, cwd=RAIZ, env=ambiente, capture_output=True, text=True, check=True).stdout
+    return json.loads(saida.splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeticoes", type=int, default=5)
+    parser.add_argument("--paginas", type=int, default=100, help="páginas do processo sintético exibido")
+    parser.add_argument("--referencia", default=REFERENCIA_PADRAO)
+    parser.add_argument("--tolerancia", type=float, default=0.5, help="piora relativa aceita (0.5 = 50%%)")
+    parser.add_argument("--atualizar", action="store_true", help="grava a execução atual como referência")
+    args = parser.parse_args()
+
+    importacoes = [medir_importacao() for _ in range(args.repeticoes)]
+    atual = {
+        f"Importação / {grupo}": {"ms": statistics.median(tempos[grupo] for tempos in importacoes)}
+        for grupo in ("streamlit", "aplicativo")
+    }
+
+    with tempfile.TemporaryDirectory() as pasta:
+        gravar_processo(os.path.join(pasta, "sintetico_resultado.json"), paginas=args.paginas)
+        exibicoes = [medir_primeira_exibicao(pasta) for _ in range(args.repeticoes)]
+    atual["Primeira exibição"] = {"ms": statistics.median(e["ms"] for e in exibicoes)}
+    pesados = sorted({m for e in exibicoes for m in e["pesados"]})
+
+    for etapa, medidas in atual.items():
+        print(f"{etapa:<40} {medidas['ms']:9.1f} ms")
+
+    falhou = False
+    if pesados:
+        print(f"ORÇAMENTO: módulos pesados carregados na primeira exibição: {', '.join(pesados)}")
+        falhou = True
+
+    if args.atualizar or not os.path.exists(args.referencia):
+        with open(args.referencia, "w", encoding="utf-8") as f:
+            json.dump(atual, f, ensure_ascii=False, indent=2)
+        print(f"Referência gravada em {args.referencia}")
+    else:
+        with open(args.referencia, "r", encoding="utf-8") as f:
+            referencia = json.load(f)
+        regressoes = comparar(atual, referencia, args.tolerancia)
+        for etapa, metrica, anterior, novo in regressoes:
+            print(f"REGRESSÃO {etapa} [{metrica}]: {anterior:.1f} -> {novo:.1f}")
+        falhou = falhou or bool(regressoes)
+        if not regressoes:
+            print(f"Sem regressões acima de {args.tolerancia:.0%} em relação a {args.referencia}")
+
+    if falhou:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Benchmark da agregação de palavras-chave do acervo (palavras_chave.py)
+
+Monta um catálogo sintético com --processos entradas, cada uma com
+--categorias categorias sorteadas e --palavras palavras-chave por
+categoria, e mede a montagem da tabela colunar, as principais
+palavras-chave por categoria e o resumo por categoria.
+
+Uso: python -m benchmarks.bench_palavras_chave [--processos 100000]
+"""
+import argparse
+import random
+import time
+
+from corpus import EntradaCatalogo
+from palavras_chave import principais_por_categoria, resumo_categorias, tabela_palavras_chave
+
+CATEGORIAS = ["Contratos", "Danos Morais", "Responsabilidade Civil", "Locação", "Arbitragem", "Tutela Antecipada",
+              "Gratuidade de Justiça", "Consumidor", "Família", "Execução", "Tributário", "Trabalhista"]
+
+
+def gerar_catalogo(processos, categorias, palavras, vocabulario, semente=0):
+    rnd = random.Random(semente)
+    termos = [f"termo {i}" for i in range(vocabulario)]
+    return [
+        EntradaCatalogo(
+            caminho=f"/acervo/{i:07d}_resultado.json",
+            process_number=f"{i:07d}-00.2025.8.26.0100",
+            subtemas={c: rnd.sample(termos, palavras) for c in rnd.sample(CATEGORIAS, categorias)},
+            datas={},
+            tamanho=0,
+            mtime_ns=0,
+        )
+        for i in range(processos)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--processos", type=int, default=100_000)
+    parser.add_argument("--categorias", type=int, default=5, help="categorias por processo")
+    parser.add_argument("--palavras", type=int, default=2, help="palavras-chave por categoria")
+    parser.add_argument("--vocabulario", type=int, default=3000, help="palavras-chave distintas")
+    args = parser.parse_args()
+
+    catalogo = gerar_catalogo(args.processos, args.categorias, args.palavras, args.vocabulario)
+
+    inicio = time.perf_counter()
+    tabela = tabela_palavras_chave(catalogo)
+    montagem = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    principais_por_categoria(tabela)
+    principais = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    resumo_categorias(tabela)
+    resumo = time.perf_counter() - inicio
+
+    print(f"{len(tabela)} linhas de {args.processos} processos, {tabela.memory_usage(deep=True).sum() / 1e6:.1f} MB")
+    print(f"Montagem da tabela          {montagem * 1000:8.1f} ms")
+    print(f"Principais por categoria    {principais * 1000:8.1f} ms")
+    print(f"Resumo por categoria        {resumo * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Memória das páginas: lista de PageResult x tabela compacta (tabela_paginas.py)
+
+Gera --paginas páginas sintéticas e mede com tracemalloc a memória retida
+em cada representação, com as páginas validadas a partir dos próprios
+bytes JSON, e também com os textos vazios (só a estrutura). Mede ainda a
+montagem da tabela (sob tracemalloc) e a conversão de uma página para
+PageResult. Os valores são mostrados por 10 mil páginas.
+
+Uso: python -m benchmarks.bench_tabela_paginas [--paginas 10000] [--palavras 350]
+"""
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+
+from benchmarks.gerador import gerar_processo
+from modelos import PageResult
+from tabela_paginas import TabelaPaginas
+
+POR_PAGINAS = 10_000
+
+
+def memoria_retida(montar):
+    """Bytes retidos pelo objeto devolvido por montar() e o próprio objeto"""
+    gc.collect()
+    tracemalloc.start()
+    objeto = montar()
+    gc.collect()
+    atual, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return atual, objeto
+
+
+def medir(documentos):
+    """(bytes da lista de PageResult, bytes da tabela, segundos da montagem da tabela, tabela)"""
+    lista_bytes, lista = memoria_retida(lambda: [PageResult.model_validate_json(d) for d in documentos])
+    del lista
+    inicio = time.perf_counter()
+    tabela_bytes, tabela = memoria_retida(lambda: TabelaPaginas(PageResult.model_validate_json(d) for d in documentos))
+    return lista_bytes, tabela_bytes, time.perf_counter() - inicio, tabela
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--paginas", type=int, default=POR_PAGINAS)
+    parser.add_argument("--palavras", type=int, default=350, help="média de palavras por página")
+    args = parser.parse_args()
+
+    paginas = gerar_processo(paginas=args.paginas, palavras=args.palavras)["results"]
+    escala = POR_PAGINAS / args.paginas
+    # Validadas a partir de bytes, os textos são criados na validação e entram nas duas medidas
+    documentos = [json.dumps(p, ensure_ascii=False).encode("utf-8") for p in paginas]
+    sem_textos = [json.dumps({**p, "extracted_text": "", "extracted_image_text": None, "summary": ""}).encode("utf-8")
+                  for p in paginas]
+
+    lista_bytes, tabela_bytes, montagem, tabela = medir(documentos)
+    lista_estrutura, tabela_estrutura, _, _ = medir(sem_textos)
+
+    inicio = time.perf_counter()
+    for indice in range(len(tabela)):
+        tabela[indice]
+    conversao = (time.perf_counter() - inicio) / len(tabela)
+
+    print(f"Por {POR_PAGINAS} páginas ({args.palavras} palavras por página):")
+    print(f"{'':<28} {'PageResult':>11} {'Tabela':>9}")
+    print(f"{'com os textos':<28} {lista_bytes * escala / 1e6:>8.1f} MB {tabela_bytes * escala / 1e6:>6.1f} MB")
+    print(f"{'estrutura (textos vazios)':<28} {lista_estrutura * escala / 1e6:>8.1f} MB {tabela_estrutura * escala / 1e6:>6.1f} MB")
+    print(f"Montagem da tabela (com validação) {montagem * escala * 1000:8.0f} ms")
+    print(f"TabelaPaginas[i] -> PageResult     {conversao * 1e6:8.1f} µs por página")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Benchmark do timbre: memória da tabela de páginas e tamanho do índice de busca
+
+Gera um processo sintético (páginas com cabeçalho e rodapé do escritório,
+como benchmarks/gerador.py) e compara, com e sem a separação do timbre:
+
+- tabela: TabelaPaginas.bytes_residentes;
+- índice: tamanho do índice de busca salvo (JSON) e número de postings;
+- ranking: páginas devolvidas para o nome do advogado, que está no timbre
+  de todas as páginas e só deveria trazer as que o citam no corpo.
+
+Também mede a detecção e a recomposição exata das páginas.
+
+Uso: python -m benchmarks.bench_timbre [--paginas 2000] [--palavras 350]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from benchmarks.gerador import gerar_processo
+from busca import IndiceBusca
+from modelos import ProcessoJudicial
+from tabela_paginas import TabelaPaginas
+from timbre import Timbre
+
+
+def tamanho_indice(indice):
+    """(bytes do índice salvo, número de postings)"""
+    with tempfile.TemporaryDirectory() as pasta:
+        destino = os.path.join(pasta, "indice.json")
+        indice.salvar(destino, (0, 0))
+        return os.path.getsize(destino), sum(len(lista) // 2 for lista in indice.postings.values())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--paginas", type=int, default=2000)
+    parser.add_argument("--palavras", type=int, default=350, help="média de palavras por página")
+    args = parser.parse_args()
+
+    processo = ProcessoJudicial.model_validate(gerar_processo(paginas=args.paginas, palavras=args.palavras))
+    paginas = processo.results
+    advogado = paginas[0].extracted_text.split("\n")[0]
+
+    inicio = time.perf_counter()
+    timbre = Timbre.detectar(p.extracted_text for p in paginas)
+    deteccao = time.perf_counter() - inicio
+    print(f"Timbre detectado ({deteccao * 1000:.1f} ms): {sorted(timbre.normalizadas)}")
+
+    sem_separar = TabelaPaginas(paginas, separar_timbre=False)
+    tabela = TabelaPaginas(paginas)
+    inicio = time.perf_counter()
+    exatas = all(tabela[i].extracted_text == p.extracted_text for i, p in enumerate(paginas))
+    recomposicao = (time.perf_counter() - inicio) / len(paginas)
+
+    indice_completo = IndiceBusca.construir(paginas, remover_timbre=False)
+    indice = IndiceBusca.construir(paginas)
+    bytes_completo, postings_completo = tamanho_indice(indice_completo)
+    bytes_indice, postings = tamanho_indice(indice)
+
+    print(f"{'':<26} {'com timbre':>11} {'sem timbre':>11}")
+    print(f"{'tabela (MB)':<26} {sem_separar.bytes_residentes / 1e6:>11.2f} {tabela.bytes_residentes / 1e6:>11.2f}")
+    print(f"{'índice salvo (MB)':<26} {bytes_completo / 1e6:>11.2f} {bytes_indice / 1e6:>11.2f}")
+    print(f"{'postings':<26} {postings_completo:>11} {postings:>11}")
+    print(f"{'páginas para o advogado':<26} {len(indice_completo.buscar(advogado, limite=None)):>11} "
+          f"{len(indice.buscar(advogado, limite=None)):>11}")
+    print(f"Recomposição exata: {exatas} ({recomposicao * 1e6:.1f} µs por página)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Benchmark: caminhos de validação de um *_resultado.json
+
+Compara, em arquivos sintéticos de vários tamanhos:
+- dict: json.load + ProcessoJudicial.model_validate (caminho anterior);
+- bytes: ProcessoJudicial.model_validate_json sobre os bytes do arquivo;
+- instantâneo: hash do conteúdo + leitura do processo já validado.
+
+Uso: python -m benchmarks.bench_validacao [--paginas 100 1000 10000] [--repeticoes 5]
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from benchmarks.bench_armazem import gerar_arquivo
+from corpus import carregar_processo
+from modelos import ProcessoJudicial
+
+
+def carregar_dict(caminho):
+    with open(caminho, "r", encoding="utf-8") as f:
+        return ProcessoJudicial.model_validate(json.load(f))
+
+
+def medir(funcao, repeticoes):
+    """Mediana do tempo de execução, em milissegundos"""
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append(time.perf_counter() - inicio)
+    tempos.sort()
+    return tempos[len(tempos) // 2] * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--paginas", type=int, nargs="+", default=[100, 1000, 10000])
+    parser.add_argument("--repeticoes", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'páginas':>8} {'MB':>7} {'dict ms':>9} {'bytes ms':>9} {'instant. ms':>12}")
+    with tempfile.TemporaryDirectory() as temporario:
+        instantaneos = os.path.join(temporario, "instantaneos")
+        for paginas in args.paginas:
+            caminho = os.path.join(temporario, f"{paginas}_resultado.json")
+            gerar_arquivo(caminho, paginas)
+            # Grava o instantâneo antes de medir as leituras seguintes
+            carregar_processo(caminho, instantaneos)
+
+            dict_ms = medir(lambda: carregar_dict(caminho), args.repeticoes)
+            bytes_ms = medir(lambda: carregar_processo(caminho), args.repeticoes)
+            instantaneo_ms = medir(lambda: carregar_processo(caminho, instantaneos), args.repeticoes)
+            print(f"{paginas:>8} {os.path.getsize(caminho) / 1e6:>7.1f} {dict_ms:>9.1f} {bytes_ms:>9.1f} {instantaneo_ms:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
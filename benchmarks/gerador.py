@@ -0,0 +1,208 @@
+"""Gerador de resultados sintéticos da ProvAI, válidos para ProcessoJudicial
+
+Produz processos de qualquer tamanho, com controle do número de páginas,
+do tamanho dos textos, da proporção de páginas com imagens, dos subtemas
+e dos pontos controversos. A geração é determinística para uma semente.
+
+Uso: python -m benchmarks.gerador destino_resultado.json [--paginas 1000] [--palavras 350]
+"""
+import argparse
+import json
+import random
+
+TRIBUNAIS = [("TJ-SP", "São Paulo, SP"), ("TJ-RJ", "Rio de Janeiro, RJ"), ("TJ-MG", "Belo Horizonte, MG"),
+             ("TJ-RS", "Porto Alegre, RS"), ("TJ-PR", "Curitiba, PR")]
+TEMAS = ["Cível", "Consumidor", "Empresarial", "Família", "Imobiliário"]
+CATEGORIAS_SUBTEMAS = ["Contratos", "Danos Morais", "Responsabilidade Civil", "Locação", "Arbitragem"]
+NOMES = ["Ana", "Bruno", "Carla", "Diego", "Elisa", "Fábio", "Gabriela", "Heitor", "Isabela", "João",
+         "Larissa", "Marcelo", "Natália", "Otávio", "Patrícia", "Rafael", "Sofia", "Tiago"]
+SOBRENOMES = ["Almeida", "Barbosa", "Cardoso", "Duarte", "Ferreira", "Gomes", "Lima", "Moreira",
+              "Nogueira", "Oliveira", "Pereira", "Ribeiro", "Santos", "Teixeira", "Vieira"]
+EMPRESAS = ["Imobiliária Horizonte LTDA", "Banco Meridional S.A.", "Construtora Aurora LTDA",
+            "Seguradora Atlântica S.A.", "Plataforma Lar Digital LTDA"]
+CITACOES = ["art. 300 do CPC", "art. 186 do Código Civil", "art. 927 do Código Civil", "art. 6º, VIII, do CDC",
+            "art. 14 do CDC", "Lei nº 8.245/1991", "Lei nº 9.307/1996", "art. 5º, X, da Constituição Federal",
+            "Súmula 297 do STJ", "art. 487, I, do CPC"]
+PALAVRAS = (
+    "autor autora réu ré contrato locação imóvel fiador fiadora assinatura fraude dados cobrança "
+    "indevida dano moral indenização valor prazo audiência citação intimação sentença decisão "
+    "tutela antecipada urgência pedido petição inicial contestação réplica prova documento perícia "
+    "testemunha juízo vara foro comarca tribunal recurso apelação agravo embargos acordo pagamento "
+    "parcela aluguel multa rescisão cláusula compromissória arbitragem árbitro nulidade responsabilidade "
+    "solidária consumidor fornecedor serviço falha segurança verificação identidade boleto débito "
+    "inexistência declaração restituição dobro juros correção monetária honorários advocatícios custas"
+).split()
+
+CABECALHO_ESCRITORIO = "{advogado}\nOAB/SP {oab}\nfls. {pagina}\n"
+RODAPE = "\nEste documento é cópia do original, assinado digitalmente por {advogado}."
+
+
+def _digitos_verificadores(base, pesos):
+    soma = sum(int(d) * p for d, p in zip(base, pesos))
+    resto = soma % 11
+    return "0" if resto < 2 else str(11 - resto)
+
+
+def gerar_cpf(rnd):
+    """CPF formatado com dígitos verificadores válidos"""
+    base = "".join(str(rnd.randrange(10)) for _ in range(9))
+    base += _digitos_verificadores(base, range(10, 1, -1))
+    base += _digitos_verificadores(base, range(11, 1, -1))
+    return f"{base[:3]}.{base[3:6]}.{base[6:9]}-{base[9:]}"
+
+
+def gerar_cnpj(rnd):
+    """CNPJ formatado com dígitos verificadores válidos"""
+    base = "".join(str(rnd.randrange(10)) for _ in range(8)) + "0001"
+    base += _digitos_verificadores(base, [5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2])
+    base += _digitos_verificadores(base, [6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2])
+    return f"{base[:2]}.{base[2:5]}.{base[5:8]}/{base[8:12]}-{base[12:]}"
+
+
+def gerar_numero_cnj(rnd, ano=2025, tribunal="8.26"):
+    """Número de processo no padrão CNJ (NNNNNNN-DD.AAAA.J.TR.OOOO) com dígito verificador válido"""
+    sequencial = rnd.randrange(10 ** 7)
+    origem = rnd.randrange(10 ** 4)
+    j, tr = tribunal.split(".")
+    digito = 98 - int(f"{sequencial:07d}{ano}{j}{tr}{origem:04d}00") % 97
+    return f"{sequencial:07d}-{digito:02d}.{ano}.{j}.{tr}.{origem:04d}"
+
+
+def gerar_nome(rnd):
+    return f"{rnd.choice(NOMES)} {rnd.choice(SOBRENOMES)} {rnd.choice(SOBRENOMES)}"
+
+
+def gerar_data(rnd, ano_inicial=2022, ano_final=2025):
+    return f"{rnd.randint(ano_inicial, ano_final)}-{rnd.randint(1, 12):02d}-{rnd.randint(1, 28):02d}"
+
+
+def gerar_frase(rnd, palavras):
+    texto = " ".join(rnd.choice(PALAVRAS) for _ in range(palavras))
+    return texto[0].upper() + texto[1:] + "."
+
+
+def gerar_texto(rnd, palavras, partes, numero):
+    """Texto corrido com frases, citações legais, partes e documentos"""
+    frases = []
+    restante = palavras
+    while restante > 0:
+        tamanho = min(restante, rnd.randint(8, 25))
+        frase = gerar_frase(rnd, tamanho)
+        sorteio = rnd.random()
+        if sorteio < 0.15:
+            frase = frase[:-1] + f", nos termos do {rnd.choice(CITACOES)}."
+        elif sorteio < 0.22:
+            frase = f"{rnd.choice(partes)}, inscrito(a) no CPF sob o nº {gerar_cpf(rnd)}, " + frase[0].lower() + frase[1:]
+        elif sorteio < 0.26:
+            frase = f"{rnd.choice(EMPRESAS)}, CNPJ {gerar_cnpj(rnd)}, " + frase[0].lower() + frase[1:]
+        elif sorteio < 0.30:
+            frase = frase[:-1] + f", conforme decisão de {gerar_data(rnd)} nos autos do processo nº {numero}."
+        frases.append(frase)
+        restante -= tamanho
+    linhas = []
+    linha = []
+    for frase in frases:
+        linha.append(frase)
+        if rnd.random() < 0.3:
+            linhas.append(" ".join(linha))
+            linha = []
+    linhas.append(" ".join(linha))
+    return "\n".join(linha for linha in linhas if linha)
+
+
+def gerar_processo(paginas=100, palavras=350, proporcao_imagens=0.25, subtemas=1, pontos=10, semente=0):
+    """Dicionário no formato do *_resultado.json da ProvAI
+
+    paginas: número de páginas; palavras: média de palavras por página;
+    proporcao_imagens: fração das páginas com imagens; subtemas: itens por
+    categoria de subtema; pontos: número de pontos controversos.
+    """
+    rnd = random.Random(semente)
+    tribunal, jurisdicao = rnd.choice(TRIBUNAIS)
+    numero = gerar_numero_cnj(rnd)
+    advogado = gerar_nome(rnd).upper()
+    oab = rnd.randint(100000, 499999)
+    partes = [gerar_nome(rnd) for _ in range(4)]
+    nome_base = numero
+
+    resultados = []
+    com_imagens = 0
+    for page_id in range(1, paginas + 1):
+        tem_imagens = rnd.random() < proporcao_imagens
+        com_imagens += tem_imagens
+        quantidade = max(1, int(rnd.gauss(palavras, palavras * 0.3)))
+        texto = (CABECALHO_ESCRITORIO.format(advogado=advogado, oab=oab, pagina=page_id)
+                 + gerar_texto(rnd, quantidade, partes, numero)
+                 + RODAPE.format(advogado=advogado))
+        resultados.append({
+            "page_id": page_id,
+            "file_name": f"{nome_base}_page{page_id}.pdf",
+            "has_images": tem_imagens,
+            "extracted_text": texto,
+            "extracted_image_text": gerar_texto(rnd, max(5, quantidade // 10), partes, numero) if tem_imagens and rnd.random() < 0.9 else None,
+            "summary": gerar_texto(rnd, max(10, quantidade // 6), partes, numero),
+        })
+
+    return {
+        "file": {"file_name": f"{nome_base}.pdf", "file_type": "pdf", "total_pages": paginas},
+        "results": resultados,
+        "metadata": {
+            "is_approved": rnd.random() < 0.7,
+            "process_number": numero,
+            "court": tribunal,
+            "jurisdiction": jurisdicao,
+            "distribution_date": gerar_data(rnd),
+            "response_deadline": gerar_data(rnd, 2025, 2026) if rnd.random() < 0.5 else None,
+            "responsible": gerar_nome(rnd),
+            "judge_name": gerar_nome(rnd) if rnd.random() < 0.6 else None,
+            "case_value": f"R$ {rnd.randint(1, 500) * 1000:,},00".replace(",", "."),
+            "sentence_date": gerar_data(rnd) if rnd.random() < 0.5 else None,
+            "priority": rnd.choice([None, "Alta", "Normal"]),
+            "theme": rnd.choice(TEMAS),
+            "subthemes": {
+                categoria: [gerar_frase(rnd, rnd.randint(10, 25)) for _ in range(subtemas)]
+                for categoria in CATEGORIAS_SUBTEMAS
+            },
+        },
+        "summary": {
+            "total_pages_processed": paginas,
+            "pages_with_errors": 0,
+            "pages_with_images": com_imagens,
+            "summary_all": gerar_texto(rnd, 400, partes, numero),
+            "structured_summary": {
+                "parties": f"Autores: {partes[0]}, {partes[1]}; Réus: {partes[2]}, {rnd.choice(EMPRESAS)}.",
+                "object": gerar_frase(rnd, 25),
+                "decision": gerar_frase(rnd, 40) if rnd.random() < 0.8 else None,
+                "requests": gerar_frase(rnd, 40),
+                "next_steps_deadlines": f"Prazo para Resposta: {gerar_data(rnd, 2025, 2026)}",
+                "legal_basis": ", ".join(rnd.sample(CITACOES, 4)),
+            },
+            "controversial_points": [gerar_frase(rnd, rnd.randint(15, 35)) for _ in range(pontos)],
+        },
+    }
+
+
+def gravar_processo(destino, **opcoes):
+    """Gera um processo sintético e o grava em destino; devolve o dicionário gerado"""
+    dados = gerar_processo(**opcoes)
+    with open(destino, "w", encoding="utf-8") as f:
+        json.dump(dados, f, ensure_ascii=False)
+    return dados
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("destino", help="arquivo *_resultado.json a gravar")
+    parser.add_argument("--paginas", type=int, default=100)
+    parser.add_argument("--palavras", type=int, default=350, help="média de palavras por página")
+    parser.add_argument("--imagens", type=float, default=0.25, help="proporção de páginas com imagens")
+    parser.add_argument("--subtemas", type=int, default=1, help="itens por categoria de subtema")
+    parser.add_argument("--pontos", type=int, default=10, help="pontos controversos")
+    parser.add_argument("--semente", type=int, default=0)
+    args = parser.parse_args()
+    gravar_processo(args.destino, paginas=args.paginas, palavras=args.palavras, proporcao_imagens=args.imagens,
+                    subtemas=args.subtemas, pontos=args.pontos, semente=args.semente)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+"""Busca textual nas páginas de um processo: índice invertido com ranking BM25"""
+import html
+import json
+import math
+import os
+import re
+import unicodedata
+from collections import Counter
+from functools import lru_cache
+
+from compressao import raiz
+from leitura_incremental import iterar_paginas
+from timbre import com_timbre
+
+# 2: o timbre (cabeçalho e rodapé repetidos) deixou de ser indexado
+VERSAO_INDICE = 2
+SUFIXO_INDICE = ".indice.json"
+
+# Parâmetros do BM25
+K1 = 1.2
+B = 0.75
+
+_palavra = re.compile(r"\w+")
+# Números com pontuação (CPF, CNPJ, número de processo) também viram um token só com os dígitos
+_numero_pontuado = re.compile(r"\d+(?:[./-]\d+)+")
+_token_destaque = re.compile(r"\d+(?:[./-]\d+)+|\w+")
+_diacriticos = re.compile(r"[\u0300-\u036f]")
+
+# Redução de plural e de gênero, na ordem em que são testadas (após remover acentos)
+_SUFIXOS_PLURAL = (("oes", "ao"), ("aes", "ao"), ("ais", "al"), ("eis", "el"), ("ois", "ol"), ("ns", "m"), ("res", "r"), ("is", "il"), ("s", ""))
+_VOGAIS_FINAIS = "aeo"
+
+
+def remover_acentos(texto):
+    """Converte para minúsculas e remove os acentos ("Ação" -> "acao")"""
+    return _diacriticos.sub("", unicodedata.normalize("NFKD", texto.lower()))
+
+
+@lru_cache(maxsize=200_000)
+def radical(palavra):
+    """Stemmer leve para o português: plural e vogal temática final"""
+    if len(palavra) <= 3 or palavra.isdigit():
+        return palavra
+    for sufixo, troca in _SUFIXOS_PLURAL:
+        if palavra.endswith(sufixo) and len(palavra) - len(sufixo) >= 2:
+            palavra = palavra[: len(palavra) - len(sufixo)] + troca
+            break
+    if len(palavra) > 4 and palavra[-1] in _VOGAIS_FINAIS:
+        palavra = palavra[:-1]
+    return palavra
+
+
+def termos(texto):
+    """Termos indexáveis de um texto"""
+    normalizado = remover_acentos(texto)
+    resultado = [radical(p) for p in _palavra.findall(normalizado)]
+    resultado += [re.sub(r"\D", "", n) for n in _numero_pontuado.findall(normalizado)]
+    return resultado
+
+
+def contar_termos(texto):
+    """Dicionário termo -> frequência (mesmo resultado que Counter(termos(texto)))"""
+    normalizado = remover_acentos(texto)
+    contagem = {}
+    # Conta as palavras antes de reduzi-las, para aplicar o stemmer uma vez por palavra distinta
+    for palavra, frequencia in Counter(_palavra.findall(normalizado)).items():
+        termo = radical(palavra)
+        contagem[termo] = contagem.get(termo, 0) + frequencia
+    for numero in _numero_pontuado.findall(normalizado):
+        termo = re.sub(r"\D", "", numero)
+        contagem[termo] = contagem.get(termo, 0) + 1
+    return contagem
+
+
+def texto_pagina(pagina, timbre=None):
+    """Texto pesquisável de uma página, sem as linhas de timbre se ele for informado"""
+    texto = timbre.remover(pagina.extracted_text) if timbre else pagina.extracted_text
+    return "\n".join(t for t in (texto, pagina.extracted_image_text, pagina.summary) if t)
+
+
+class IndiceBusca:
+    """Índice invertido termo -> páginas, com BM25"""
+
+    def __init__(self, page_ids, comprimentos, postings):
+        self.page_ids = page_ids
+        self.comprimentos = comprimentos
+        # termo -> lista plana [posição da página, frequência, posição, frequência, ...]
+        self.postings = postings
+        self.media_comprimento = (sum(comprimentos) / len(comprimentos)) if comprimentos else 0.0
+
+    @classmethod
+    def construir(cls, paginas, remover_timbre=True):
+        """Monta o índice a partir de um iterável de PageResult
+
+        O timbre do processo (ver timbre.py) é detectado nas primeiras
+        páginas e fica fora do índice: o nome do advogado em todas as
+        páginas não deve pesar no ranking nem ocupar postings.
+        """
+        timbre = None
+        if remover_timbre:
+            timbre, paginas = com_timbre(paginas)
+        page_ids = []
+        comprimentos = []
+        postings = {}
+        for posicao, pagina in enumerate(paginas):
+            contagem = contar_termos(texto_pagina(pagina, timbre))
+            page_ids.append(pagina.page_id)
+            comprimentos.append(sum(contagem.values()))
+            for termo, frequencia in contagem.items():
+                lista = postings.get(termo)
+                if lista is None:
+                    postings[termo] = [posicao, frequencia]
+                else:
+                    lista += (posicao, frequencia)
+        return cls(page_ids, comprimentos, postings)
+
+    def buscar(self, consulta, limite=20):
+        """Devolve [(page_id, pontuação)] em ordem decrescente de relevância"""
+        total = len(self.page_ids)
+        if not total:
+            return []
+        pontuacao = {}
+        for termo in set(termos(consulta)):
+            lista = self.postings.get(termo)
+            if not lista:
+                continue
+            df = len(lista) // 2
+            idf = math.log(1 + (total - df + 0.5) / (df + 0.5))
+            for i in range(0, len(lista), 2):
+                posicao, frequencia = lista[i], lista[i + 1]
+                normalizacao = K1 * (1 - B + B * self.comprimentos[posicao] / self.media_comprimento)
+                pontuacao[posicao] = pontuacao.get(posicao, 0.0) + idf * frequencia * (K1 + 1) / (frequencia + normalizacao)
+        melhores = sorted(pontuacao.items(), key=lambda item: item[1], reverse=True)[:limite]
+        return [(self.page_ids[posicao], valor) for posicao, valor in melhores]
+
+    def salvar(self, destino, assinatura):
+        temporario = destino + ".tmp"
+        with open(temporario, "w", encoding="utf-8") as f:
+            json.dump({
+                "versao": VERSAO_INDICE,
+                "assinatura": list(assinatura),
+                "page_ids": self.page_ids,
+                "comprimentos": self.comprimentos,
+                "postings": self.postings,
+            }, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(temporario, destino)
+
+    @classmethod
+    def abrir(cls, origem, assinatura):
+        """Lê um índice salvo; devolve None se ele não corresponder à assinatura"""
+        try:
+            with open(origem, "r", encoding="utf-8") as f:
+                dados = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if dados.get("versao") != VERSAO_INDICE or dados.get("assinatura") != list(assinatura):
+            return None
+        return cls(dados["page_ids"], dados["comprimentos"], dados["postings"])
+
+
+def caminho_indice(caminho_json):
+    """Caminho do índice salvo ao lado do *_resultado.json"""
+    return raiz(caminho_json) + SUFIXO_INDICE
+
+
+def indice_do_arquivo(caminho_json, paginas=None):
+    """Abre o índice salvo do arquivo ou o constrói (e salva) se estiver desatualizado
+
+    paginas é um iterável opcional de PageResult já em memória; sem ele as
+    páginas são lidas do arquivo de forma incremental.
+    """
+    info = os.stat(caminho_json)
+    assinatura = (info.st_mtime_ns, info.st_size)
+    destino = caminho_indice(caminho_json)
+    indice = IndiceBusca.abrir(destino, assinatura)
+    if indice is None:
+        indice = IndiceBusca.construir(paginas if paginas is not None else iterar_paginas(caminho_json))
+        try:
+            indice.salvar(destino, assinatura)
+        except OSError:
+            pass
+    return indice
+
+
+def _ocorrencias(texto, procurados):
+    """Gera (início, fim) das palavras e números do texto que correspondem aos termos procurados"""
+    for ocorrencia in _token_destaque.finditer(texto):
+        token = remover_acentos(ocorrencia.group())
+        if token[0].isdigit() and not token.isdigit():
+            encontrado = re.sub(r"\D", "", token) in procurados or any(p in procurados for p in _palavra.findall(token))
+        else:
+            encontrado = radical(token) in procurados
+        if encontrado:
+            yield ocorrencia.start(), ocorrencia.end()
+
+
+def destacar(texto, consulta, marcados=()):
+    """HTML do texto com os termos da consulta marcados com <mark>
+
+    marcados são trechos (início, fim, título) marcados com <mark class="entidade">,
+    como os identificadores de entidades.py; onde se sobrepõem a um termo, vale o que começa antes.
+    """
+    trechos_marcados = [(inicio, fim, None) for inicio, fim in _ocorrencias(texto, set(termos(consulta or "")))]
+    trechos_marcados.extend(marcados)
+    trechos_marcados.sort(key=lambda trecho: trecho[0])
+    partes = []
+    ultimo = 0
+    for inicio, fim, titulo in trechos_marcados:
+        if inicio < ultimo:
+            continue
+        partes.append(html.escape(texto[ultimo:inicio]))
+        if titulo is None:
+            partes.append(f"<mark>{html.escape(texto[inicio:fim])}</mark>")
+        else:
+            partes.append(f'<mark class="entidade" title="{html.escape(titulo)}">{html.escape(texto[inicio:fim])}</mark>')
+        ultimo = fim
+    partes.append(html.escape(texto[ultimo:]))
+    return "".join(partes)
+
+
+def trechos(texto, consulta, largura=90, maximo=3):
+    """Trechos do texto ao redor das ocorrências da consulta, já destacados"""
+    resultado = []
+    fim_anterior = -1
+    for inicio_ocorrencia, fim_ocorrencia in _ocorrencias(texto, set(termos(consulta))):
+        if inicio_ocorrencia < fim_anterior:
+            continue
+        inicio = max(0, inicio_ocorrencia - largura)
+        fim_anterior = min(len(texto), fim_ocorrencia + largura)
+        trecho = destacar(texto[inicio:fim_anterior], consulta)
+        resultado.append(("…" if inicio else "") + trecho + ("…" if fim_anterior < len(texto) else ""))
+        if len(resultado) >= maximo:
+            break
+    return resultado
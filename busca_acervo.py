@@ -0,0 +1,438 @@
+"""Busca em todos os processos do acervo, persistida em SQLite FTS5"""
+import html
+import os
+import re
+import sqlite3
+import threading
+from contextlib import closing
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+from leitura_incremental import percorrer_resultado
+from modelos import Metadata, PageResult, Summary
+from citacoes import contar_citacoes, normalizar_consulta
+from entidades import contar_entidades, normalizar_entidade
+from timbre import com_timbre
+
+ARQUIVO_BANCO = ".busca_provai.sqlite"
+# PRAGMA user_version do banco; um banco de outra versão é reindexado.
+# 1: extracted_text indexado sem o timbre (cabeçalho e rodapé repetidos)
+# 2: tabela citacoes (citacoes.py)
+# 3: tabela entidades (entidades.py)
+# 4: uma citação por artigo nas listas ("arts. 186 e 927") e "e seguintes"
+# 5: domínio dos e-mails terminado no TLD ("gmail.compor" -> "gmail.com")
+# 6: diploma com ano ("CPC/2015"), "Lei Federal", "ambos do" e tribunais por extenso nas súmulas
+# 7: ".br" mantido nos e-mails grudados na palavra seguinte ("escritorio.com.brpor")
+VERSAO_BANCO = 7
+
+# rowid das páginas = processo_id << BITS_PAGINA | page_id, o que permite
+# remover todas as páginas de um processo por faixa de rowid; page_ids fora
+# de [0, 2**BITS_PAGINA) colidiriam com os de outro processo e são recusados
+BITS_PAGINA = 20
+MASCARA_PAGINA = (1 << BITS_PAGINA) - 1
+
+# Marcadores usados no snippet() antes de escapar o HTML
+_INICIO_DESTAQUE = "\x02"
+_FIM_DESTAQUE = "\x03"
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS processos (
+    id INTEGER PRIMARY KEY,
+    caminho TEXT UNIQUE NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    tamanho INTEGER NOT NULL,
+    process_number TEXT,
+    court TEXT,
+    jurisdiction TEXT,
+    theme TEXT,
+    judge_name TEXT
+);
+CREATE INDEX IF NOT EXISTS processos_court ON processos (court);
+CREATE INDEX IF NOT EXISTS processos_theme ON processos (theme);
+CREATE INDEX IF NOT EXISTS processos_judge_name ON processos (judge_name);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS paginas_fts USING fts5(
+    extracted_text, extracted_image_text, summary,
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS resumos_fts USING fts5(
+    parties, object, decision, requests, next_steps_deadlines, legal_basis,
+    summary_all, controversial_points,
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+
+-- Citações legais normalizadas de cada página (page_id NULL: a base legal do resumo)
+CREATE TABLE IF NOT EXISTS citacoes (
+    citacao TEXT NOT NULL,
+    diploma TEXT NOT NULL,
+    processo_id INTEGER NOT NULL,
+    page_id INTEGER,
+    ocorrencias INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS citacoes_citacao ON citacoes (citacao, processo_id);
+CREATE INDEX IF NOT EXISTS citacoes_diploma ON citacoes (diploma, processo_id);
+CREATE INDEX IF NOT EXISTS citacoes_processo ON citacoes (processo_id);
+
+-- CPF, CNPJ, OAB, número CNJ e e-mail de cada página, na forma padrão. Sem rowid, as
+-- linhas ficam ordenadas pela chave: as páginas de um valor são lidas em sequência
+CREATE TABLE IF NOT EXISTS entidades (
+    valor TEXT NOT NULL,
+    tipo TEXT NOT NULL,
+    processo_id INTEGER NOT NULL,
+    page_id INTEGER NOT NULL,
+    ocorrencias INTEGER NOT NULL,
+    PRIMARY KEY (valor, processo_id, page_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS entidades_processo ON entidades (processo_id);
+"""
+
+
+class ResultadoAcervo(BaseModel):
+    """Página (ou resumo, quando page_id é None) encontrada na busca do acervo"""
+    caminho: str
+    process_number: Optional[str] = None
+    court: Optional[str] = None
+    theme: Optional[str] = None
+    page_id: Optional[int] = None
+    pontuacao: float
+    trecho: str
+
+
+class ProcessoCitante(BaseModel):
+    """Processo que cita uma lei, artigo ou súmula, com as páginas da citação"""
+    caminho: str
+    process_number: Optional[str] = None
+    court: Optional[str] = None
+    theme: Optional[str] = None
+    ocorrencias: int
+    # Páginas em ordem; vazia quando a citação só aparece na base legal do resumo
+    paginas: List[int] = []
+
+
+class ProcessoComEntidade(BaseModel):
+    """Processo em que aparece um CPF, CNPJ, OAB, número de processo ou e-mail"""
+    caminho: str
+    process_number: Optional[str] = None
+    court: Optional[str] = None
+    theme: Optional[str] = None
+    ocorrencias: int
+    paginas: List[int]
+
+
+def consulta_fts(texto):
+    """Converte o texto digitado em uma consulta FTS5 segura
+
+    Trechos entre aspas viram frases; as demais palavras são combinadas com
+    AND implícito. Pontuação ("art. 300") não causa erro de sintaxe.
+    """
+    partes = []
+    for frase, solto in re.findall(r'"([^"]*)"|([^"\s]+)', texto):
+        palavras = re.findall(r"\w+", frase or solto)
+        if palavras:
+            partes.append('"' + " ".join(palavras) + '"')
+    return " ".join(partes)
+
+
+def _trecho_html(trecho):
+    escapado = html.escape(trecho or "")
+    return escapado.replace(_INICIO_DESTAQUE, "<mark>").replace(_FIM_DESTAQUE, "</mark>")
+
+
+class AcervoBusca:
+    """Índice FTS5 do acervo, com ingestão incremental por (mtime, tamanho)"""
+
+    def __init__(self, caminho_banco):
+        self.caminho_banco = caminho_banco
+        self._local = threading.local()
+        # caminho -> ((mtime_ns, tamanho), erro) dos arquivos que falharam: só são
+        # tentados de novo quando a assinatura muda, e não a cada rerun
+        self._falhas = {}
+        with closing(self._conectar()) as conexao:
+            conexao.executescript(_ESQUEMA)
+            if conexao.execute("PRAGMA user_version").fetchone()[0] != VERSAO_BANCO:
+                # Sem as linhas em processos, a próxima sincronização ingere tudo de novo
+                with conexao:
+                    for tabela in ("paginas_fts", "resumos_fts", "citacoes", "entidades", "processos"):
+                        conexao.execute(f"DELETE FROM {tabela}")
+                    conexao.execute(f"PRAGMA user_version = {VERSAO_BANCO}")
+
+    def _conectar(self):
+        conexao = sqlite3.connect(self.caminho_banco, timeout=30)
+        conexao.execute("PRAGMA journal_mode=WAL")
+        conexao.execute("PRAGMA synchronous=NORMAL")
+        return conexao
+
+    def _leitura(self):
+        """Conexão de leitura da thread atual, reaproveitada entre as consultas
+
+        Abrir a conexão e ler o esquema custa mais que uma consulta pela chave
+        (cerca de 0,3 ms contra dezenas de µs); no modo WAL, cada consulta já vê
+        as ingestões confirmadas por outras conexões.
+        """
+        conexao = getattr(self._local, "conexao", None)
+        if conexao is None:
+            conexao = self._local.conexao = self._conectar()
+        return conexao
+
+    def _remover(self, conexao, processo_id):
+        inicio = processo_id << BITS_PAGINA
+        conexao.execute("DELETE FROM paginas_fts WHERE rowid BETWEEN ? AND ?", (inicio, inicio | MASCARA_PAGINA))
+        conexao.execute("DELETE FROM resumos_fts WHERE rowid = ?", (processo_id,))
+        conexao.execute("DELETE FROM citacoes WHERE processo_id = ?", (processo_id,))
+        conexao.execute("DELETE FROM entidades WHERE processo_id = ?", (processo_id,))
+        conexao.execute("DELETE FROM processos WHERE id = ?", (processo_id,))
+
+    def ingerir(self, caminho):
+        """Indexa (ou reindexa) um arquivo, lendo as páginas de forma incremental"""
+        with closing(self._conectar()) as conexao:
+            return self._ingerir(conexao, caminho)
+
+    def _ingerir(self, conexao, caminho):
+        info = os.stat(caminho)
+        with conexao:
+            anterior = conexao.execute("SELECT id FROM processos WHERE caminho = ?", (caminho,)).fetchone()
+            if anterior:
+                self._remover(conexao, anterior[0])
+            processo_id = conexao.execute(
+                "INSERT INTO processos (caminho, mtime_ns, tamanho) VALUES (?, ?, ?)",
+                (caminho, info.st_mtime_ns, info.st_size),
+            ).lastrowid
+
+            topo = {}
+
+            def paginas():
+                for chave, valor, _, _ in percorrer_resultado(caminho):
+                    if chave != "results":
+                        topo[chave] = valor
+                        continue
+                    yield PageResult.model_validate(valor)
+
+            # O timbre fica fora do índice, como na busca do processo (busca.py)
+            timbre, todas = com_timbre(paginas())
+            vistas = set()
+            for pagina in todas:
+                if not 0 <= pagina.page_id <= MASCARA_PAGINA:
+                    raise ValueError(f"page_id {pagina.page_id} fora do intervalo de 0 a {MASCARA_PAGINA}")
+                if pagina.page_id in vistas:
+                    raise ValueError(f"page_id {pagina.page_id} repetido")
+                vistas.add(pagina.page_id)
+                texto = timbre.remover(pagina.extracted_text)
+                conexao.execute(
+                    "INSERT INTO paginas_fts (rowid, extracted_text, extracted_image_text, summary) VALUES (?, ?, ?, ?)",
+                    ((processo_id << BITS_PAGINA) | pagina.page_id, texto, pagina.extracted_image_text, pagina.summary),
+                )
+                self._inserir_citacoes(conexao, processo_id, pagina.page_id, texto)
+                # Identificadores do texto completo: o timbre também identifica o escritório
+                conexao.executemany(
+                    "INSERT INTO entidades (valor, tipo, processo_id, page_id, ocorrencias) VALUES (?, ?, ?, ?, ?)",
+                    [(valor, tipo, processo_id, pagina.page_id, ocorrencias) for (tipo, valor), ocorrencias in
+                     contar_entidades(f"{pagina.extracted_text}\n{pagina.extracted_image_text or ''}").items()],
+                )
+
+            metadados = Metadata.model_validate(topo["metadata"])
+            resumo = Summary.model_validate(topo["summary"])
+            conexao.execute(
+                "UPDATE processos SET process_number = ?, court = ?, jurisdiction = ?, theme = ?, judge_name = ? WHERE id = ?",
+                (metadados.process_number, metadados.court, metadados.jurisdiction, metadados.theme, metadados.judge_name, processo_id),
+            )
+            estruturado = resumo.structured_summary
+            conexao.execute(
+                "INSERT INTO resumos_fts (rowid, parties, object, decision, requests, next_steps_deadlines, legal_basis, summary_all, controversial_points) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (processo_id, estruturado.parties, estruturado.object, estruturado.decision, estruturado.requests,
+                 estruturado.next_steps_deadlines, estruturado.legal_basis, resumo.summary_all, "\n".join(resumo.controversial_points)),
+            )
+            self._inserir_citacoes(conexao, processo_id, None, estruturado.legal_basis)
+        return processo_id
+
+    def _inserir_citacoes(self, conexao, processo_id, page_id, texto):
+        conexao.executemany(
+            "INSERT INTO citacoes (citacao, diploma, processo_id, page_id, ocorrencias) VALUES (?, ?, ?, ?, ?)",
+            [(citacao.texto, citacao.diploma, processo_id, page_id, ocorrencias)
+             for citacao, ocorrencias in contar_citacoes(texto).items()],
+        )
+
+    def remover(self, caminho):
+        with closing(self._conectar()) as conexao, conexao:
+            anterior = conexao.execute("SELECT id FROM processos WHERE caminho = ?", (caminho,)).fetchone()
+            if anterior:
+                self._remover(conexao, anterior[0])
+
+    def _ingerir_ou_registrar(self, conexao, entrada):
+        """Ingere o arquivo da entrada; devolve o erro (e o guarda em _falhas) se ele não puder ser indexado"""
+        try:
+            self._ingerir(conexao, entrada.caminho)
+        # sqlite3.Error: um arquivo problemático não pode derrubar a seção a cada rerun
+        except (OSError, ValueError, KeyError, sqlite3.Error) as e:
+            self._falhas[entrada.caminho] = ((entrada.mtime_ns, entrada.tamanho), str(e))
+            return str(e)
+        self._falhas.pop(entrada.caminho, None)
+        return None
+
+    def sincronizar(self, entradas, ao_progredir=None):
+        """Ingere apenas os arquivos novos ou alterados do catálogo e remove os que sumiram
+
+        Devolve (ingeridos, removidos, falhas), onde falhas é uma lista de (caminho, erro).
+        Arquivos que já falharam com a mesma assinatura voltam em falhas sem nova tentativa.
+        """
+        with closing(self._conectar()) as conexao:
+            indexados = {caminho: (mtime_ns, tamanho) for caminho, mtime_ns, tamanho in
+                         conexao.execute("SELECT caminho, mtime_ns, tamanho FROM processos")}
+            pendentes = [e for e in entradas if indexados.pop(e.caminho, None) != (e.mtime_ns, e.tamanho)]
+            falhas = []
+            for posicao, entrada in enumerate(pendentes, 1):
+                falha = self._falhas.get(entrada.caminho)
+                if falha is None or falha[0] != (entrada.mtime_ns, entrada.tamanho):
+                    erro = self._ingerir_ou_registrar(conexao, entrada)
+                else:
+                    erro = falha[1]
+                if erro is not None:
+                    falhas.append((entrada.caminho, erro))
+                if ao_progredir:
+                    ao_progredir(posicao, len(pendentes))
+            with conexao:
+                for caminho in indexados:
+                    processo_id = conexao.execute("SELECT id FROM processos WHERE caminho = ?", (caminho,)).fetchone()[0]
+                    self._remover(conexao, processo_id)
+            for caminho in set(self._falhas) - {e.caminho for e in entradas}:
+                del self._falhas[caminho]
+        return len(pendentes) - len(falhas), len(indexados), falhas
+
+    def aplicar(self, alteracoes):
+        """Aplica as alterações de uma varredura do vigia (vigia.Alteracoes)
+
+        Arquivos novos ou com conteúdo alterado são reindexados; arquivos só
+        tocados (mesmo conteúdo) têm apenas a assinatura atualizada. Falhas ficam
+        registradas e são informadas pelo próximo sincronizar().
+        """
+        with closing(self._conectar()) as conexao:
+            for entrada in alteracoes.adicionadas + [nova for _, nova in alteracoes.alteradas]:
+                self._ingerir_ou_registrar(conexao, entrada)
+            with conexao:
+                for entrada in alteracoes.removidas:
+                    anterior = conexao.execute("SELECT id FROM processos WHERE caminho = ?", (entrada.caminho,)).fetchone()
+                    if anterior:
+                        self._remover(conexao, anterior[0])
+                conexao.executemany(
+                    "UPDATE processos SET mtime_ns = ?, tamanho = ? WHERE caminho = ? AND mtime_ns = ? AND tamanho = ?",
+                    [(nova.mtime_ns, nova.tamanho, nova.caminho, anterior.mtime_ns, anterior.tamanho)
+                     for anterior, nova in alteracoes.tocadas],
+                )
+
+    def valores_filtro(self, coluna):
+        """Valores distintos de court, theme ou judge_name, para os filtros"""
+        if coluna not in ("court", "theme", "judge_name"):
+            raise ValueError(coluna)
+        return [v for (v,) in self._leitura().execute(f"SELECT DISTINCT {coluna} FROM processos WHERE {coluna} IS NOT NULL ORDER BY 1")]
+
+    def _filtros(self, court, theme, judge_name):
+        condicoes = []
+        parametros = []
+        for coluna, valor in (("court", court), ("theme", theme), ("judge_name", judge_name)):
+            if valor:
+                condicoes.append(f"p.{coluna} = ?")
+                parametros.append(valor)
+        return "".join(f" AND {c}" for c in condicoes), parametros
+
+    def buscar(self, texto, court=None, theme=None, judge_name=None, limite=50) -> List[ResultadoAcervo]:
+        """Busca nas páginas de todos os processos, em ordem de relevância (BM25)"""
+        consulta = consulta_fts(texto)
+        if not consulta:
+            return []
+        filtros, parametros = self._filtros(court, theme, judge_name)
+        linhas = self._leitura().execute(
+            f"""
+            SELECT p.caminho, p.process_number, p.court, p.theme, f.rowid & {MASCARA_PAGINA},
+                   bm25(paginas_fts) AS pontuacao,
+                   snippet(paginas_fts, -1, ?, ?, '…', 16)
+            FROM paginas_fts AS f JOIN processos AS p ON p.id = (f.rowid >> {BITS_PAGINA})
+            WHERE paginas_fts MATCH ?{filtros}
+            ORDER BY pontuacao LIMIT ?
+            """,
+            (_INICIO_DESTAQUE, _FIM_DESTAQUE, consulta, *parametros, limite),
+        ).fetchall()
+        return [
+            ResultadoAcervo(caminho=c, process_number=n, court=t, theme=m, page_id=pid, pontuacao=-s, trecho=_trecho_html(tr))
+            for c, n, t, m, pid, s, tr in linhas
+        ]
+
+    def buscar_resumos(self, texto, court=None, theme=None, judge_name=None, limite=50) -> List[ResultadoAcervo]:
+        """Busca nos resumos estruturados dos processos"""
+        consulta = consulta_fts(texto)
+        if not consulta:
+            return []
+        filtros, parametros = self._filtros(court, theme, judge_name)
+        linhas = self._leitura().execute(
+            f"""
+            SELECT p.caminho, p.process_number, p.court, p.theme,
+                   bm25(resumos_fts) AS pontuacao,
+                   snippet(resumos_fts, -1, ?, ?, '…', 16)
+            FROM resumos_fts AS r JOIN processos AS p ON p.id = r.rowid
+            WHERE resumos_fts MATCH ?{filtros}
+            ORDER BY pontuacao LIMIT ?
+            """,
+            (_INICIO_DESTAQUE, _FIM_DESTAQUE, consulta, *parametros, limite),
+        ).fetchall()
+        return [
+            ResultadoAcervo(caminho=c, process_number=n, court=t, theme=m, pontuacao=-s, trecho=_trecho_html(tr))
+            for c, n, t, m, s, tr in linhas
+        ]
+
+    def processos_citando(self, consulta, court=None, theme=None, judge_name=None, limite=100) -> List[ProcessoCitante]:
+        """Processos que citam uma lei, artigo ou súmula, dos que mais citam aos que menos citam
+
+        A consulta é normalizada como as citações dos textos: "lei 8245" e
+        "Lei nº 8.245/91" trazem todos os processos que citam a lei, em
+        qualquer artigo; "art. 300 do CPC", só os que citam esse artigo.
+        """
+        chave = normalizar_consulta(consulta)
+        if not chave:
+            return []
+        filtros, parametros = self._filtros(court, theme, judge_name)
+        linhas = self._leitura().execute(
+            f"""
+            SELECT p.caminho, p.process_number, p.court, p.theme, SUM(c.ocorrencias) AS total,
+                   GROUP_CONCAT(DISTINCT c.page_id)
+            FROM citacoes AS c JOIN processos AS p ON p.id = c.processo_id
+            WHERE (c.citacao = ? OR c.diploma = ?){filtros}
+            GROUP BY c.processo_id
+            ORDER BY total DESC, p.caminho LIMIT ?
+            """,
+            (chave, chave, *parametros, limite),
+        ).fetchall()
+        return [
+            ProcessoCitante(caminho=c, process_number=n, court=t, theme=m, ocorrencias=total,
+                            paginas=sorted(int(pid) for pid in (paginas or "").split(",") if pid))
+            for c, n, t, m, total, paginas in linhas
+        ]
+
+    def processos_com_entidade(self, consulta, court=None, theme=None, judge_name=None, limite=100) -> List[ProcessoComEntidade]:
+        """Processos em que aparece o CPF, CNPJ, OAB, número de processo ou e-mail da consulta
+
+        A consulta é normalizada como os textos ("16788643000181" e
+        "16.788.643/0001-81" são o mesmo CNPJ); sem um identificador válido,
+        não há resultado. A busca percorre só as linhas do valor na chave da
+        tabela, qualquer que seja o tamanho do acervo.
+        """
+        entidade = normalizar_entidade(consulta)
+        if not entidade:
+            return []
+        filtros, parametros = self._filtros(court, theme, judge_name)
+        linhas = self._leitura().execute(
+            f"""
+            SELECT p.caminho, p.process_number, p.court, p.theme, SUM(e.ocorrencias) AS total,
+                   GROUP_CONCAT(e.page_id)
+            FROM entidades AS e JOIN processos AS p ON p.id = e.processo_id
+            WHERE e.valor = ?{filtros}
+            GROUP BY e.processo_id
+            ORDER BY total DESC, p.caminho LIMIT ?
+            """,
+            (entidade[1], *parametros, limite),
+        ).fetchall()
+        return [
+            ProcessoComEntidade(caminho=c, process_number=n, court=t, theme=m, ocorrencias=total,
+                                paginas=sorted(int(pid) for pid in paginas.split(",")))
+            for c, n, t, m, total, paginas in linhas
+        ]
@@ -0,0 +1,185 @@
+"""Citações legais nos textos: extração e normalização
+
+Uma única expressão, compilada uma vez, reconhece as três formas mais
+comuns nas peças e as normaliza, para que "art. 300 do CPC", "artigo 300
+do Código de Processo Civil" e "art. 300, caput, do CPC" contem como a
+mesma citação:
+
+- artigos de um código ou lei: "Art. 300 do CPC", "Art. 3 da Lei 8.245"
+  (incisos, parágrafos e alíneas são descartados); "arts. 186 e 927 do
+  Código Civil" vira uma citação por artigo, e "art. 98 e seguintes do
+  CPC" (ou "ss.") conta como "Art. 98 do CPC";
+  O ano depois do diploma ("CPC/2015", "CC/02", "CF/88") não entra na chave;
+- leis: "Lei 8.245", "Lei Federal 8.245", "LC 123" (o ano, quando citado,
+  não entra na chave: a numeração das leis federais não se repete; as
+  estaduais ficam como "Lei Estadual 1.234");
+- súmulas: "Súmula 479 do STJ" (também "do E. STJ" e "do Superior Tribunal
+  de Justiça"), "Súmula Vinculante 10".
+
+Cada citação tem também o diploma citado ("CPC", "Lei 8.245", a própria
+súmula), que permite perguntar por todos os processos que citam uma lei,
+qualquer que seja o artigo.
+"""
+import re
+from collections import Counter
+from typing import Dict, NamedTuple
+
+from busca import remover_acentos
+from timbre import com_timbre
+
+# Forma por extenso (sem acentos, em minúsculas) ou sigla -> sigla normalizada
+_DIPLOMAS = {
+    "codigo de processo civil": "CPC", "cpc": "CPC",
+    "codigo de defesa do consumidor": "CDC", "cdc": "CDC",
+    "codigo civil": "CC", "cc": "CC",
+    "constituicao federal": "CF", "constituicao da republica": "CF", "constituicao": "CF",
+    "cf": "CF", "crfb": "CF",
+    "consolidacao das leis do trabalho": "CLT", "clt": "CLT",
+    "codigo de processo penal": "CPP", "cpp": "CPP",
+    "codigo penal": "CP", "cp": "CP",
+    "codigo tributario nacional": "CTN", "ctn": "CTN",
+    "estatuto da crianca e do adolescente": "ECA", "eca": "ECA",
+}
+# Tribunais por extenso (sem acentos, em minúsculas) -> sigla; as demais siglas ficam como estão
+_TRIBUNAIS = {
+    "superior tribunal de justica": "STJ", "supremo tribunal federal": "STF",
+    "tribunal superior do trabalho": "TST", "tribunal superior eleitoral": "TSE",
+}
+# Diplomas femininos: "Art. 5 da CF", "Art. 3 da Lei 8.245"
+_FEMININOS = {"CF", "CLT"}
+
+_DIPLOMA = (
+    r"c[oó]digo\s+de\s+processo\s+civil|c[oó]digo\s+de\s+defesa\s+do\s+consumidor|c[oó]digo\s+de\s+processo\s+penal"
+    r"|c[oó]digo\s+tribut[aá]rio\s+nacional|c[oó]digo\s+civil|c[oó]digo\s+penal"
+    r"|constitui[cç][aã]o(?:\s+federal|\s+da\s+rep[uú]blica)?|consolida[cç][aã]o\s+das\s+leis\s+do\s+trabalho"
+    r"|estatuto\s+da\s+crian[cç]a\s+e\s+do\s+adolescente|crfb|cf|cpc|cdc|cpp|cp|cc|clt|ctn|eca"
+)
+# Ano depois da sigla ou do nome: "CPC/2015", "CC/02", "CF/88"
+_ANO = r"(?:\s*/\s*\d{2}(?:\d{2})?)?"
+_TRIBUNAL = (
+    r"superior\s+tribunal\s+de\s+justi[cç]a|supremo\s+tribunal\s+federal|tribunal\s+superior\s+do\s+trabalho"
+    r"|tribunal\s+superior\s+eleitoral|st[jf]|tst|tse|tj-?[a-z]{2}"
+)
+_NUMERO = r"(?:n[º°o]?\.?\s*)?"
+
+
+def _padrao_lei(tipo, numero):
+    """Trecho da expressão para "Lei (Federal) nº 8.245/91", com grupos nomeados tipo e numero"""
+    return rf"(?P<{tipo}>lei(?:\s+(?:complementar|federal|estadual)){{0,2}}|lc)\s*{_NUMERO}(?P<{numero}>\d{{1,3}}(?:\.\d{{3}})+|\d+)(?:\s*/\s*\d{{2,4}})?"
+
+
+# Complementos do artigo (parágrafo, inciso, alínea, caput), descartados na normalização.
+# Com "§§" a lista é de parágrafos ("§§ 1º e 2º"); com um "§" só, "e 37" é outro artigo
+_COMPLEMENTO = (
+    r"(?:\s*,?\s*(?:§§\s*\d+\s*[º°o]?(?:\s*(?:,|e)\s*\d+\s*[º°o]?)*|§\s*\d+\s*[º°o]?|par[aá]grafo\s+[uú]nico"
+    r"|(?:inciso\s+)?[ivxlc]+(?!\w)|(?:al[ií]nea\s+)?[\"“]?[a-z][\"”]?(?!\w)|caput))*"
+)
+# Um artigo de uma lista: número, ordinal, letra ("art. 1.022-a") e complementos
+_ARTIGO = rf"\d+(?:\.\d{{3}})*\s*(?:[º°o](?!\w))?(?:-?[a-z](?!\w))?{_COMPLEMENTO}"
+_artigo = re.compile(rf"(?P<numero>\d+(?:\.\d{{3}})*)\s*(?:[º°o](?!\w))?(?:-?[a-z](?!\w))?{_COMPLEMENTO}")
+
+# Aplicada ao texto já em minúsculas: sem IGNORECASE a varredura é cerca de 25% mais rápida
+_citacao = re.compile(
+    rf"\bart(?:igo)?s?\.?\s*(?P<artigo>{_ARTIGO}(?:(?:\s*,\s*(?:e\s+)?|\s+e\s+){_ARTIGO})*)"
+    rf"(?:\s*,?\s*(?:e\s+)?(?:seguintes|ss\.?)(?!\w))?"
+    rf"\s*,?\s*(?:amb[oa]s\s+)?(?:d[oa]s?\s+)?(?:(?P<diploma>{_DIPLOMA}){_ANO}(?![\w/])|{_padrao_lei('lei_artigo', 'numero_artigo')})"
+    rf"|\b{_padrao_lei('lei', 'numero')}"
+    rf"|\bs[uú]mula\s+(?P<vinculante>vinculante\s+)?{_NUMERO}(?P<sumula>\d+)"
+    rf"(?:\s*,?\s*(?:d[oa]\s+)?(?:(?:colendo|egr[eé]gio|[ce]\.)\s*)?(?P<tribunal>{_TRIBUNAL})(?!\w))?"
+)
+
+
+class Citacao(NamedTuple):
+    """Citação normalizada e o diploma citado"""
+    texto: str
+    diploma: str
+
+
+def _numero(numero):
+    """Número com separador de milhar: "8245" e "8.245" -> "8.245" """
+    digitos = numero.replace(".", "").lstrip("0") or "0"
+    grupos = []
+    while len(digitos) > 3:
+        grupos.insert(0, digitos[-3:])
+        digitos = digitos[:-3]
+    return ".".join([digitos] + grupos)
+
+
+def _lei(tipo, numero):
+    prefixo = "LC" if tipo == "lc" or "complementar" in tipo else "Lei"
+    if "estadual" in tipo:
+        prefixo += " Estadual"
+    return f"{prefixo} {_numero(numero)}"
+
+
+def _normalizar(ocorrencia):
+    """Citações de uma ocorrência: uma por artigo de uma lista ("arts. 186 e 927"), senão uma só"""
+    grupos = ocorrencia.groupdict()
+    if grupos["artigo"]:
+        if grupos["diploma"]:
+            diploma = _DIPLOMAS[" ".join(remover_acentos(grupos["diploma"]).split())]
+        else:
+            diploma = _lei(grupos["lei_artigo"], grupos["numero_artigo"])
+        preposicao = "da" if diploma in _FEMININOS or not diploma.isupper() else "do"
+        # Cada item da lista, com os complementos dele: os números de "§§ 1º e 2º" não viram artigos
+        artigos = dict.fromkeys(_numero(artigo.group("numero")) for artigo in _artigo.finditer(grupos["artigo"]))
+        return [Citacao(f"Art. {artigo} {preposicao} {diploma}", diploma) for artigo in artigos]
+    if grupos["numero"]:
+        lei = _lei(grupos["lei"], grupos["numero"])
+        return [Citacao(lei, lei)]
+    if grupos["vinculante"]:
+        sumula = f"Súmula Vinculante {int(grupos['sumula'])}"
+    elif grupos["tribunal"]:
+        tribunal = " ".join(remover_acentos(grupos["tribunal"]).split())
+        sumula = f"Súmula {int(grupos['sumula'])} do {_TRIBUNAIS.get(tribunal) or tribunal.upper().replace('-', '')}"
+    else:
+        sumula = f"Súmula {int(grupos['sumula'])}"
+    return [Citacao(sumula, sumula)]
+
+
+def extrair_citacoes(texto):
+    """Citações normalizadas do texto, na ordem em que aparecem"""
+    return [citacao for ocorrencia in _citacao.finditer((texto or "").lower()) for citacao in _normalizar(ocorrencia)]
+
+
+def contar_citacoes(texto):
+    """Counter Citacao -> ocorrências no texto"""
+    return Counter(extrair_citacoes(texto))
+
+
+def normalizar_consulta(consulta):
+    """Chave de busca de uma citação digitada: a citação normalizada ou, sem ela, o próprio texto"""
+    citacoes = extrair_citacoes(consulta)
+    return citacoes[0].texto if citacoes else " ".join(consulta.split())
+
+
+class CitacoesProcesso:
+    """Citações das páginas de um processo: citação -> {page_id: ocorrências}"""
+
+    def __init__(self, paginas_por_citacao: Dict[Citacao, Dict[int, int]]):
+        # Mais citadas primeiro
+        self.paginas = dict(sorted(paginas_por_citacao.items(), key=lambda item: (-sum(item[1].values()), item[0].texto)))
+
+    @classmethod
+    def construir(cls, paginas):
+        """Extrai as citações de um iterável de PageResult, sem o timbre (como no acervo)"""
+        timbre, paginas = com_timbre(paginas)
+        paginas_por_citacao = {}
+        for pagina in paginas:
+            for citacao, ocorrencias in contar_citacoes(timbre.remover(pagina.extracted_text)).items():
+                paginas_por_citacao.setdefault(citacao, {})[pagina.page_id] = ocorrencias
+        return cls(paginas_por_citacao)
+
+    def __len__(self):
+        return len(self.paginas)
+
+    def contagens(self):
+        """[(citação, diploma, ocorrências, páginas)] das mais citadas às menos citadas"""
+        return [(citacao.texto, citacao.diploma, sum(paginas.values()), len(paginas)) for citacao, paginas in self.paginas.items()]
+
+    def paginas_da(self, texto):
+        """page_ids (em ordem) das páginas que trazem a citação"""
+        for citacao, paginas in self.paginas.items():
+            if citacao.texto == texto:
+                return sorted(paginas)
+        return []
@@ -0,0 +1,285 @@
+"""Arquivos de resultado compactados: .json.gz, .json.xz e o formato em blocos .jsonz
+
+.json.gz e .json.xz são o JSON inteiro compactado: ocupam menos disco, mas
+qualquer leitura descompacta o arquivo desde o início. No formato em
+blocos, cada página é compactada sozinha (zlib, com um dicionário comum
+tirado das primeiras páginas), então uma página é lida sem descompactar
+as demais:
+
+    cabeçalho fixo | dicionário | blocos das páginas | índice | topo compactado
+
+O índice tem um registro (page_id, posição, tamanho) por página e o topo
+guarda file, metadata e summary. Cada bloco é o JSON da página, como
+aparece em "results".
+"""
+import gzip
+import io
+import json
+import lzma
+import mmap
+import os
+import shutil
+import struct
+import zlib
+from collections.abc import Sequence
+
+from modelos import FileInfo, Metadata, PageResult, ProcessoJudicial, Summary
+
+EXTENSAO_BLOCOS = ".jsonz"
+_EXTENSOES_COMPACTADAS = {".json.gz": gzip, ".json.xz": lzma}
+EXTENSOES_RESULTADO = (".json", *_EXTENSOES_COMPACTADAS, EXTENSAO_BLOCOS)
+SUFIXOS_RESULTADO = tuple("_resultado" + extensao for extensao in EXTENSOES_RESULTADO)
+
+ASSINATURA_BLOCOS = b"PROVAIZ1"
+# assinatura, número de páginas, posição e tamanho do dicionário, posição do índice, posição e tamanho do topo
+_CABECALHO = struct.Struct("<8sIQIQQI")
+# page_id, posição e tamanho do bloco
+_REGISTRO = struct.Struct("<IQI")
+
+# Bytes das primeiras páginas usados como dicionário comum dos blocos (zlib aceita até 32 KB)
+TAMANHO_DICIONARIO = 32 * 1024
+NIVEL_ZLIB = 9
+
+
+def e_resultado(nome):
+    """Indica se o nome é de um arquivo de resultado da ProvAI, compactado ou não"""
+    return nome.endswith(SUFIXOS_RESULTADO)
+
+
+def extensao(caminho):
+    """Extensão de resultado do caminho (".json", ".json.gz", ".json.xz" ou ".jsonz")"""
+    for candidata in (*_EXTENSOES_COMPACTADAS, EXTENSAO_BLOCOS, ".json"):
+        if caminho.endswith(candidata):
+            return candidata
+    return ""
+
+
+def raiz(caminho):
+    """Caminho sem a extensão de resultado, base dos artefatos gravados ao lado do arquivo"""
+    return caminho.removesuffix(extensao(caminho))
+
+
+def compactado(caminho):
+    """Indica se o arquivo é um JSON compactado por inteiro (.json.gz ou .json.xz)"""
+    return extensao(caminho) in _EXTENSOES_COMPACTADAS
+
+
+def em_blocos(caminho):
+    return caminho.endswith(EXTENSAO_BLOCOS)
+
+
+def descompactar(caminho, dados):
+    """JSON do resultado a partir dos bytes do arquivo, conforme a extensão do caminho"""
+    modulo = _EXTENSOES_COMPACTADAS.get(extensao(caminho))
+    if modulo is not None:
+        return modulo.decompress(dados)
+    if em_blocos(caminho):
+        return _Blocos(dados).json()
+    return dados
+
+
+def ler_bytes(caminho):
+    """Bytes do JSON do resultado, já descompactados"""
+    with open(caminho, "rb") as f:
+        return descompactar(caminho, f.read())
+
+
+def abrir(caminho):
+    """Abre o arquivo de resultado para leitura sequencial dos bytes do JSON"""
+    modulo = _EXTENSOES_COMPACTADAS.get(extensao(caminho))
+    if modulo is not None:
+        return modulo.open(caminho, "rb")
+    if em_blocos(caminho):
+        return io.BytesIO(ler_bytes(caminho))
+    return open(caminho, "rb")
+
+
+def gravar_compactado(destino, origem):
+    """Grava o JSON de origem (em qualquer formato) compactado por inteiro, conforme a extensão do destino"""
+    temporario = destino + ".tmp"
+    with abrir(origem) as entrada, _EXTENSOES_COMPACTADAS[extensao(destino)].open(temporario, "wb") as saida:
+        shutil.copyfileobj(entrada, saida, 1024 * 1024)
+    os.replace(temporario, destino)
+    return destino
+
+
+class _Blocos:
+    """Leitura dos blocos de um arquivo .jsonz a partir de um buffer (bytes ou mmap)"""
+
+    def __init__(self, dados):
+        self._dados = memoryview(dados)
+        assinatura, self.total, posicao_dicionario, tamanho_dicionario, posicao_indice, self._posicao_topo, self._tamanho_topo = (
+            _CABECALHO.unpack_from(self._dados, 0)
+        )
+        if assinatura != ASSINATURA_BLOCOS:
+            raise ValueError(f"arquivo {EXTENSAO_BLOCOS} inválido")
+        self.dicionario = bytes(self._dados[posicao_dicionario:posicao_dicionario + tamanho_dicionario])
+        self._posicao_indice = posicao_indice
+
+    def registro(self, indice):
+        """(page_id, posição, tamanho) do bloco da página na posição indice"""
+        return _REGISTRO.unpack_from(self._dados, self._posicao_indice + indice * _REGISTRO.size)
+
+    def bloco(self, indice):
+        """JSON da página na posição indice, descompactado"""
+        _, posicao, tamanho = self.registro(indice)
+        descompressor = zlib.decompressobj(zdict=self.dicionario)
+        return descompressor.decompress(self._dados[posicao:posicao + tamanho]) + descompressor.flush()
+
+    def topo(self):
+        """JSON (bytes) com file, metadata e summary"""
+        return zlib.decompress(self._dados[self._posicao_topo:self._posicao_topo + self._tamanho_topo])
+
+    def json(self):
+        """O resultado completo como JSON, com as páginas em "results" """
+        paginas = b",".join(self.bloco(i) for i in range(self.total))
+        return b'{"results":[' + paginas + b"]," + self.topo()[1:]
+
+    def liberar(self):
+        self._dados.release()
+
+
+def percorrer_blocos(caminho):
+    """Gera (chave, valor, inicio, fim) como leitura_incremental.percorrer_resultado
+
+    inicio e fim são a posição e o fim do bloco compactado de cada página.
+    """
+    with open(caminho, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+        blocos = _Blocos(mapa)
+        try:
+            for indice in range(blocos.total):
+                _, posicao, tamanho = blocos.registro(indice)
+                yield "results", json.loads(blocos.bloco(indice)), posicao, posicao + tamanho
+            for chave, valor in json.loads(blocos.topo()).items():
+                yield chave, valor, 0, 0
+        finally:
+            blocos.liberar()
+
+
+def ler_topo_blocos(caminho):
+    """file, metadata e summary de um arquivo .jsonz, sem ler as páginas"""
+    with open(caminho, "rb") as f:
+        cabecalho = f.read(_CABECALHO.size)
+        *_, posicao_topo, tamanho_topo = _CABECALHO.unpack(cabecalho)
+        f.seek(posicao_topo)
+        return json.loads(zlib.decompress(f.read(tamanho_topo)))
+
+
+def gravar_blocos(destino, itens):
+    """Grava um arquivo .jsonz a partir de pares (chave, valor) do resultado
+
+    itens vem de leitura_incremental.percorrer_resultado: cada página chega
+    separada, com a chave "results", e só as páginas do dicionário ficam em
+    memória ao mesmo tempo.
+    """
+    temporario = destino + ".tmp"
+    topo = {}
+    registros = []
+    pendentes = []
+    dicionario = None
+
+    with open(temporario, "wb") as f:
+        f.write(b"\0" * _CABECALHO.size)
+
+        def gravar_pagina(page_id, dados):
+            compressor = zlib.compressobj(NIVEL_ZLIB, zdict=dicionario)
+            bloco = compressor.compress(dados) + compressor.flush()
+            registros.append(_REGISTRO.pack(page_id, f.tell(), len(bloco)))
+            f.write(bloco)
+
+        for chave, valor, *_ in itens:
+            if chave != "results":
+                topo[chave] = valor
+                continue
+            dados = json.dumps(valor, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+            if dicionario is not None:
+                gravar_pagina(valor["page_id"], dados)
+                continue
+            pendentes.append((valor["page_id"], dados))
+            if sum(len(d) for _, d in pendentes) >= TAMANHO_DICIONARIO:
+                dicionario = _gravar_dicionario(f, pendentes)
+                for page_id, dados_pendentes in pendentes:
+                    gravar_pagina(page_id, dados_pendentes)
+                pendentes.clear()
+
+        # Processo pequeno: o dicionário são todas as páginas
+        if dicionario is None:
+            dicionario = _gravar_dicionario(f, pendentes)
+            for page_id, dados_pendentes in pendentes:
+                gravar_pagina(page_id, dados_pendentes)
+
+        posicao_indice = f.tell()
+        f.write(b"".join(registros))
+
+        # Valida o topo antes de gravar, para não produzir um arquivo inutilizável
+        ProcessoJudicial.model_validate({**topo, "results": []})
+        dados_topo = zlib.compress(json.dumps(topo, ensure_ascii=False).encode("utf-8"), NIVEL_ZLIB)
+        posicao_topo = f.tell()
+        f.write(dados_topo)
+
+        f.seek(0)
+        # O dicionário é sempre gravado logo depois do cabeçalho, antes do primeiro bloco
+        f.write(_CABECALHO.pack(ASSINATURA_BLOCOS, len(registros), _CABECALHO.size, len(dicionario),
+                                posicao_indice, posicao_topo, len(dados_topo)))
+
+    os.replace(temporario, destino)
+    return destino
+
+
+def _gravar_dicionario(f, paginas):
+    """Grava o dicionário comum (fim das primeiras páginas, a parte mais útil para o zlib)"""
+    dicionario = b"".join(dados for _, dados in paginas)[-TAMANHO_DICIONARIO:]
+    f.write(dicionario)
+    return dicionario
+
+
+class PaginasEmBlocos(Sequence):
+    """Páginas de um arquivo .jsonz, descompactadas uma a uma ao serem abertas
+
+    Funciona como a lista processo.results e como a fonte de páginas do
+    navegador (obter por page_id). Só o índice e o dicionário ficam em memória.
+    """
+
+    indexacao_concluida = True
+    progresso = 1.0
+    erro_indexacao = None
+
+    def __init__(self, caminho):
+        self.caminho = caminho
+        with open(caminho, "rb") as f:
+            self._mapa = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._blocos = _Blocos(self._mapa)
+        self._posicoes = {self._blocos.registro(i)[0]: i for i in range(self._blocos.total)}
+
+        topo = json.loads(self._blocos.topo())
+        self.processo = ProcessoJudicial.model_construct(
+            file=FileInfo.model_validate(topo["file"]),
+            metadata=Metadata.model_validate(topo["metadata"]),
+            summary=Summary.model_validate(topo["summary"]),
+            results=self,
+        )
+
+    @property
+    def bytes_residentes(self):
+        """Memória aproximada: índice por page_id e dicionário"""
+        return len(self._posicoes) * 100 + len(self._blocos.dicionario)
+
+    def __len__(self):
+        return self._blocos.total
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return [self[i] for i in range(*indice.indices(len(self)))]
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError(indice)
+        return PageResult.model_validate_json(self._blocos.bloco(indice))
+
+    def obter(self, page_id, direcao=1):
+        indice = self._posicoes.get(page_id)
+        return None if indice is None else self[indice]
+
+    def fechar(self):
+        self._blocos.liberar()
+        self._mapa.close()
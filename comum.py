@@ -0,0 +1,529 @@
+"""Recursos compartilhados pelo aplicativo e pelas seções: estilo, componentes HTML e caches"""
+import os
+import re
+from typing import NamedTuple
+
+import streamlit as st
+
+from armazem import ArmazemProcessos, LIMIAR_SOB_DEMANDA_MB, LIMITE_PADRAO_MB, abrir_documento
+from corpus import hash_arquivo
+from instantaneos import DIRETORIO_PADRAO as DIRETORIO_PADRAO_INSTANTANEOS, remover_instantaneo
+from instrumentacao import cronometrar, fase
+from vigia import INTERVALO_PADRAO, VigiaAcervo
+
+
+class Secao(NamedTuple):
+    """Seção do aplicativo: um arquivo em secoes/, executado só quando a seção está ativa"""
+    arquivo: str
+    titulo: str
+    icone: str
+
+
+SECOES = [
+    Secao("secoes/resumo.py", "Resumo do Processo", "📝"),
+    Secao("secoes/metadados.py", "Metadados", "🔍"),
+    Secao("secoes/resultados.py", "Resultados por Página", "📄"),
+    Secao("secoes/busca_processo.py", "Busca no Processo", "🔎"),
+    Secao("secoes/acervo.py", "Busca no Acervo", "🗂️"),
+    Secao("secoes/prazos.py", "Calendário de Prazos", "📅"),
+    Secao("secoes/pontos.py", "Pontos Controversos", "⚠️"),
+    Secao("secoes/analise.py", "Análise Textual", "📊"),
+    Secao("secoes/conceitos.py", "Conceitos dos Campos", "📘"),
+]
+
+# CSS personalizado para estilização
+_CSS = """
+<style>
+    /* Cores e Tema */
+    :root {
+        --main-color: #304080;
+        --accent-color: #5060C0;
+        --light-color: #E7ECFF;
+        --dark-color: #21295C;
+        --success-color: #4CAF50;
+        --warning-color: #FF9800;
+        --danger-color: #E57373;
+        --info-color: #64B5F6;
+    }
+    
+    /* Estilo geral da página */
+    .main .block-container {
+        padding-top: 2rem;
+        padding-bottom: 2rem;
+    }
+    
+    /* Cabeçalhos */
+    h1 {
+        color: var(--main-color);
+        font-family: 'Georgia', serif;
+        font-weight: 700;
+        padding-bottom: 1rem;
+        border-bottom: 2px solid var(--accent-color);
+        margin-bottom: 1.5rem;
+    }
+    
+    h2, h3, h4 {
+        color: var(--dark-color);
+        font-family: 'Georgia', serif;
+        font-weight: 600;
+        margin-top: 1.5rem;
+        margin-bottom: 1rem;
+    }
+    
+    /* Barra lateral */
+    .sidebar .sidebar-content {
+        background-color: var(--light-color);
+    }
+    
+    /* Cards personalizados */
+    .card {
+        background-color: white;
+        border-radius: 12px;
+        padding: 1.5rem;
+        box-shadow: 0 4px 12px rgba(0, 0, 0, 0.05);
+        margin-bottom: 1.5rem;
+        border-left: 5px solid var(--main-color);
+    }
+    
+    .card-header {
+        color: var(--main-color);
+        font-weight: 600;
+        font-size: 1.2rem;
+        margin-bottom: 1rem;
+    }
+    
+    /* Estilo para informações importantes */
+    .destaque {
+        background-color: var(--light-color);
+        padding: 1rem;
+        border-radius: 8px;
+        margin: 1rem 0;
+    }
+    
+    /* Badges para status */
+    .badge {
+        display: inline-block;
+        padding: 0.25rem 0.5rem;
+        border-radius: 8px;
+        font-size: 0.8rem;
+        font-weight: 600;
+        margin-right: 0.5rem;
+    }
+    
+    .badge-success {
+        background-color: var(--success-color);
+        color: white;
+    }
+    
+    .badge-warning {
+        background-color: var(--warning-color);
+        color: white;
+    }
+    
+    .badge-danger {
+        background-color: var(--danger-color);
+        color: white;
+    }
+    
+    .badge-info {
+        background-color: var(--info-color);
+        color: white;
+    }
+    
+    /* Estilização de tabelas */
+    .dataframe {
+        border-radius: 10px !important;
+        overflow: hidden;
+        border: none !important;
+    }
+    
+    .dataframe thead th {
+        background-color: var(--main-color) !important;
+        color: white !important;
+        font-weight: 600 !important;
+    }
+    
+    .dataframe tbody tr:nth-child(even) {
+        background-color: var(--light-color) !important;
+    }
+    
+    /* Estilização de caixas de texto */
+    .stTextArea textarea, .stTextInput input {
+        border-radius: 8px;
+        border: 1px solid #DFE3E8;
+    }
+    
+    /* Personalização de expandables */
+    .streamlit-expanderHeader {
+        font-weight: 600;
+        color: var(--main-color);
+    }
+    
+    /* Personalização dos botões principais */
+    .stButton button {
+        border-radius: 8px;
+        background-color: var(--main-color);
+        color: white;
+        font-weight: 600;
+        padding: 0.5rem 1rem;
+        border: none;
+        transition: all 0.3s;
+    }
+    
+    .stButton button:hover {
+        background-color: var(--dark-color);
+        box-shadow: 0 4px 8px rgba(33, 41, 92, 0.2);
+    }
+    
+    /* Melhora seletores */
+    .stSelectbox div[data-baseweb="select"] {
+        border-radius: 8px;
+    }
+    
+    /* Personaliza contadores e métricas */
+    [data-testid="stMetricValue"] {
+        font-size: 2rem !important;
+        font-weight: 700 !important;
+        color: var(--main-color) !important;
+    }
+    
+    [data-testid="stMetricLabel"] {
+        font-size: 1rem !important;
+        font-weight: 600 !important;
+    }
+    
+    /* Melhorias nos containers */
+    div.stTabs [data-baseweb="tab-panel"] {
+        padding: 1rem;
+        border-radius: 0 0 10px 10px;
+        border: 1px solid #E0E0E0;
+        border-top: none;
+    }
+    
+    div.stTabs [data-baseweb="tab-list"] {
+        gap: 4px;
+    }
+    
+    div.stTabs [role="tab"] {
+        padding: 0.5rem 1rem;
+        background-color: #F5F7FA;
+        border-radius: 10px 10px 0 0;
+        border: 1px solid #E0E0E0;
+        border-bottom: none;
+    }
+    
+    div.stTabs [aria-selected="true"] {
+        background-color: white;
+        border-bottom: 1px solid white;
+        color: var(--main-color);
+        font-weight: 600;
+    }
+    
+    /* Estilo para ícones */
+    .icon-text {
+        display: flex;
+        align-items: center;
+        gap: 0.5rem;
+    }
+    
+    /* Faixa de calor do documento, acima do seletor de página */
+    .faixa-calor {
+        display: flex;
+        height: 18px;
+        border-radius: 4px;
+        overflow: hidden;
+        background-color: #F5F7FA;
+    }
+    
+    .faixa-calor i {
+        flex: 1;
+        background-color: var(--main-color);
+    }
+    
+    .faixa-calor i.atual {
+        background-color: var(--warning-color);
+        opacity: 1 !important;
+    }
+    
+    /* CPF, CNPJ, OAB, números de processo e e-mails no texto da página */
+    mark.entidade {
+        background-color: #E7ECFF;
+        border-bottom: 2px solid var(--main-color);
+        padding: 0 2px;
+    }
+    
+    /* Personalização da barra de progresso */
+    .stProgress .st-bo {
+        background-color: var(--main-color);
+    }
+</style>
+"""
+
+
+def _compactar_css(bloco):
+    """Remove comentários e espaços do CSS"""
+    bloco = re.sub(r"/\*.*?\*/", "", bloco, flags=re.S)
+    bloco = re.sub(r"\s+", " ", bloco)
+    return re.sub(r"\s*([{};,])\s*", r"\1", bloco).strip()
+
+
+# Compactado uma vez por processo; cada rerun só reenvia a string pronta
+css = _compactar_css(_CSS)
+
+# HTML personalizado para criar cards elegantes
+@cronometrar("card()")
+def card(title, content, icon=""):
+    return f"""
+    <div class="card">
+        <div class="card-header">
+            <div class="icon-text">
+                {icon} {title}
+            </div>
+        </div>
+        <div class="card-body">
+            {content}
+        </div>
+    </div>
+    """
+
+# Função para criar badges de status
+@cronometrar("badge()")
+def badge(text, status):
+    return f'<span class="badge badge-{status}">{text}</span>'
+
+# Número com separador de milhar ("12.345")
+def milhar(numero):
+    return f"{numero:,}".replace(",", ".")
+
+# Faixa de calor: uma coluna por trecho de páginas, mais escura onde a série é maior
+@cronometrar("faixa_calor()")
+def faixa_calor(celulas, pagina_atual=None):
+    maximo = max((celula.valor for celula in celulas), default=0) or 1
+    colunas = []
+    for celula in celulas:
+        atual = ' class="atual"' if pagina_atual is not None and celula.primeira <= pagina_atual <= celula.ultima else ""
+        paginas = f"p. {celula.primeira}" if celula.primeira == celula.ultima else f"p. {celula.primeira}–{celula.ultima}"
+        colunas.append(f'<i{atual} style="opacity:{0.08 + 0.92 * celula.valor / maximo:.2f}" title="{paginas}: {celula.valor:g}"></i>')
+    return f'<div class="faixa-calor">{"".join(colunas)}</div>'
+
+# Armazém de processos compartilhado entre todas as sessões
+@st.cache_resource
+def obter_armazem():
+    """Cria o armazém somente leitura de processos abertos"""
+    limite_mb = int(os.environ.get("PROVAI_CACHE_MB", LIMITE_PADRAO_MB))
+    limiar_mb = int(os.environ.get("PROVAI_SOB_DEMANDA_MB", LIMIAR_SOB_DEMANDA_MB))
+    instantaneos = diretorio_instantaneos()
+    armazem = ArmazemProcessos(
+        limite_bytes=limite_mb * 1024 * 1024,
+        carregar=lambda caminho: abrir_documento(caminho, limiar_mb * 1024 * 1024, instantaneos),
+        medir=lambda documento: documento.custo,
+    )
+
+    def descartar_obsoletos(alteracoes):
+        # Libera já a memória dos processos que mudaram ou sumiram, em vez de esperar o próximo acesso
+        for anterior in alteracoes.removidas + [anterior for anterior, _ in alteracoes.alteradas]:
+            armazem.invalidar(anterior.caminho)
+            if instantaneos and anterior.hash_conteudo:
+                from analise_textual import remover_analise
+
+                remover_instantaneo(instantaneos, anterior.hash_conteudo)
+                remover_analise(instantaneos, anterior.hash_conteudo)
+        for anterior, nova in alteracoes.tocadas:
+            armazem.renovar(anterior.caminho, (anterior.mtime_ns, anterior.tamanho), (nova.mtime_ns, nova.tamanho))
+
+    obter_vigia(diretorio_processos()).inscrever(descartar_obsoletos)
+    return armazem
+
+# Função para carregar o arquivo JSON
+def carregar_json(caminho_arquivo):
+    """Carrega e valida o arquivo JSON do processo, devolvendo (processo, páginas)"""
+    try:
+        # Validação completa apenas do processo aberto pelo usuário; o armazém
+        # devolve a mesma instância imutável enquanto o arquivo não mudar
+        armazem = obter_armazem()
+        with fase("carregar_json (acerto)" if caminho_arquivo in armazem else "carregar_json (falha)"):
+            documento = armazem.obter(caminho_arquivo)
+        return documento.processo, documento.paginas
+    except Exception as e:
+        st.error(f"Erro ao carregar o arquivo: {str(e)}")
+        return None, None
+
+# Índice de busca do processo, construído uma vez por versão do arquivo
+@st.cache_resource(max_entries=32)
+def obter_indice_busca(caminho_arquivo, mtime_ns, tamanho, _processo):
+    """Abre o índice salvo ao lado do JSON ou o constrói a partir das páginas"""
+    # Importado só pelas seções de busca, fora do caminho da primeira exibição
+    from busca import indice_do_arquivo
+
+    # No modo sob demanda processo.results fica vazio e as páginas são lidas do arquivo
+    return indice_do_arquivo(caminho_arquivo, paginas=_processo.results or None)
+
+# Timbre (cabeçalho e rodapé repetidos) do processo, detectado uma vez por versão do arquivo
+@st.cache_resource(max_entries=32)
+def _timbre_detectado(caminho_arquivo, mtime_ns, tamanho, _paginas):
+    from timbre import AMOSTRA, Timbre
+
+    # As primeiras AMOSTRA páginas do arquivo (a mesma amostra da tabela e do acervo), quaisquer que
+    # sejam os page_ids, sem passar por obter(): ele guardaria a amostra no LRU e anteciparia vizinhas
+    amostra = _paginas.amostra(AMOSTRA) if hasattr(_paginas, "amostra") else _paginas[:AMOSTRA]
+    return Timbre.detectar(pagina.extracted_text for pagina in amostra)
+
+def obter_timbre(entrada, paginas):
+    """Timbre do processo: o da tabela de páginas, se houver, ou detectado nas primeiras páginas"""
+    timbre = getattr(paginas, "timbre", None)
+    if timbre is not None:
+        return timbre
+    if not paginas.indexacao_concluida:
+        # Páginas ainda sendo lidas: a amostra incompleta não vai para o cache
+        return _timbre_detectado.__wrapped__(entrada.caminho, entrada.mtime_ns, entrada.tamanho, paginas)
+    return _timbre_detectado(entrada.caminho, entrada.mtime_ns, entrada.tamanho, paginas)
+
+# sha256 do arquivo, para os que ainda não têm o hash no catálogo
+@st.cache_data(max_entries=64)
+def _hash_arquivo(caminho_arquivo, mtime_ns, tamanho):
+    return hash_arquivo(caminho_arquivo)
+
+# Análise textual (termos e bigramas) do processo, uma vez por conteúdo do arquivo
+@st.cache_resource(max_entries=8)
+def _analise_textual(hash_conteudo, _caminho_arquivo, _processo):
+    # numpy fica fora da primeira exibição: só a seção de análise chega aqui
+    from analise_textual import analise_do_processo
+    from leitura_incremental import iterar_paginas
+
+    # No modo sob demanda processo.results fica vazio e as páginas são lidas do arquivo
+    return analise_do_processo(lambda: _processo.results or iterar_paginas(_caminho_arquivo), hash_conteudo,
+                               diretorio_instantaneos())
+
+def obter_analise_textual(entrada, processo):
+    """Análise textual do processo, salva junto dos instantâneos pelo hash do conteúdo"""
+    hash_conteudo = entrada.hash_conteudo or _hash_arquivo(entrada.caminho, entrada.mtime_ns, entrada.tamanho)
+    return _analise_textual(hash_conteudo, entrada.caminho, processo)
+
+# Estatísticas por página do processo (somas acumuladas), uma vez por conteúdo do arquivo
+@st.cache_resource(max_entries=8)
+def _estatisticas_paginas(hash_conteudo, serie, _caminho_arquivo, _processo):
+    from estatisticas_paginas import EstatisticasPaginas
+    from leitura_incremental import iterar_paginas
+
+    paginas = _processo.results or iterar_paginas(_caminho_arquivo)
+    if serie == "palavras_chave":
+        subtemas = _processo.metadata.subthemes.items()
+        palavras_chave = [categoria for categoria, _ in subtemas] + [palavra for _, itens in subtemas for palavra in itens]
+        return EstatisticasPaginas.de_palavras_chave(paginas, palavras_chave)
+    return EstatisticasPaginas.construir(paginas)
+
+def obter_estatisticas_paginas(entrada, processo, serie=None):
+    """Séries por página do processo: imagens e tamanho dos textos ou, com serie="palavras_chave",
+    as ocorrências das palavras-chave dos subtemas"""
+    hash_conteudo = entrada.hash_conteudo or _hash_arquivo(entrada.caminho, entrada.mtime_ns, entrada.tamanho)
+    return _estatisticas_paginas(hash_conteudo, serie, entrada.caminho, processo)
+
+# Citações legais das páginas do processo, uma vez por conteúdo do arquivo
+@st.cache_resource(max_entries=8)
+def _citacoes_processo(hash_conteudo, _caminho_arquivo, _processo):
+    from citacoes import CitacoesProcesso
+    from leitura_incremental import iterar_paginas
+
+    return CitacoesProcesso.construir(_processo.results or iterar_paginas(_caminho_arquivo))
+
+def obter_citacoes(entrada, processo):
+    """Citações legais normalizadas do processo, com as páginas de cada uma"""
+    hash_conteudo = entrada.hash_conteudo or _hash_arquivo(entrada.caminho, entrada.mtime_ns, entrada.tamanho)
+    return _citacoes_processo(hash_conteudo, entrada.caminho, processo)
+
+# Ocorrências de uma busca por página, a partir do índice de busca do processo
+@st.cache_resource(max_entries=32)
+def _estatisticas_busca(caminho_arquivo, mtime_ns, tamanho, consulta, _processo):
+    from estatisticas_paginas import EstatisticasPaginas, ocorrencias_consulta
+
+    indice = obter_indice_busca(caminho_arquivo, mtime_ns, tamanho, _processo)
+    return EstatisticasPaginas(indice.page_ids, {"busca": ocorrencias_consulta(indice, consulta)})
+
+def obter_estatisticas_busca(entrada, processo, consulta):
+    """Série "busca" com as ocorrências dos termos da consulta em cada página"""
+    return _estatisticas_busca(entrada.caminho, entrada.mtime_ns, entrada.tamanho, consulta, processo)
+
+# Índice FTS5 de todos os processos do diretório
+@st.cache_resource
+def obter_acervo_busca(diretorio):
+    """Abre (ou cria) o banco de busca do acervo"""
+    from busca_acervo import AcervoBusca, ARQUIVO_BANCO
+
+    acervo = AcervoBusca(os.environ.get("PROVAI_BUSCA_DB", os.path.join(diretorio, ARQUIVO_BANCO)))
+    # Daqui em diante o índice acompanha as alterações do vigia
+    obter_vigia(diretorio).inscrever(acervo.aplicar)
+    return acervo
+
+# Tabela colunar de palavras-chave do acervo, atualizada de forma incremental pelo vigia
+@st.cache_resource
+def _palavras_chave(diretorio):
+    # pandas fica fora da primeira exibição: só a seção de análise chega aqui
+    from palavras_chave import PalavrasChaveAcervo
+
+    return obter_vigia(diretorio).acompanhar(PalavrasChaveAcervo)
+
+# Palavras-chave mais frequentes por categoria em todo o acervo
+@st.cache_data(max_entries=16)
+def _principais_palavras_chave(diretorio, versao_tabela, limite, _tabela):
+    from palavras_chave import principais_por_categoria
+
+    return principais_por_categoria(_tabela, limite)
+
+def palavras_chave_acervo(diretorio, limite=10):
+    """Devolve (número de processos, principais palavras-chave por categoria) do acervo"""
+    versao, tabela = _palavras_chave(diretorio).instantaneo()
+    return len(listar_processos(diretorio)), _principais_palavras_chave(diretorio, versao, limite, tabela)
+
+# Índice ordenado das datas do acervo (prazos, distribuição, sentença), atualizado pelo vigia
+@st.cache_resource
+def _datas(diretorio):
+    # numpy fica fora da primeira exibição: só o calendário de prazos chega aqui
+    from datas import DatasAcervo
+
+    return obter_vigia(diretorio).acompanhar(DatasAcervo)
+
+def datas_acervo(diretorio):
+    """Devolve (versão, TabelaDatas) do acervo; a tabela é imutável e a versão muda a cada alteração"""
+    return _datas(diretorio).instantaneo()
+
+# Navega para uma página a partir de um resultado de busca
+def abrir_pagina(page_id, consulta=None, caminho=None):
+    if caminho is not None:
+        catalogo = listar_processos(diretorio_processos())
+        st.session_state.processo = next(e for e in catalogo if e.caminho == caminho)
+    # A troca de seção acontece no próximo rerun (st.switch_page não roda em callbacks)
+    st.session_state.ir_para = "Resultados por Página"
+    st.session_state.pagina = page_id
+    st.session_state.destaque = consulta
+
+# Leva um identificador (CPF, CNPJ, OAB...) da página para a busca no acervo no próximo rerun
+def buscar_no_acervo(consulta):
+    st.session_state.ir_para = "Busca no Acervo"
+    st.session_state.consulta_acervo = consulta
+
+# Vigia do diretório, compartilhado por todas as sessões
+@st.cache_resource
+def obter_vigia(diretorio):
+    """Carrega o catálogo e passa a acompanhar o diretório em segundo plano"""
+    intervalo = float(os.environ.get("PROVAI_VIGIA_INTERVALO", INTERVALO_PADRAO))
+    return VigiaAcervo(diretorio, intervalo).iniciar()
+
+# Função para listar os processos do diretório (modo acervo)
+def listar_processos(diretorio):
+    """Catálogo leve dos arquivos *_resultado.json do diretório, mantido em dia pelo vigia"""
+    return obter_vigia(diretorio).catalogo()
+
+# Diretório com os arquivos de resultado da ProvAI
+def diretorio_processos():
+    return os.environ.get("PROVAI_DIRETORIO", ".")
+
+# Diretório dos instantâneos e das análises salvas pelo hash do conteúdo (vazio desativa)
+def diretorio_instantaneos():
+    return os.environ.get("PROVAI_INSTANTANEOS", os.path.join(diretorio_processos(), DIRETORIO_PADRAO_INSTANTANEOS))
+
+# Processo escolhido na barra lateral, para uso nas seções
+def processo_selecionado():
+    """Devolve (entrada do catálogo, processo, páginas); o armazém já tem o processo carregado pelo app"""
+    entrada = st.session_state.processo
+    processo, paginas = carregar_json(entrada.caminho)
+    return entrada, processo, paginas
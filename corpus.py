@@ -0,0 +1,189 @@
+"""Catálogo de um diretório de arquivos *_resultado.json da ProvAI"""
+import hashlib
+import json
+import os
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel
+
+from compressao import compactado, descompactar, e_resultado, em_blocos, ler_bytes, ler_topo_blocos, raiz
+from instantaneos import validar_com_instantaneo
+from leitura_incremental import decodificar_chave, varrer_resultado
+from modelos import ProcessoJudicial, TextoInternado
+
+ARQUIVO_CATALOGO = ".catalogo_provai.json"
+
+# Campos de data dos metadados guardados no catálogo (interpretados em datas.py)
+CAMPOS_DATA = ("distribution_date", "response_deadline", "sentence_date")
+
+# Bytes lidos do início e do fim do arquivo para extrair "file" e "metadata"
+# sem decodificar a lista "results", que ocupa quase todo o arquivo
+TAMANHO_CABECA = 4096
+TAMANHOS_CAUDA = (32 * 1024, 256 * 1024)
+
+
+class EntradaCatalogo(BaseModel):
+    """Linha leve do catálogo, sem validação completa do processo"""
+    caminho: str
+    process_number: Optional[str] = None
+    court: Optional[str] = None
+    theme: Optional[str] = None
+    total_pages: Optional[int] = None
+    # Sem valor padrão: catálogos salvos antes deste campo são refeitos
+    subtemas: Dict[TextoInternado, List[TextoInternado]]
+    # Campo de data -> texto, só os preenchidos; também sem valor padrão
+    datas: Dict[str, TextoInternado]
+    tamanho: int
+    mtime_ns: int
+    # sha256 do conteúdo; calculado pelo vigia ao detectar uma alteração e pela ingestão em lote
+    hash_conteudo: Optional[str] = None
+
+
+def _extrair_campos(caminho, tamanho):
+    """Extrai "file" e "metadata" lendo apenas a cabeça e a cauda do arquivo"""
+    if em_blocos(caminho):
+        topo = ler_topo_blocos(caminho)
+        return topo["file"], topo["metadata"]
+    # Compactados por inteiro: a cauda só é alcançada descompactando tudo
+    if compactado(caminho):
+        dados = varrer_resultado(caminho, lambda dados, inicio, fim: None)
+        return dados.get("file") or {}, dados.get("metadata") or {}
+
+    metadados = None
+    with open(caminho, "rb") as f:
+        cabeca = f.read(TAMANHO_CABECA).decode("utf-8", errors="ignore")
+        arquivo = decodificar_chave(cabeca, "file")
+        # "metadata" fica depois de "results": tenta caudas cada vez maiores
+        for tamanho_cauda in TAMANHOS_CAUDA:
+            f.seek(max(0, tamanho - tamanho_cauda))
+            cauda = f.read().decode("utf-8", errors="ignore")
+            metadados = decodificar_chave(cauda, "metadata", ultima=True)
+            if metadados is not None or tamanho_cauda >= tamanho:
+                break
+
+    # Estrutura fora do padrão: percorre o arquivo todo, ainda sem validar
+    if arquivo is None or metadados is None:
+        dados = varrer_resultado(caminho, lambda dados, inicio, fim: None)
+        arquivo = dados.get("file") or {}
+        metadados = dados.get("metadata") or {}
+
+    return arquivo, metadados
+
+
+def hash_arquivo(caminho):
+    """sha256 (hexadecimal) do conteúdo do arquivo, sem carregá-lo inteiro em memória"""
+    with open(caminho, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def criar_entrada(caminho, info=None):
+    """Cria a entrada de catálogo de um arquivo"""
+    info = info or os.stat(caminho)
+    arquivo, metadados = _extrair_campos(caminho, info.st_size)
+    return EntradaCatalogo(
+        caminho=caminho,
+        process_number=metadados.get("process_number"),
+        court=metadados.get("court"),
+        theme=metadados.get("theme"),
+        total_pages=arquivo.get("total_pages"),
+        subtemas=metadados.get("subthemes") or {},
+        datas={campo: metadados[campo] for campo in CAMPOS_DATA if metadados.get(campo)},
+        tamanho=info.st_size,
+        mtime_ns=info.st_mtime_ns,
+    )
+
+
+def entrada_de_processo(caminho, processo, info, hash_conteudo=None):
+    """Entrada de catálogo de um processo já validado (sem reler o arquivo)"""
+    return EntradaCatalogo(
+        caminho=caminho,
+        process_number=processo.metadata.process_number,
+        court=processo.metadata.court,
+        theme=processo.metadata.theme,
+        total_pages=processo.file.total_pages,
+        subtemas=processo.metadata.subthemes.root,
+        datas={campo: getattr(processo.metadata, campo) for campo in CAMPOS_DATA if getattr(processo.metadata, campo)},
+        tamanho=info.st_size,
+        mtime_ns=info.st_mtime_ns,
+        hash_conteudo=hash_conteudo,
+    )
+
+
+def ler_catalogo_salvo(diretorio):
+    """Lê o catálogo persistido no diretório, indexado pelo caminho"""
+    try:
+        with open(os.path.join(diretorio, ARQUIVO_CATALOGO), "r", encoding="utf-8") as f:
+            linhas = json.load(f)
+        return {linha["caminho"]: EntradaCatalogo.model_validate(linha) for linha in linhas}
+    except (OSError, ValueError, KeyError):
+        return {}
+
+
+def salvar_catalogo(diretorio, entradas):
+    """Persiste o catálogo no diretório (ignora diretórios somente leitura)"""
+    destino = os.path.join(diretorio, ARQUIVO_CATALOGO)
+    temporario = destino + ".tmp"
+    try:
+        with open(temporario, "w", encoding="utf-8") as f:
+            json.dump([e.model_dump() for e in entradas], f, ensure_ascii=False)
+        os.replace(temporario, destino)
+    except OSError:
+        pass
+
+
+def carregar_catalogo(diretorio) -> List[EntradaCatalogo]:
+    """Varre o diretório e monta o catálogo, reaproveitando entradas inalteradas"""
+    salvo = ler_catalogo_salvo(diretorio)
+    entradas = []
+    alterado = False
+
+    with os.scandir(diretorio) as itens:
+        for item in itens:
+            if not e_resultado(item.name) or not item.is_file():
+                continue
+            info = item.stat()
+            anterior = salvo.pop(item.path, None)
+            if anterior and anterior.mtime_ns == info.st_mtime_ns and anterior.tamanho == info.st_size:
+                entradas.append(anterior)
+                continue
+            try:
+                entradas.append(criar_entrada(item.path, info))
+            except (OSError, ValueError):
+                continue
+            alterado = True
+
+    # Arquivos removidos desde a última varredura também exigem regravação
+    if alterado or salvo:
+        salvar_catalogo(diretorio, entradas)
+
+    entradas.sort(key=chave_ordenacao)
+    return entradas
+
+
+def chave_ordenacao(entrada):
+    """Ordem do catálogo no seletor: número do processo ou nome do arquivo"""
+    return entrada.process_number or os.path.basename(entrada.caminho)
+
+
+def rotulo_entrada(entrada):
+    """Texto exibido para uma entrada no seletor de processos"""
+    numero = entrada.process_number or os.path.basename(raiz(entrada.caminho)).removesuffix("_resultado")
+    detalhes = " · ".join(v for v in (entrada.court, entrada.theme) if v)
+    return f"{numero} — {detalhes}" if detalhes else numero
+
+
+def carregar_processo(caminho, diretorio_instantaneos=None):
+    """Lê e valida por completo o processo de um arquivo
+
+    Os bytes vão direto para o validador do pydantic-core, sem passar por
+    json.load. Com diretorio_instantaneos, arquivos cujo conteúdo já foi
+    validado antes são lidos do instantâneo, sem nova validação.
+    """
+    if not diretorio_instantaneos:
+        return ProcessoJudicial.model_validate_json(ler_bytes(caminho))
+    with open(caminho, "rb") as f:
+        bruto = f.read()
+    # Instantâneo pelo hash do arquivo no disco, o mesmo do catálogo (hash_arquivo),
+    # e não pelo do JSON descompactado: senão o vigia não o acha para apagar
+    return validar_com_instantaneo(descompactar(caminho, bruto), diretorio_instantaneos,
+                                   hashlib.sha256(bruto).hexdigest())
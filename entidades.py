@@ -0,0 +1,143 @@
+"""Identificadores nos textos: CPF, CNPJ, OAB, número de processo (CNJ) e e-mail
+
+CPF e CNPJ só valem com os dígitos verificadores corretos e o número CNJ
+(NNNNNNN-DD.AAAA.J.TR.OOOO) com o dígito do módulo 97 (Resolução CNJ
+65/2008), o que descarta telefones, CEPs, RGs e outros números com o
+mesmo formato. Cada identificador é guardado na forma padrão
+("926.215.700-20", "OAB/SP 364.171"), para que "926215700-20" e
+"926.215.700-20" sejam o mesmo valor no índice do acervo.
+
+As expressões começam por um caractere fixo (um dígito, "OAB" ou "@"),
+o que deixa o re pular direto para os candidatos em vez de tentar cada
+posição do texto: os três números (CNJ, CNPJ e CPF) saem de uma única
+varredura, e a OAB e os e-mails de varreduras que quase não custam nada
+(cerca de 5 vezes mais rápido que uma expressão única com todos os tipos:
+0,8 s contra 4,0 s em 5.000 páginas sintéticas).
+"""
+import re
+from collections import Counter
+from typing import NamedTuple
+
+TIPOS = {"cpf": "CPF", "cnpj": "CNPJ", "oab": "OAB", "cnj": "Processo", "email": "E-mail"}
+
+_UFS = "ac|al|ap|am|ba|ce|df|es|go|ma|mt|ms|mg|pa|pb|pr|pe|pi|rj|rn|rs|ro|rr|sc|sp|se|to"
+_NUMERO_OAB = r"\d{1,3}(?:\.\d{3})+|\d{3,6}"
+# Separador opcional entre blocos de dígitos; depois do hífen aceita quebra de linha ("0001-\n81")
+_HIFEN = r"(?:-\s?)?"
+
+# O primeiro dígito não pode continuar outro número (lookbehind logo depois dele)
+_numeros = re.compile(
+    rf"\d(?<![\d.]\d)(?:(?P<cnj>\d{{6}}{_HIFEN}\d{{2}}\.?\d{{4}}\.?\d\.?\d{{2}}\.?\d{{4}})"
+    rf"|(?P<cnpj>\d\.?\d{{3}}\.?\d{{3}}/?\d{{4}}{_HIFEN}\d{{2}})"
+    rf"|(?P<cpf>\d{{2}}\.?\d{{3}}\.?\d{{3}}{_HIFEN}\d{{2}}))(?!\d)"
+)
+# "OAB/SP 364.171", "OAB - SP: 369.199", "OAB SP sob o número 364.171", "OAB 364171/SP"
+_oab = re.compile(
+    rf"(?:OAB|Oab|oab)(?<!\w.{{3}})"
+    rf"(?:\s*[/:-]?\s*(?P<uf>(?i:{_UFS}))\b\s*[:,]?\s*(?:sob\s+o\s+)?(?:n(?:[º°o]|[uú]mero)?\.?\s*[º°]?\s*)?"
+    rf"(?P<numero>{_NUMERO_OAB})(?!\d)"
+    rf"|\s*(?:n[º°o]?\.?\s*)?(?P<numero_antes>{_NUMERO_OAB})\s*/\s*(?P<uf_depois>(?i:{_UFS}))\b)"
+)
+# E-mail: o domínio a partir do "@" e o usuário procurado para trás, nos 64 caracteres anteriores.
+# O domínio termina em um TLD conhecido (com um código de país opcional) ou em um código de
+# país isolado: no OCR o e-mail costuma vir grudado na palavra seguinte ("gmail.compor").
+# Depois de um TLD conhecido, ".br" fica sempre, mesmo grudado ("escritorio.com.brpor")
+_TLDS = "com|net|org|edu|gov|jus|adv|mil|info|biz|app|dev|io|me"
+_dominio = re.compile(
+    rf"@[\w-]+(?:\.[\w-]+)*?\.(?i:(?:{_TLDS})(?:\.br|\.[a-z]{{2}}(?![a-z]))?|[a-z]{{2}}(?![a-z]))"
+)
+_usuario = re.compile(r"(?<![\w.+-])[\w.+-]+\Z")
+TAMANHO_USUARIO = 64
+
+
+class Entidade(NamedTuple):
+    """Identificador encontrado no texto: tipo (chave de TIPOS), valor na forma padrão e posição"""
+    tipo: str
+    valor: str
+    inicio: int
+    fim: int
+
+
+def _digito_modulo_11(digitos, pesos):
+    resto = sum(int(d) * p for d, p in zip(digitos, pesos)) % 11
+    return 0 if resto < 2 else 11 - resto
+
+
+def cpf_valido(digitos):
+    """Confere os dois dígitos verificadores de um CPF (11 dígitos, sem pontuação)"""
+    if len(digitos) != 11 or digitos == digitos[0] * 11:
+        return False
+    primeiro = _digito_modulo_11(digitos[:9], range(10, 1, -1))
+    segundo = _digito_modulo_11(digitos[:10], range(11, 1, -1))
+    return digitos[9:] == f"{primeiro}{segundo}"
+
+
+def cnpj_valido(digitos):
+    """Confere os dois dígitos verificadores de um CNPJ (14 dígitos, sem pontuação)"""
+    if len(digitos) != 14 or digitos == digitos[0] * 14:
+        return False
+    primeiro = _digito_modulo_11(digitos[:12], (5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2))
+    segundo = _digito_modulo_11(digitos[:13], (6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2))
+    return digitos[12:] == f"{primeiro}{segundo}"
+
+
+def cnj_valido(digitos):
+    """Confere o dígito verificador (módulo 97) de um número CNJ de 20 dígitos"""
+    if len(digitos) != 20:
+        return False
+    # NNNNNNN DD AAAA J TR OOOO: o número com o dígito no final deixa resto 1
+    return int(digitos[:7] + digitos[9:] + digitos[7:9]) % 97 == 1
+
+
+def _somente_digitos(texto):
+    return re.sub(r"\D", "", texto)
+
+
+def _numero(ocorrencia):
+    """(tipo, valor na forma padrão) de um CNJ, CNPJ ou CPF, ou None se o dígito verificador não confere"""
+    tipo = ocorrencia.lastgroup
+    d = _somente_digitos(ocorrencia.group())
+    if tipo == "cpf":
+        return (tipo, f"{d[:3]}.{d[3:6]}.{d[6:9]}-{d[9:]}") if cpf_valido(d) else None
+    if tipo == "cnpj":
+        return (tipo, f"{d[:2]}.{d[2:5]}.{d[5:8]}/{d[8:12]}-{d[12:]}") if cnpj_valido(d) else None
+    return (tipo, f"{d[:7]}-{d[7:9]}.{d[9:13]}.{d[13]}.{d[14:16]}.{d[16:]}") if cnj_valido(d) else None
+
+
+def extrair_entidades(texto):
+    """[Entidade] válidas do texto, na ordem em que aparecem"""
+    texto = texto or ""
+    entidades = []
+    for ocorrencia in _numeros.finditer(texto):
+        normalizada = _numero(ocorrencia)
+        if normalizada:
+            entidades.append(Entidade(*normalizada, ocorrencia.start(), ocorrencia.end()))
+    if "OAB" in texto or "oab" in texto or "Oab" in texto:
+        for ocorrencia in _oab.finditer(texto):
+            uf = (ocorrencia.group("uf") or ocorrencia.group("uf_depois")).upper()
+            numero = int(_somente_digitos(ocorrencia.group("numero") or ocorrencia.group("numero_antes")))
+            entidades.append(Entidade("oab", f"OAB/{uf} {numero:,}".replace(",", "."), ocorrencia.start(), ocorrencia.end()))
+    if "@" in texto:
+        for ocorrencia in _dominio.finditer(texto):
+            usuario = _usuario.search(texto, max(ocorrencia.start() - TAMANHO_USUARIO, 0), ocorrencia.start())
+            if usuario:
+                entidades.append(Entidade("email", texto[usuario.start():ocorrencia.end()].lower(), usuario.start(),
+                                          ocorrencia.end()))
+    entidades.sort(key=lambda entidade: entidade.inicio)
+    return entidades
+
+
+def rotulo(tipo, valor):
+    """Texto para exibir um identificador: "CPF 926.215.700-20", "OAB/SP 364.171" """
+    return valor if tipo == "oab" else f"{TIPOS[tipo]} {valor}"
+
+
+def contar_entidades(texto):
+    """Counter (tipo, valor) -> ocorrências no texto"""
+    return Counter((entidade.tipo, entidade.valor) for entidade in extrair_entidades(texto))
+
+
+def normalizar_entidade(consulta):
+    """(tipo, valor) do primeiro identificador da consulta, ou None se ela não traz nenhum válido"""
+    entidades = extrair_entidades(consulta)
+    return (entidades[0].tipo, entidades[0].valor) if entidades else None
@@ -0,0 +1,147 @@
+"""Estatísticas por página de um processo, com somas acumuladas para consultas por intervalo
+
+Cada série é um array NumPy alinhado às páginas: tamanho do texto,
+tamanho do texto de imagem e páginas com imagens, montadas juntas, e
+as ocorrências das palavras-chave dos subtemas ou de uma busca, montadas
+à parte só quando pedidas (exigem percorrer os textos). Para cada série
+são guardadas duas somas acumuladas, dos valores e das páginas com valor
+diferente de zero; a soma ou a contagem em qualquer intervalo de páginas
+é a diferença de duas posições, em tempo constante.
+
+A faixa de calor usa as mesmas somas: cada uma das colunas agrega um
+trecho contíguo de páginas, então o custo depende do número de colunas e
+não do número de páginas.
+"""
+import re
+from typing import NamedTuple
+
+import numpy as np
+
+from busca import termos
+
+COLUNAS_FAIXA = 120
+PALAVRAS_POR_CHAVE = 4
+
+
+class Celula(NamedTuple):
+    """Coluna da faixa de calor: páginas de primeira a ultima e a soma da série nelas"""
+    primeira: int
+    ultima: int
+    valor: float
+
+
+def padrao_palavras_chave(palavras_chave):
+    """Expressão que encontra qualquer uma das palavras-chave no texto em minúsculas
+
+    Itens com mais de PALAVRAS_POR_CHAVE palavras (frases descritivas, como
+    aparecem em alguns subtemas) ficam de fora; de uma palavra no plural
+    também se procura o singular ("contratos" -> "contrato").
+    """
+    normalizadas = set()
+    for palavra_chave in palavras_chave:
+        normalizada = " ".join(palavra_chave.lower().split())
+        if not normalizada or len(normalizada.split()) > PALAVRAS_POR_CHAVE:
+            continue
+        normalizadas.add(normalizada)
+        if " " not in normalizada and normalizada.endswith("s") and len(normalizada) > 4:
+            normalizadas.add(normalizada[:-1])
+    if not normalizadas:
+        return None
+    # As mais longas primeiro, para "tutela antecipada" vencer "tutela"
+    alternativas = sorted((re.escape(p).replace(r"\ ", r"\s+") for p in normalizadas), key=len, reverse=True)
+    return re.compile(r"\b(?:" + "|".join(alternativas) + r")\b")
+
+
+def ocorrencias_consulta(indice, consulta):
+    """Ocorrências dos termos da consulta em cada página, a partir dos postings do índice de busca"""
+    contagens = np.zeros(len(indice.page_ids), dtype=np.int64)
+    for termo in set(termos(consulta)):
+        lista = indice.postings.get(termo)
+        if lista:
+            pares = np.asarray(lista, dtype=np.int64)
+            np.add.at(contagens, pares[0::2], pares[1::2])
+    return contagens
+
+
+class EstatisticasPaginas:
+    """Séries por página com somas acumuladas
+
+    As séries chegam na ordem das páginas no arquivo; se os page_ids não
+    estão em ordem crescente, page_ids e séries são reordenados juntos, já
+    que os intervalos são achados por busca binária em page_ids.
+    """
+
+    def __init__(self, page_ids, series):
+        page_ids = np.asarray(page_ids, dtype=np.int64)
+        self._ordem = None if np.all(page_ids[:-1] <= page_ids[1:]) else np.argsort(page_ids, kind="stable")
+        self.page_ids = page_ids if self._ordem is None else page_ids[self._ordem]
+        self._acumuladas = {}
+        self._acumuladas_paginas = {}
+        for nome, valores in series.items():
+            self.adicionar(nome, valores)
+
+    @classmethod
+    def construir(cls, paginas):
+        """Séries imagens, texto e texto_imagem, percorrendo as páginas (iterável de PageResult) uma vez"""
+        page_ids, texto, texto_imagem, imagens = [], [], [], []
+        for pagina in paginas:
+            page_ids.append(pagina.page_id)
+            texto.append(len(pagina.extracted_text))
+            texto_imagem.append(len(pagina.extracted_image_text or ""))
+            imagens.append(pagina.has_images)
+        return cls(page_ids, {"imagens": imagens, "texto": texto, "texto_imagem": texto_imagem})
+
+    @classmethod
+    def de_palavras_chave(cls, paginas, palavras_chave):
+        """Série palavras_chave: ocorrências das categorias e palavras-chave dos subtemas em cada página"""
+        padrao = padrao_palavras_chave(palavras_chave)
+        page_ids, chaves = [], []
+        for pagina in paginas:
+            page_ids.append(pagina.page_id)
+            chaves.append(len(padrao.findall(pagina.extracted_text.lower())) if padrao else 0)
+        return cls(page_ids, {"palavras_chave": chaves})
+
+    def __len__(self):
+        return len(self.page_ids)
+
+    def adicionar(self, nome, valores):
+        """Acrescenta (ou substitui) uma série alinhada aos page_ids recebidos (na ordem do arquivo)"""
+        valores = np.asarray(valores, dtype=np.int64)
+        if len(valores) != len(self.page_ids):
+            raise ValueError(f"a série {nome} tem {len(valores)} valores para {len(self.page_ids)} páginas")
+        if self._ordem is not None:
+            valores = valores[self._ordem]
+        self._acumuladas[nome] = np.concatenate(([0], np.cumsum(valores)))
+        self._acumuladas_paginas[nome] = np.concatenate(([0], np.cumsum(valores != 0)))
+
+    def _posicoes(self, primeira, ultima):
+        """Intervalo [inicio, fim) das posições das páginas com page_id entre primeira e ultima"""
+        return (int(np.searchsorted(self.page_ids, primeira, side="left")),
+                int(np.searchsorted(self.page_ids, ultima, side="right")))
+
+    def soma(self, nome, primeira, ultima):
+        """Soma da série nas páginas de primeira a ultima (page_id, inclusive)"""
+        inicio, fim = self._posicoes(primeira, ultima)
+        acumulada = self._acumuladas[nome]
+        return int(acumulada[max(fim, inicio)] - acumulada[inicio])
+
+    def paginas_com(self, nome, primeira, ultima):
+        """Quantas páginas de primeira a ultima têm a série diferente de zero"""
+        inicio, fim = self._posicoes(primeira, ultima)
+        acumulada = self._acumuladas_paginas[nome]
+        return int(acumulada[max(fim, inicio)] - acumulada[inicio])
+
+    def paginas_no_intervalo(self, primeira, ultima):
+        inicio, fim = self._posicoes(primeira, ultima)
+        return max(fim - inicio, 0)
+
+    def faixa(self, nome, colunas=COLUNAS_FAIXA):
+        """[Celula] com a soma da série em colunas de páginas contíguas (no máximo uma por página)"""
+        total = len(self.page_ids)
+        if not total:
+            return []
+        limites = np.linspace(0, total, min(colunas, total) + 1).round().astype(np.int64)
+        somas = np.diff(self._acumuladas[nome][limites])
+        primeiras = self.page_ids[limites[:-1]]
+        ultimas = self.page_ids[limites[1:] - 1]
+        return [Celula(*celula) for celula in zip(primeiras.tolist(), ultimas.tolist(), somas.tolist())]
@@ -0,0 +1,87 @@
+"""Cache de processos já validados, indexado pelo hash do conteúdo do arquivo
+
+O hash é o dos bytes do arquivo como está no disco (o mesmo de
+corpus.hash_arquivo e do catálogo), também para os compactados: assim o
+vigia encontra e apaga o instantâneo de um arquivo alterado ou removido.
+
+Os instantâneos são gravados com pickle pelo próprio aplicativo, e o
+diretório do cache deve ser confiável (somente o aplicativo escreve nele).
+"""
+import gc
+import hashlib
+import os
+import pickle
+from functools import lru_cache
+
+import pydantic
+
+from modelos import ProcessoJudicial
+
+DIRETORIO_PADRAO = ".provai_cache"
+VERSAO_INSTANTANEO = 1
+
+
+@lru_cache(maxsize=1)
+def _versao_esquema():
+    """Identifica o esquema dos modelos: mudanças nos modelos invalidam os instantâneos"""
+    esquema = repr(ProcessoJudicial.model_json_schema()).encode("utf-8")
+    return f"{VERSAO_INSTANTANEO}-{pydantic.VERSION}-{hashlib.blake2b(esquema, digest_size=8).hexdigest()}"
+
+
+def chave_conteudo(dados):
+    """Hash dos bytes do arquivo, combinado com a versão do esquema"""
+    # sha256 tem aceleração por hardware na maioria das CPUs e é mais rápido que blake2b aqui
+    return chave_do_hash(hashlib.sha256(dados).hexdigest())
+
+
+def chave_do_hash(hash_conteudo):
+    """Chave do instantâneo a partir do sha256 (hexadecimal) do conteúdo"""
+    return hash_conteudo + "-" + _versao_esquema()
+
+
+def caminho_instantaneo(diretorio, chave):
+    return os.path.join(diretorio, chave[:2], chave + ".pickle")
+
+
+def remover_instantaneo(diretorio, hash_conteudo):
+    """Apaga o instantâneo de um conteúdo que deixou de existir no acervo"""
+    try:
+        os.remove(caminho_instantaneo(diretorio, chave_do_hash(hash_conteudo)))
+    except OSError:
+        pass
+
+
+def validar_com_instantaneo(dados, diretorio=DIRETORIO_PADRAO, hash_conteudo=None):
+    """Valida os bytes do JSON, reaproveitando o instantâneo se o conteúdo não mudou
+
+    hash_conteudo é o sha256 do arquivo no disco; sem ele, o arquivo é o
+    próprio JSON (não compactado) e o hash é calculado sobre dados.
+    """
+    chave = chave_do_hash(hash_conteudo) if hash_conteudo else chave_conteudo(dados)
+    destino = caminho_instantaneo(diretorio, chave)
+    try:
+        with open(destino, "rb") as f:
+            dados_instantaneo = f.read()
+        # Milhares de objetos recém-criados disparariam o coletor de ciclos à toa
+        coletor_ativo = gc.isenabled()
+        gc.disable()
+        try:
+            processo = pickle.loads(dados_instantaneo)
+        finally:
+            if coletor_ativo:
+                gc.enable()
+        if isinstance(processo, ProcessoJudicial):
+            return processo
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, TypeError):
+        pass
+
+    processo = ProcessoJudicial.model_validate_json(dados)
+    try:
+        os.makedirs(os.path.dirname(destino), exist_ok=True)
+        temporario = f"{destino}.{os.getpid()}.tmp"
+        with open(temporario, "wb") as f:
+            pickle.dump(processo, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporario, destino)
+    except OSError:
+        pass
+    return processo
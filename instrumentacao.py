@@ -0,0 +1,235 @@
+"""Instrumentação dos reruns do aplicativo: tempo por fase, log JSON-lines e métricas Prometheus
+
+Ativada com PROVAI_INSTRUMENTACAO=1. Desativada, fase() devolve um
+contexto vazio compartilhado e cronometrar() devolve a própria função
+decorada, de modo que o custo fica em uma chamada de função por fase.
+"""
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from functools import wraps
+from logging.handlers import RotatingFileHandler
+
+ATIVA = os.environ.get("PROVAI_INSTRUMENTACAO", "") not in ("", "0")
+ARQUIVO_LOG = os.environ.get("PROVAI_INSTRUMENTACAO_LOG", "instrumentacao_provai.jsonl")
+ARQUIVO_PROMETHEUS = os.environ.get("PROVAI_INSTRUMENTACAO_PROM", "instrumentacao_provai.prom")
+
+# Rotação do log JSON-lines
+TAMANHO_MAXIMO_LOG = 10 * 1024 * 1024
+COPIAS_LOG = 5
+
+# Intervalo mínimo, em segundos, entre duas gravações do arquivo Prometheus
+INTERVALO_PROMETHEUS = 5.0
+
+# Funções do Streamlit cujas emissões são cronometradas
+EMISSOES_STREAMLIT = ("markdown", "dataframe", "metric", "text_area")
+
+_vazio = nullcontext()
+_medidor_atual = ContextVar("medidor_rerun", default=None)
+
+# Totais acumulados no processo do servidor, exportados para o Prometheus
+_trava = threading.Lock()
+_acumulado = {}
+_reruns = [0, 0.0]
+_ultima_gravacao = [0.0]
+_logger = None
+
+
+class Medidor:
+    """Tempos das fases de um rerun: fase -> [segundos, execuções]"""
+
+    def __init__(self):
+        self.inicio = time.time()
+        self._relogio = time.perf_counter()
+        self.fases = {}
+
+    def registrar(self, nome, segundos):
+        acumulado = self.fases.get(nome)
+        if acumulado is None:
+            self.fases[nome] = [segundos, 1]
+        else:
+            acumulado[0] += segundos
+            acumulado[1] += 1
+
+    def total(self):
+        return time.perf_counter() - self._relogio
+
+    def resumo(self):
+        return {
+            nome: {"ms": round(segundos * 1000, 3), "n": execucoes}
+            for nome, (segundos, execucoes) in sorted(self.fases.items(), key=lambda item: -item[1][0])
+        }
+
+
+class _Fase:
+    __slots__ = ("_medidor", "_nome", "_inicio")
+
+    def __init__(self, medidor, nome):
+        self._medidor = medidor
+        self._nome = nome
+
+    def __enter__(self):
+        self._inicio = time.perf_counter()
+
+    def __exit__(self, *excecao):
+        self._medidor.registrar(self._nome, time.perf_counter() - self._inicio)
+        return False
+
+
+def fase(nome):
+    """Contexto que cronometra uma fase do rerun atual"""
+    if not ATIVA:
+        return _vazio
+    medidor = _medidor_atual.get()
+    return _vazio if medidor is None else _Fase(medidor, nome)
+
+
+def relogio():
+    """Início de uma fase que não cabe em um bloco with (0 se desativada)"""
+    return time.perf_counter() if ATIVA else 0.0
+
+
+def registrar(nome, inicio):
+    """Registra a fase iniciada em relogio()"""
+    if ATIVA:
+        medidor = _medidor_atual.get()
+        if medidor is not None:
+            medidor.registrar(nome, time.perf_counter() - inicio)
+
+
+def cronometrar(nome):
+    """Decorador que cronometra cada chamada da função como uma fase"""
+    def decorar(funcao):
+        if not ATIVA:
+            return funcao
+
+        @wraps(funcao)
+        def cronometrada(*args, **kwargs):
+            with fase(nome):
+                return funcao(*args, **kwargs)
+        return cronometrada
+    return decorar
+
+
+def instrumentar_streamlit(st):
+    """Cronometra as emissões do Streamlit (st.* e st.sidebar.*), uma única vez por processo"""
+    if not ATIVA:
+        return
+    for alvo, prefixo in ((st, "st"), (st.sidebar, "st.sidebar")):
+        for nome in EMISSOES_STREAMLIT:
+            funcao = getattr(alvo, nome)
+            if not getattr(funcao, "_provai_cronometrada", False):
+                cronometrada = cronometrar(f"{prefixo}.{nome}")(funcao)
+                cronometrada._provai_cronometrada = True
+                setattr(alvo, nome, cronometrada)
+
+
+def iniciar_rerun():
+    """Começa a medir o rerun atual; devolve None se a instrumentação estiver desativada"""
+    if not ATIVA:
+        return None
+    medidor = Medidor()
+    _medidor_atual.set(medidor)
+    return medidor
+
+
+def _obter_logger():
+    global _logger
+    if _logger is None:
+        logger = logging.getLogger("provai.instrumentacao")
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+        manipulador = RotatingFileHandler(ARQUIVO_LOG, maxBytes=TAMANHO_MAXIMO_LOG, backupCount=COPIAS_LOG, encoding="utf-8")
+        manipulador.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(manipulador)
+        _logger = logger
+    return _logger
+
+
+def _rotulo_prometheus(valor):
+    return valor.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _gravar_prometheus():
+    linhas = [
+        "# HELP provai_reruns_total Reruns do aplicativo medidos",
+        "# TYPE provai_reruns_total counter",
+        f"provai_reruns_total {_reruns[0]}",
+        "# HELP provai_rerun_segundos_total Tempo total dos reruns medidos",
+        "# TYPE provai_rerun_segundos_total counter",
+        f"provai_rerun_segundos_total {_reruns[1]:.6f}",
+        "# HELP provai_fase_segundos_total Tempo acumulado por fase dos reruns",
+        "# TYPE provai_fase_segundos_total counter",
+    ]
+    linhas += [f'provai_fase_segundos_total{{fase="{_rotulo_prometheus(nome)}"}} {segundos:.6f}'
+               for nome, (segundos, _) in sorted(_acumulado.items())]
+    linhas += [
+        "# HELP provai_fase_execucoes_total Execuções por fase dos reruns",
+        "# TYPE provai_fase_execucoes_total counter",
+    ]
+    linhas += [f'provai_fase_execucoes_total{{fase="{_rotulo_prometheus(nome)}"}} {execucoes}'
+               for nome, (_, execucoes) in sorted(_acumulado.items())]
+    temporario = f"{ARQUIVO_PROMETHEUS}.{os.getpid()}.tmp"
+    with open(temporario, "w", encoding="utf-8") as f:
+        f.write("\n".join(linhas) + "\n")
+    os.replace(temporario, ARQUIVO_PROMETHEUS)
+
+
+def finalizar_rerun(medidor, **rotulos):
+    """Grava o rerun no log JSON-lines e acumula os totais do Prometheus"""
+    if medidor is None:
+        return
+    total = medidor.total()
+    registro = {"inicio": medidor.inicio, "total_ms": round(total * 1000, 3), **rotulos, "fases": medidor.resumo()}
+    try:
+        _obter_logger().info(json.dumps(registro, ensure_ascii=False))
+    except OSError:
+        pass
+
+    with _trava:
+        _reruns[0] += 1
+        _reruns[1] += total
+        for nome, (segundos, execucoes) in medidor.fases.items():
+            acumulado = _acumulado.setdefault(nome, [0.0, 0])
+            acumulado[0] += segundos
+            acumulado[1] += execucoes
+        agora = time.monotonic()
+        if agora - _ultima_gravacao[0] >= INTERVALO_PROMETHEUS:
+            _ultima_gravacao[0] = agora
+            try:
+                _gravar_prometheus()
+            except OSError:
+                pass
+
+
+@contextmanager
+def _medir_rerun_fragmento(nome):
+    medidor = Medidor()
+    token = _medidor_atual.set(medidor)
+    try:
+        with _Fase(medidor, f"fragmento: {nome}"):
+            yield
+    finally:
+        _medidor_atual.reset(token)
+        finalizar_rerun(medidor, fragmento=nome)
+
+
+def medir_fragmento(nome):
+    """Contexto para o corpo de um st.fragment
+
+    No rerun completo é só mais uma fase; quando apenas o fragmento roda
+    (app.py não é executado), mede esse rerun parcial e o grava no log
+    com o rótulo fragmento.
+    """
+    if not ATIVA:
+        return _vazio
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx()
+    if ctx is not None and ctx.fragment_ids_this_run:
+        return _medir_rerun_fragmento(nome)
+    return fase(f"fragmento: {nome}")
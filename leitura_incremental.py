@@ -0,0 +1,200 @@
+"""Leitura incremental de arquivos *_resultado.json, com memória limitada"""
+import codecs
+import json
+import os
+import re
+
+from compressao import abrir, compactado, em_blocos, ler_topo_blocos, percorrer_blocos
+from modelos import PageResult
+
+# Tamanho dos blocos lidos do disco
+TAMANHO_BLOCO = 1024 * 1024
+
+# Bytes lidos do fim do arquivo ao procurar "metadata" e "summary", que a
+# ProvAI grava depois de "results"
+TAMANHOS_CAUDA = (32 * 1024, 256 * 1024, 2 * 1024 * 1024)
+
+_decodificador = json.JSONDecoder()
+_espacos = re.compile(r"[ \t\n\r]*")
+
+
+def decodificar_chave(texto, chave, ultima=False):
+    """Decodifica o objeto associado à primeira (ou última) ocorrência de "chave" no texto"""
+    inicio = texto.rfind(f'"{chave}"') if ultima else texto.find(f'"{chave}"')
+    if inicio < 0:
+        return None
+    dois_pontos = texto.find(":", inicio)
+    if dois_pontos < 0:
+        return None
+    posicao = _espacos.match(texto, dois_pontos + 1).end()
+    try:
+        valor, _ = _decodificador.raw_decode(texto, posicao)
+    except ValueError:
+        return None
+    return valor if isinstance(valor, dict) else None
+
+
+class LeitorIncremental:
+    """Decodifica valores JSON de um arquivo binário bloco a bloco
+
+    Mantém em memória só o trecho ainda não consumido, e informa a posição
+    em bytes do arquivo de cada valor lido.
+    """
+
+    def __init__(self, arquivo, tamanho_bloco=TAMANHO_BLOCO):
+        self._arquivo = arquivo
+        self._tamanho_bloco = tamanho_bloco
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._texto = ""
+        self._posicao = 0
+        self._fim_arquivo = False
+        # Referência para converter posições de caractere em posições de byte
+        self._caractere_ref = 0
+        self._byte_ref = 0
+
+    def posicao_bytes(self):
+        """Posição atual, em bytes a partir do início do arquivo"""
+        self._byte_ref += len(self._texto[self._caractere_ref:self._posicao].encode("utf-8"))
+        self._caractere_ref = self._posicao
+        return self._byte_ref
+
+    def _ler_mais(self):
+        """Descarta o trecho consumido e acrescenta um bloco ao buffer"""
+        if self._fim_arquivo:
+            return False
+        self.posicao_bytes()
+        self._texto = self._texto[self._posicao:]
+        self._posicao = self._caractere_ref = 0
+
+        # Blocos crescem junto com o valor pendente para não redecodificar demais
+        dados = self._arquivo.read(max(self._tamanho_bloco, len(self._texto)))
+        if not dados:
+            self._fim_arquivo = True
+            self._texto += self._utf8.decode(b"", final=True)
+            return False
+        self._texto += self._utf8.decode(dados)
+        return True
+
+    def pular_espacos(self):
+        while True:
+            self._posicao = _espacos.match(self._texto, self._posicao).end()
+            if self._posicao < len(self._texto) or not self._ler_mais():
+                return
+
+    def espiar(self):
+        """Próximo caractere significativo, sem consumi-lo ("" no fim do arquivo)"""
+        self.pular_espacos()
+        return self._texto[self._posicao:self._posicao + 1]
+
+    def consumir(self, esperado):
+        if self.espiar() != esperado:
+            raise ValueError(f"JSON inválido: esperado '{esperado}' no byte {self.posicao_bytes()}")
+        self._posicao += 1
+
+    def consumir_virgula(self):
+        """Consome uma vírgula separadora, se houver"""
+        if self.espiar() == ",":
+            self._posicao += 1
+
+    def decodificar(self):
+        """Decodifica o próximo valor JSON, lendo mais blocos se ele estiver incompleto"""
+        self.pular_espacos()
+        while True:
+            try:
+                valor, fim = _decodificador.raw_decode(self._texto, self._posicao)
+                # Um número no fim do buffer pode continuar no próximo bloco
+                if fim < len(self._texto) or self._fim_arquivo:
+                    self._posicao = fim
+                    return valor
+            except ValueError:
+                if self._fim_arquivo:
+                    raise
+            self._ler_mais()
+
+
+def percorrer_resultado(caminho, tamanho_bloco=TAMANHO_BLOCO):
+    """Gera (chave, valor, inicio, fim) para o objeto de topo do resultado
+
+    Cada item de "results" é gerado separadamente com a chave "results",
+    de modo que só um item por vez fica em memória. inicio e fim são as
+    posições em bytes do valor no arquivo (no JSON descompactado, para
+    .json.gz e .json.xz; do bloco da página, no formato em blocos).
+    """
+    if em_blocos(caminho):
+        yield from percorrer_blocos(caminho)
+        return
+    with abrir(caminho) as f:
+        leitor = LeitorIncremental(f, tamanho_bloco)
+        leitor.consumir("{")
+        while leitor.espiar() != "}":
+            chave = leitor.decodificar()
+            leitor.consumir(":")
+            if chave == "results":
+                leitor.consumir("[")
+                while leitor.espiar() != "]":
+                    inicio = leitor.posicao_bytes()
+                    dados = leitor.decodificar()
+                    yield chave, dados, inicio, leitor.posicao_bytes()
+                    leitor.consumir_virgula()
+                leitor.consumir("]")
+            else:
+                leitor.pular_espacos()
+                inicio = leitor.posicao_bytes()
+                valor = leitor.decodificar()
+                yield chave, valor, inicio, leitor.posicao_bytes()
+            leitor.consumir_virgula()
+
+
+def varrer_resultado(caminho, ao_ler_pagina, tamanho_bloco=TAMANHO_BLOCO):
+    """Percorre o resultado chamando ao_ler_pagina(dados, inicio, fim) para cada página
+
+    Devolve um dicionário com as demais chaves (file, metadata, summary).
+    """
+    topo = {}
+    for chave, valor, inicio, fim in percorrer_resultado(caminho, tamanho_bloco):
+        if chave == "results":
+            ao_ler_pagina(valor, inicio, fim)
+        else:
+            topo[chave] = valor
+    return topo
+
+
+def ler_cabecalho(caminho):
+    """Lê file, metadata e summary sem percorrer "results"
+
+    Usa o início do arquivo para "file" e caudas crescentes para "metadata"
+    e "summary". Se a estrutura fugir do padrão, percorre o arquivo todo de
+    forma incremental, descartando as páginas. Arquivos compactados por
+    inteiro não permitem ler a cauda sem descompactar o início, então são
+    sempre percorridos.
+    """
+    if em_blocos(caminho):
+        return ler_topo_blocos(caminho)
+    if compactado(caminho):
+        return varrer_resultado(caminho, lambda dados, inicio, fim: None)
+    tamanho = os.path.getsize(caminho)
+    with open(caminho, "rb") as f:
+        arquivo = decodificar_chave(f.read(4096).decode("utf-8", errors="ignore"), "file")
+        for tamanho_cauda in TAMANHOS_CAUDA:
+            f.seek(max(0, tamanho - tamanho_cauda))
+            cauda = f.read().decode("utf-8", errors="ignore")
+            metadados = decodificar_chave(cauda, "metadata", ultima=True)
+            resumo = decodificar_chave(cauda, "summary", ultima=True)
+            # O "summary" de topo é um objeto; o das páginas é texto
+            if metadados is not None and resumo is not None and "structured_summary" in resumo:
+                break
+            if tamanho_cauda >= tamanho:
+                break
+        else:
+            metadados = resumo = None
+
+    if arquivo is None or metadados is None or resumo is None or "structured_summary" not in resumo:
+        return varrer_resultado(caminho, lambda dados, inicio, fim: None)
+    return {"file": arquivo, "metadata": metadados, "summary": resumo}
+
+
+def iterar_paginas(caminho, tamanho_bloco=TAMANHO_BLOCO):
+    """Gera as páginas do arquivo uma a uma, já validadas como PageResult"""
+    for chave, valor, _, _ in percorrer_resultado(caminho, tamanho_bloco):
+        if chave == "results":
+            yield PageResult.model_validate(valor)
@@ -1,5 +1,245 @@
+"""Linha de comando: ingestão em lote e compactação dos arquivos *_resultado.json
+
+Na ingestão, cada arquivo é validado por completo (ProcessoJudicial) em um pool de
+processos, fora do servidor do Streamlit, e ganha ao lado do JSON os
+artefatos que o aplicativo usa:
+
+- o formato binário .provai, com as páginas lidas via mmap (só para
+  arquivos .json; os compactados não são expandidos de volta no disco);
+- o índice de busca do processo (*_resultado.indice.json);
+- a linha do catálogo, com o sha256 do conteúdo (.catalogo_provai.json).
+
+A ingestão pode ser interrompida e retomada: o catálogo é salvo a cada
+poucos segundos, e arquivos com linha no catálogo (mesmo mtime, tamanho e
+hash) e, se for o caso, .provai atualizado são pulados. Arquivos inválidos vão para a
+quarentena, ao lado de um .erros.json com os erros de validação.
+
+A compactação grava cada arquivo como .json.gz, .json.xz ou .jsonz (em
+blocos, uma página por bloco), ao lado do original (ver compressao.py).
+
+Uso: python main.py ingerir /dados/provai [--processos 8] [--quarentena DIR] [--refazer]
+     python main.py compactar /dados/provai/*_resultado.json [--formato gz|xz|blocos] [--substituir]
+"""
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import List, NamedTuple, Optional, Tuple
+
+from pydantic import ValidationError
+
+from armazem_binario import binario_atualizado, caminho_binario, gravar_processo
+from busca import IndiceBusca, caminho_indice
+from compressao import EXTENSAO_BLOCOS, descompactar, e_resultado, extensao, gravar_blocos, gravar_compactado, raiz
+from corpus import EntradaCatalogo, chave_ordenacao, entrada_de_processo, ler_catalogo_salvo, salvar_catalogo
+from leitura_incremental import percorrer_resultado
+from modelos import ProcessoJudicial
+
+DIRETORIO_QUARENTENA = "quarentena"
+
+# Formatos da compactação e a extensão de cada um
+FORMATOS = {"gz": ".json.gz", "xz": ".json.xz", "blocos": EXTENSAO_BLOCOS}
+
+# Segundos entre dois salvamentos do catálogo (pontos de retomada) e duas linhas de progresso
+INTERVALO_SALVAMENTO = 5.0
+INTERVALO_PROGRESSO = 2.0
+
+
+class ResultadoArquivo(NamedTuple):
+    """Resultado da ingestão de um arquivo no pool: a entrada do catálogo ou os erros de validação"""
+    caminho: str
+    tamanho: int
+    entrada: Optional[EntradaCatalogo] = None
+    erros: Optional[list] = None
+
+
+class Relatorio(NamedTuple):
+    """Totais de uma ingestão em lote"""
+    ingeridos: int
+    pulados: int
+    quarentena: List[str]
+    # (caminho, erro) de arquivos que não puderam ser lidos ou gravados
+    falhas: List[Tuple[str, str]]
+    bytes: int
+    segundos: float
+
+
+def ingerir_arquivo(caminho):
+    """Valida um arquivo e grava seus artefatos; executado em um processo do pool"""
+    info = os.stat(caminho)
+    with open(caminho, "rb") as f:
+        bruto = f.read()
+    dados = descompactar(caminho, bruto)
+    try:
+        processo = ProcessoJudicial.model_validate_json(dados)
+    except ValidationError as e:
+        # e.errors() pode conter exceções no contexto; o JSON é sempre serializável
+        return ResultadoArquivo(caminho, len(bruto), erros=json.loads(e.json(include_url=False)))
+
+    if _grava_binario(caminho):
+        gravar_processo(processo, caminho_binario(caminho))
+    IndiceBusca.construir(processo.results).salvar(caminho_indice(caminho), (info.st_mtime_ns, info.st_size))
+    # Hash dos bytes do arquivo, como em corpus.hash_arquivo (usado pelo vigia)
+    entrada = entrada_de_processo(caminho, processo, info, hashlib.sha256(bruto).hexdigest())
+    return ResultadoArquivo(caminho, len(bruto), entrada=entrada)
+
+
+def quarentenar(caminho, erros, destino):
+    """Move um arquivo inválido para a quarentena, com os erros ao lado, e apaga seus artefatos"""
+    os.makedirs(destino, exist_ok=True)
+    nome = os.path.basename(caminho)
+    shutil.move(caminho, os.path.join(destino, nome))
+    with open(os.path.join(destino, os.path.basename(raiz(caminho)) + ".erros.json"), "w", encoding="utf-8") as f:
+        json.dump(erros, f, ensure_ascii=False, indent=2)
+    for artefato in (caminho_binario(caminho), caminho_indice(caminho)):
+        try:
+            os.remove(artefato)
+        except OSError:
+            pass
+
+
+def _grava_binario(caminho):
+    """Só o JSON sem compactação ganha o .provai; os compactados já são o armazenamento das páginas"""
+    return extensao(caminho) == ".json"
+
+
+def _concluido(entrada, info, caminho):
+    """Indica se o arquivo já foi ingerido nesta versão (ponto de retomada)"""
+    return (
+        entrada is not None
+        and entrada.hash_conteudo is not None
+        and (entrada.mtime_ns, entrada.tamanho) == (info.st_mtime_ns, info.st_size)
+        and (binario_atualizado(caminho) or not _grava_binario(caminho))
+    )
+
+
+def ingerir(diretorio, processos=None, quarentena=None, refazer=False, relatar=print) -> Relatorio:
+    """Ingere os arquivos novos ou alterados do diretório em um pool de processos"""
+    inicio = time.perf_counter()
+    quarentena = quarentena or os.path.join(diretorio, DIRETORIO_QUARENTENA)
+    salvo = ler_catalogo_salvo(diretorio)
+
+    catalogo = {}
+    pendentes = []
+    with os.scandir(diretorio) as itens:
+        for item in itens:
+            if not e_resultado(item.name) or not item.is_file():
+                continue
+            info = item.stat()
+            entrada = salvo.get(item.path)
+            if not refazer and _concluido(entrada, info, item.path):
+                catalogo[item.path] = entrada
+            else:
+                pendentes.append((info.st_size, item.path))
+    pulados = len(catalogo)
+    # Maiores primeiro: um arquivo grande no fim deixaria o pool ocioso esperando por ele
+    pendentes.sort(reverse=True)
+
+    def salvar():
+        salvar_catalogo(diretorio, sorted(catalogo.values(), key=chave_ordenacao))
+
+    ingeridos, em_quarentena, falhas, total_bytes = 0, [], [], 0
+    ultimo_salvamento = ultimo_progresso = time.perf_counter()
+    executor = ProcessPoolExecutor(max_workers=processos)
+    try:
+        futuros = {executor.submit(ingerir_arquivo, caminho): caminho for _, caminho in pendentes}
+        for concluidos, futuro in enumerate(as_completed(futuros), 1):
+            caminho = futuros[futuro]
+            try:
+                resultado = futuro.result()
+                if resultado.erros is not None:
+                    quarentenar(caminho, resultado.erros, quarentena)
+                    em_quarentena.append(caminho)
+                else:
+                    catalogo[caminho] = resultado.entrada
+                    ingeridos += 1
+                total_bytes += resultado.tamanho
+            except Exception as e:
+                falhas.append((caminho, f"{type(e).__name__}: {e}"))
+
+            agora = time.perf_counter()
+            if agora - ultimo_salvamento >= INTERVALO_SALVAMENTO:
+                salvar()
+                ultimo_salvamento = agora
+            if agora - ultimo_progresso >= INTERVALO_PROGRESSO:
+                decorrido = agora - inicio
+                relatar(f"{concluidos}/{len(pendentes)} arquivos, {concluidos / decorrido:.1f} arquivos/s, "
+                        f"{total_bytes / 1e6 / decorrido:.1f} MB/s")
+                ultimo_progresso = agora
+    except KeyboardInterrupt:
+        # O que já foi concluído fica no catálogo: a próxima execução continua daqui
+        executor.shutdown(wait=False, cancel_futures=True)
+        salvar()
+        raise
+    executor.shutdown()
+    salvar()
+    return Relatorio(ingeridos, pulados, em_quarentena, falhas, total_bytes, time.perf_counter() - inicio)
+
+
+def imprimir_relatorio(relatorio, relatar=print):
+    segundos = max(relatorio.segundos, 1e-9)
+    relatar(f"{relatorio.ingeridos} processo(s) ingerido(s) em {relatorio.segundos:.1f} s "
+            f"({relatorio.ingeridos / segundos:.1f} processos/s, {relatorio.bytes / 1e6 / segundos:.1f} MB/s); "
+            f"{relatorio.pulados} já ingerido(s)")
+    for caminho in relatorio.quarentena:
+        relatar(f"QUARENTENA {caminho}")
+    for caminho, erro in relatorio.falhas:
+        relatar(f"FALHA {caminho}: {erro}")
+
+
+def compactar_arquivo(caminho, formato, substituir=False):
+    """Grava o resultado em outro formato ao lado do original e devolve o destino
+
+    Com substituir, o original é apagado: sem isso, o catálogo lista os dois arquivos.
+    """
+    destino = raiz(caminho) + FORMATOS[formato]
+    if destino == caminho:
+        return destino
+    if formato == "blocos":
+        gravar_blocos(destino, percorrer_resultado(caminho))
+    else:
+        gravar_compactado(destino, caminho)
+    if substituir:
+        os.remove(caminho)
+    return destino
+
+
 def main():
-    print("Hello from web-provai!")
+    parser = argparse.ArgumentParser(description="Ferramentas de linha de comando do Visualizador de Processos da ProvAI")
+    comandos = parser.add_subparsers(dest="comando", required=True)
+
+    ingestao = comandos.add_parser("ingerir", help="valida o diretório em um pool de processos e grava os artefatos")
+    ingestao.add_argument("diretorio", help="diretório com os arquivos *_resultado.json")
+    ingestao.add_argument("--processos", type=int, default=None, help="processos do pool (padrão: número de CPUs)")
+    ingestao.add_argument("--quarentena", default=None, help=f"destino dos arquivos inválidos (padrão: DIRETORIO/{DIRETORIO_QUARENTENA})")
+    ingestao.add_argument("--refazer", action="store_true", help="ingere de novo mesmo os arquivos já concluídos")
+
+    compactacao = comandos.add_parser("compactar", help="grava os arquivos de resultado compactados")
+    compactacao.add_argument("arquivos", nargs="+", help="arquivos *_resultado.json (ou já compactados)")
+    compactacao.add_argument("--formato", choices=FORMATOS, default="blocos",
+                             help="gz/xz: JSON inteiro compactado; blocos: uma página por bloco (padrão)")
+    compactacao.add_argument("--substituir", action="store_true", help="apaga o original depois de gravar")
+    args = parser.parse_args()
+
+    if args.comando == "compactar":
+        for caminho in args.arquivos:
+            tamanho = os.path.getsize(caminho)
+            destino = compactar_arquivo(caminho, args.formato, args.substituir)
+            print(f"{caminho} -> {destino} ({tamanho / 1e6:.1f} MB -> {os.path.getsize(destino) / 1e6:.1f} MB)")
+        return
+
+    try:
+        relatorio = ingerir(args.diretorio, args.processos, args.quarentena, args.refazer)
+    except KeyboardInterrupt:
+        print("Interrompido; execute de novo para retomar.", file=sys.stderr)
+        sys.exit(130)
+    imprimir_relatorio(relatorio)
+    if relatorio.quarentena or relatorio.falhas:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
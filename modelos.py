@@ -0,0 +1,94 @@
+"""Modelos Pydantic do resultado da ProvAI"""
+import sys
+from pydantic import AfterValidator, BaseModel, ConfigDict, RootModel
+from typing import Annotated, Dict, List, Optional
+
+# Definição dos modelos Pydantic para validação dos dados.
+# Os modelos são imutáveis porque uma mesma instância é compartilhada
+# entre todas as sessões do Streamlit (ver armazem.py).
+class ModeloImutavel(BaseModel):
+    """Base dos modelos somente leitura"""
+    model_config = ConfigDict(frozen=True)
+
+class FileInfo(ModeloImutavel):
+    """Informações do arquivo processado"""
+    file_name: str
+    file_type: str
+    total_pages: int
+
+# Categorias e palavras-chave se repetem entre processos: internadas, cada
+# texto distinto fica uma única vez em memória
+TextoInternado = Annotated[str, AfterValidator(sys.intern)]
+
+class SubThemes(RootModel[Dict[TextoInternado, List[TextoInternado]]]):
+    """Subtemas do processo: categoria -> palavras-chave, com quaisquer categorias"""
+    model_config = ConfigDict(frozen=True)
+
+    def __getitem__(self, categoria):
+        return self.root.get(categoria, [])
+
+    def __iter__(self):
+        return iter(self.root)
+
+    def __len__(self):
+        return len(self.root)
+
+    def items(self):
+        return self.root.items()
+
+class Metadata(ModeloImutavel):
+    """Metadados do processo judicial"""
+    is_approved: Optional[bool] = None
+    process_number: Optional[str] = None
+    court: Optional[str] = None
+    jurisdiction: Optional[str] = None
+    distribution_date: Optional[str] = None
+    response_deadline: Optional[str] = None
+    responsible: Optional[str] = None
+    judge_name: Optional[str] = None
+    case_value: Optional[str] = None
+    sentence_date: Optional[str] = None
+    priority: Optional[str] = None
+    theme: Optional[str] = None
+    subthemes: SubThemes
+
+class StructuredSummary(ModeloImutavel):
+    """Resumo estruturado do processo"""
+    parties: str
+    object: str
+    decision: Optional[str] = None
+    requests: str
+    next_steps_deadlines: str
+    legal_basis: str
+
+class Summary(ModeloImutavel):
+    """Resumo completo do processo"""
+    total_pages_processed: int
+    pages_with_errors: int
+    pages_with_images: int
+    summary_all: str
+    structured_summary: StructuredSummary
+    controversial_points: List[str]
+
+class PageResult(ModeloImutavel):
+    """Resultado da extração de uma página"""
+    page_id: int
+    file_name: str
+    has_images: bool
+    extracted_text: str
+    extracted_image_text: Optional[str] = None
+    summary: str
+
+class CabecalhoPagina(ModeloImutavel):
+    """Dados de uma página mantidos em memória no modo sob demanda (sem os textos)"""
+    page_id: int
+    file_name: str
+    has_images: bool
+    summary: str
+
+class ProcessoJudicial(ModeloImutavel):
+    """Modelo principal do processo judicial"""
+    file: FileInfo
+    results: List[PageResult]
+    metadata: Metadata
+    summary: Summary
@@ -0,0 +1,138 @@
+"""Acesso às páginas de um processo lidas sob demanda do arquivo JSON"""
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from leitura_incremental import ler_cabecalho, percorrer_resultado
+from modelos import CabecalhoPagina, PageResult, ProcessoJudicial
+
+# Quantidade de páginas completas mantidas em memória no modo sob demanda
+CAPACIDADE_PADRAO = 16
+
+# Páginas vizinhas carregadas antecipadamente após cada acesso, no sentido
+# da navegação (espelhadas quando o usuário volta páginas)
+DESLOCAMENTOS_PREFETCH = (1, 2, -1)
+
+# Estimativa de memória por cabeçalho residente (file_name e summary)
+TAMANHO_MEDIO_CABECALHO = 1024
+
+# Executor compartilhado para a leitura antecipada de páginas
+_executor_prefetch = ThreadPoolExecutor(max_workers=2, thread_name_prefix="prefetch-paginas")
+
+
+class PaginasSobDemanda:
+    """Páginas lidas do arquivo apenas quando abertas
+
+    file, metadata e summary são lidos primeiro, para que o resumo possa ser
+    exibido de imediato; em seguida uma thread percorre "results" de forma
+    incremental, registrando a posição de cada página no arquivo. Só os
+    cabeçalhos (page_id, file_name, has_images, summary) ficam residentes;
+    os textos de cada página são lidos ao abri-la, validados como PageResult
+    e guardados em um LRU pequeno. Os vizinhos da página aberta são lidos
+    antecipadamente em segundo plano.
+    """
+
+    def __init__(self, caminho, capacidade=CAPACIDADE_PADRAO, em_segundo_plano=True):
+        self.caminho = caminho
+        self.capacidade = capacidade
+        self.cabecalhos = {}
+        self._trechos = {}
+        self._abertas = OrderedDict()
+        self._trava = threading.Lock()
+        self._tamanho_arquivo = os.path.getsize(caminho)
+        self.erro_indexacao = None
+        self._concluida = threading.Event()
+
+        # Processo sem as páginas: suficiente para as seções de resumo e metadados
+        self.processo = ProcessoJudicial.model_validate({**ler_cabecalho(caminho), "results": []})
+
+        if em_segundo_plano:
+            threading.Thread(target=self._indexar, daemon=True, name="indexar-paginas").start()
+        else:
+            self._indexar()
+
+    def _indexar(self):
+        try:
+            for chave, dados, inicio, fim in percorrer_resultado(self.caminho):
+                if chave == "results":
+                    cabecalho = CabecalhoPagina.model_validate(dados)
+                    self._trechos[cabecalho.page_id] = (inicio, fim - inicio)
+                    self.cabecalhos[cabecalho.page_id] = cabecalho
+        except Exception as e:
+            self.erro_indexacao = e
+        finally:
+            self._concluida.set()
+
+    @property
+    def indexacao_concluida(self):
+        return self._concluida.is_set()
+
+    @property
+    def progresso(self):
+        """Fração das páginas já indexadas"""
+        if self.indexacao_concluida:
+            return 1.0
+        return min(1.0, len(self.cabecalhos) / max(1, self.processo.file.total_pages))
+
+    def aguardar_indexacao(self, tempo_limite=None):
+        return self._concluida.wait(tempo_limite)
+
+    @property
+    def bytes_residentes(self):
+        """Estimativa da memória ocupada: cabeçalhos mais o LRU de páginas abertas cheio"""
+        total_paginas = max(1, self.processo.file.total_pages)
+        tamanho_medio_pagina = self._tamanho_arquivo // total_paginas
+        return total_paginas * TAMANHO_MEDIO_CABECALHO + self.capacidade * tamanho_medio_pagina
+
+    def _ler(self, page_id):
+        inicio, tamanho = self._trechos[page_id]
+        with open(self.caminho, "rb") as f:
+            f.seek(inicio)
+            return PageResult.model_validate_json(f.read(tamanho))
+
+    def amostra(self, quantidade):
+        """As primeiras páginas já indexadas, lidas direto do arquivo
+
+        Não passam pelo LRU nem pela leitura antecipada: uma amostra (a da
+        detecção do timbre, por exemplo) não expulsa as páginas abertas.
+        """
+        # list() copia as chaves de uma vez, enquanto a thread de indexação ainda pode inserir
+        for page_id in sorted(list(self._trechos))[:quantidade]:
+            yield self._ler(page_id)
+
+    def _guardar(self, page_id, pagina):
+        with self._trava:
+            self._abertas[page_id] = pagina
+            self._abertas.move_to_end(page_id)
+            while len(self._abertas) > self.capacidade:
+                self._abertas.popitem(last=False)
+
+    def _carregar(self, page_id):
+        with self._trava:
+            if page_id in self._abertas:
+                return
+        self._guardar(page_id, self._ler(page_id))
+
+    def obter(self, page_id, direcao=1):
+        """Devolve a página completa, lendo-a do arquivo se necessário
+
+        direcao (1 ou -1) é o sentido em que o usuário está folheando e
+        orienta a leitura antecipada das vizinhas. Devolve None para páginas
+        inexistentes ou ainda não indexadas.
+        """
+        if page_id not in self._trechos:
+            return None
+        with self._trava:
+            pagina = self._abertas.get(page_id)
+            if pagina is not None:
+                self._abertas.move_to_end(page_id)
+        if pagina is None:
+            pagina = self._ler(page_id)
+            self._guardar(page_id, pagina)
+
+        for deslocamento in DESLOCAMENTOS_PREFETCH:
+            vizinha = page_id + deslocamento * direcao
+            if vizinha in self._trechos and vizinha not in self._abertas:
+                _executor_prefetch.submit(self._carregar, vizinha)
+        return pagina
@@ -0,0 +1,104 @@
+"""Palavras-chave dos subtemas do acervo em uma tabela colunar (processo, categoria, palavra-chave)
+
+A tabela é montada uma vez a partir do catálogo, sem abrir os processos:
+cada coluna é um pandas.Categorical, de modo que cada texto distinto fica
+uma vez em memória e as agregações trabalham sobre códigos inteiros.
+"""
+import threading
+
+import pandas as pd
+from pandas.api.types import union_categoricals
+
+COLUNAS = ("processo", "categoria", "palavra_chave")
+
+
+def _codificar(valor, codigos):
+    """Código inteiro do valor, atribuído na ordem em que aparece"""
+    codigo = codigos.get(valor)
+    if codigo is None:
+        codigo = codigos[valor] = len(codigos)
+    return codigo
+
+
+def tabela_palavras_chave(entradas):
+    """DataFrame (processo, categoria, palavra_chave) com uma linha por palavra-chave de cada entrada"""
+    processos, categorias, palavras = {}, {}, {}
+    codigos = ([], [], [])
+    for entrada in entradas:
+        processo = _codificar(entrada.caminho, processos)
+        for categoria, itens in entrada.subtemas.items():
+            codigo_categoria = _codificar(categoria, categorias)
+            for palavra in itens:
+                codigos[0].append(processo)
+                codigos[1].append(codigo_categoria)
+                codigos[2].append(_codificar(palavra, palavras))
+    return pd.DataFrame({
+        coluna: pd.Categorical.from_codes(codigo, categories=list(valores))
+        for coluna, codigo, valores in zip(COLUNAS, codigos, (processos, categorias, palavras))
+    })
+
+
+def atualizar_tabela(tabela, caminhos_removidos, novas_entradas):
+    """Tabela sem as linhas dos processos removidos e com as linhas das novas entradas
+
+    Só as novas entradas são percorridas; as categorias das colunas são
+    unidas sem reconstruir os códigos das linhas que permanecem.
+    """
+    if caminhos_removidos:
+        tabela = tabela[~tabela["processo"].isin(caminhos_removidos)]
+    novas = tabela_palavras_chave(novas_entradas)
+    if novas.empty:
+        return tabela.reset_index(drop=True)
+    return pd.DataFrame({
+        coluna: union_categoricals([tabela[coluna], novas[coluna]])
+        for coluna in COLUNAS
+    })
+
+
+class PalavrasChaveAcervo:
+    """Tabela de palavras-chave do acervo, mantida em dia pelas alterações do vigia
+
+    aplicar() é chamado da thread do vigia; as sessões leem (versão, tabela)
+    juntos em instantaneo(), e a versão serve de chave para os caches.
+    """
+
+    def __init__(self, entradas):
+        self.tabela = tabela_palavras_chave(entradas)
+        self.versao = 0
+        self._trava = threading.Lock()
+
+    def instantaneo(self):
+        with self._trava:
+            return self.versao, self.tabela
+
+    def aplicar(self, alteracoes):
+        """Atualiza a tabela com as alterações de uma varredura (vigia.Alteracoes)"""
+        removidos = [e.caminho for e in alteracoes.removidas] + [anterior.caminho for anterior, _ in alteracoes.alteradas]
+        novas = alteracoes.adicionadas + [nova for _, nova in alteracoes.alteradas]
+        if not removidos and not novas:
+            return
+        tabela = atualizar_tabela(self.tabela, removidos, novas)
+        with self._trava:
+            self.tabela = tabela
+            self.versao += 1
+
+
+def principais_por_categoria(tabela, limite=10):
+    """As palavras-chave mais frequentes de cada categoria, com o número de processos que as citam"""
+    contagem = (
+        tabela.drop_duplicates()
+        .groupby(["categoria", "palavra_chave"], observed=True)
+        .size()
+        .rename("processos")
+        .reset_index()
+    )
+    contagem = contagem.sort_values(["categoria", "processos"], ascending=[True, False], kind="stable")
+    return contagem.groupby("categoria", observed=True).head(limite).reset_index(drop=True)
+
+
+def resumo_categorias(tabela):
+    """Processos e palavras-chave distintas por categoria"""
+    return tabela.groupby("categoria", observed=True).agg(
+        processos=("processo", "nunique"),
+        palavras_chave=("palavra_chave", "nunique"),
+    ).sort_values("processos", ascending=False)
@@ -0,0 +1,124 @@
+"""HTML das seções do processo, montado uma vez por versão do arquivo
+
+As seções de conteúdo fixo (resumo, metadados e pontos controversos) têm
+o HTML montado por card()/badge() em blocos prontos, memorizados por
+(seção, arquivo, versão do arquivo). Cada bloco vira um único elemento
+st.markdown, em vez de um elemento por card, título ou <div> de abertura
+e fechamento: menos deltas enviados pelo websocket a cada rerun.
+"""
+import textwrap
+
+import streamlit as st
+
+from comum import badge, card
+
+# Ícones das abas de subtemas em "Metadados"; as demais categorias aparecem sem ícone
+ICONES_SUBTEMAS = {
+    "Contratos": "📑",
+    "Danos Morais": "💰",
+    "Responsabilidade Civil": "⚖️",
+    "Locação": "⏱️",
+}
+
+
+def destaque(conteudo, estilo=None):
+    if estilo:
+        return f'<div class="destaque" style="{estilo}">{conteudo}</div>'
+    return f'<div class="destaque">{conteudo}</div>'
+
+
+def lista(itens):
+    itens_html = "".join(f"<li>{item}</li>" for item in itens)
+    return f'<ul class="destaque">{itens_html}</ul>'
+
+
+def juntar(*blocos):
+    """Junta blocos de HTML em um só, sem linhas em branco nem recuo
+
+    Uma linha em branco encerraria o bloco HTML no Markdown e o recuo da
+    linha seguinte a transformaria em bloco de código.
+    """
+    return "\n".join(textwrap.dedent(bloco).strip() for bloco in blocos if bloco)
+
+
+def _linhas(campos):
+    """Parágrafos "rótulo: valor" dos campos preenchidos"""
+    return "".join(f"<p><strong>{rotulo}:</strong> {valor}</p>" for rotulo, valor in campos if valor)
+
+
+def _resumo(processo):
+    estruturado = processo.summary.structured_summary
+    return {
+        "abas": [
+            juntar(
+                card("Partes Envolvidas", destaque(estruturado.parties), "👥"),
+                card("Objeto do Processo", destaque(estruturado.object), "🔎"),
+            ),
+            juntar(
+                card("Decisão", destaque(estruturado.decision), "⚖️") if estruturado.decision else None,
+                card("Pedidos", destaque(estruturado.requests), "📝"),
+                card("Próximos Passos/Prazos", destaque(estruturado.next_steps_deadlines), "⏱️"),
+            ),
+            juntar(card("Base Legal", destaque(estruturado.legal_basis), "📜")),
+        ],
+        "resumo_completo": destaque(processo.summary.summary_all, "max-height: 400px; overflow-y: auto;"),
+    }
+
+
+def _metadados(processo):
+    metadados = processo.metadata
+    status = None
+    if metadados.is_approved is not None:
+        status = badge(
+            "Aprovado" if metadados.is_approved else "Não Aprovado",
+            "success" if metadados.is_approved else "danger",
+        )
+    tribunal = _linhas([
+        ("Tribunal", metadados.court),
+        ("Jurisdição", metadados.jurisdiction),
+        ("Data de Distribuição", metadados.distribution_date),
+        ("Juiz(a)", metadados.judge_name),
+        ("Prazo de Resposta", metadados.response_deadline),
+        ("Prioridade", metadados.priority),
+    ])
+    caso = _linhas([
+        ("Responsável", metadados.responsible),
+        ("Valor da Causa", metadados.case_value),
+        ("Data da Sentença", metadados.sentence_date),
+        ("Tema Principal", metadados.theme),
+        ("Status", status),
+    ])
+    return {
+        "tribunal": juntar(card("Informações do Tribunal", tribunal, "🏛️")),
+        "caso": juntar(card("Informações do Caso", caso, "📋")),
+        # Uma aba por categoria presente no processo; None quando a categoria não tem subtemas
+        "subtemas": [
+            (f"{ICONES_SUBTEMAS[categoria]} {categoria}" if categoria in ICONES_SUBTEMAS else categoria,
+             lista(itens) if itens else None)
+            for categoria, itens in metadados.subthemes.items()
+        ],
+    }
+
+
+def _pontos(processo):
+    return juntar(*(
+        card(f"Ponto {i}", destaque(ponto), "⚠️")
+        for i, ponto in enumerate(processo.summary.controversial_points, 1)
+    ))
+
+
+MONTADORES = {
+    "resumo": _resumo,
+    "metadados": _metadados,
+    "pontos": _pontos,
+}
+
+
+@st.cache_data(max_entries=64)
+def _html_secao(secao, caminho_arquivo, mtime_ns, tamanho, _processo):
+    return MONTADORES[secao](_processo)
+
+
+def html_secao(secao, entrada, processo):
+    """HTML pronto da seção para o processo da entrada do catálogo"""
+    return _html_secao(secao, entrada.caminho, entrada.mtime_ns, entrada.tamanho, processo)
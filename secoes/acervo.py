@@ -0,0 +1,102 @@
+"""Seção Busca no Acervo"""
+import os
+
+import streamlit as st
+
+from citacoes import normalizar_consulta
+from entidades import normalizar_entidade, rotulo
+from comum import abrir_pagina, card, diretorio_processos, listar_processos, obter_acervo_busca
+from renderizacao import juntar
+
+st.markdown('<h2>🗂️ Busca no Acervo</h2>', unsafe_allow_html=True)
+
+# Ingestão incremental: só arquivos novos ou alterados são indexados
+acervo = obter_acervo_busca(diretorio_processos())
+with st.spinner("Atualizando o índice do acervo..."):
+    ingeridos, removidos, falhas = acervo.sincronizar(listar_processos(diretorio_processos()))
+if ingeridos or removidos:
+    st.caption(f"Índice atualizado: {ingeridos} processo(s) indexado(s), {removidos} removido(s).")
+for caminho_falha, erro in falhas:
+    st.warning(f"Não foi possível indexar {os.path.basename(caminho_falha)}: {erro}")
+
+consulta = st.text_input("Pesquisar em todos os processos:", placeholder='Ex.: "art. 300 do CPC", Quinto Andar, um CPF ou CNPJ',
+                         key="consulta_acervo")
+
+# Filtros pelos metadados dos processos
+col1, col2, col3 = st.columns(3)
+with col1:
+    tribunal = st.selectbox("Tribunal", [None] + acervo.valores_filtro("court"), format_func=lambda v: v or "Todos")
+with col2:
+    tema = st.selectbox("Tema", [None] + acervo.valores_filtro("theme"), format_func=lambda v: v or "Todos")
+with col3:
+    juiz = st.selectbox("Juiz(a)", [None] + acervo.valores_filtro("judge_name"), format_func=lambda v: v or "Todos")
+
+if consulta:
+    tabs = st.tabs(["📄 Páginas", "📋 Resumos", "⚖️ Processos que citam", "🪪 Identificadores"])
+    
+    with tabs[0]:
+        resultados = acervo.buscar(consulta, court=tribunal, theme=tema, judge_name=juiz)
+        if not resultados:
+            st.info("Nenhuma página encontrada para a busca.")
+        for i, resultado in enumerate(resultados):
+            st.markdown(card(
+                f"{resultado.process_number or os.path.basename(resultado.caminho)} · Página {resultado.page_id}",
+                f'<div class="destaque">{resultado.trecho}</div><small>{resultado.court or ""} {resultado.theme or ""} · Relevância: {resultado.pontuacao:.2f}</small>',
+                "📄"
+            ), unsafe_allow_html=True)
+            st.button("Abrir página", key=f"acervo_{i}", on_click=abrir_pagina, args=(resultado.page_id, consulta, resultado.caminho))
+    
+    with tabs[1]:
+        resultados = acervo.buscar_resumos(consulta, court=tribunal, theme=tema, judge_name=juiz)
+        if not resultados:
+            st.info("Nenhum resumo encontrado para a busca.")
+        else:
+            # Sem botões entre os resultados: todos os cards vão em um único elemento
+            st.markdown(juntar(*(card(
+                resultado.process_number or os.path.basename(resultado.caminho),
+                f'<div class="destaque">{resultado.trecho}</div><small>{resultado.court or ""} {resultado.theme or ""} · Relevância: {resultado.pontuacao:.2f}</small>',
+                "📋"
+            ) for resultado in resultados)), unsafe_allow_html=True)
+
+    with tabs[2]:
+        # Pela tabela de citações normalizadas: "lei 8245" encontra "Lei nº 8.245/91" e todos os seus artigos
+        citantes = acervo.processos_citando(consulta, court=tribunal, theme=tema, judge_name=juiz)
+        if not citantes:
+            st.info("Nenhum processo cita essa lei, artigo ou súmula.")
+        else:
+            st.caption(f"{len(citantes)} processo(s) citam {normalizar_consulta(consulta)}.")
+        for i, citante in enumerate(citantes):
+            if citante.paginas:
+                onde = "Páginas " + ", ".join(map(str, citante.paginas[:20])) + (" …" if len(citante.paginas) > 20 else "")
+            else:
+                onde = "Base legal do resumo"
+            st.markdown(card(
+                citante.process_number or os.path.basename(citante.caminho),
+                f'<small>{citante.court or ""} {citante.theme or ""} · {citante.ocorrencias} citação(ões) · {onde}</small>',
+                "⚖️"
+            ), unsafe_allow_html=True)
+            if citante.paginas:
+                st.button("Abrir primeira página", key=f"citante_{i}", on_click=abrir_pagina,
+                          args=(citante.paginas[0], consulta, citante.caminho))
+
+    with tabs[3]:
+        # CPF, CNPJ, OAB, número de processo ou e-mail, pela tabela de entidades (chave exata, sem FTS)
+        entidade = normalizar_entidade(consulta)
+        if entidade is None:
+            st.info("A busca não traz um CPF, CNPJ, OAB, número de processo ou e-mail válido.")
+        else:
+            com_entidade = acervo.processos_com_entidade(consulta, court=tribunal, theme=tema, judge_name=juiz)
+            if com_entidade:
+                st.caption(f"{rotulo(*entidade)} aparece em {len(com_entidade)} processo(s).")
+            else:
+                st.info(f"{rotulo(*entidade)} não aparece em nenhum processo do acervo.")
+            for i, processo_entidade in enumerate(com_entidade):
+                paginas = ", ".join(map(str, processo_entidade.paginas[:20])) + (" …" if len(processo_entidade.paginas) > 20 else "")
+                st.markdown(card(
+                    processo_entidade.process_number or os.path.basename(processo_entidade.caminho),
+                    f'<small>{processo_entidade.court or ""} {processo_entidade.theme or ""} · '
+                    f'{processo_entidade.ocorrencias} ocorrência(s) · Páginas {paginas}</small>',
+                    "🪪"
+                ), unsafe_allow_html=True)
+                st.button("Abrir primeira página", key=f"entidade_{i}", on_click=abrir_pagina,
+                          args=(processo_entidade.paginas[0], None, processo_entidade.caminho))
@@ -0,0 +1,137 @@
+"""Seção Análise Textual"""
+import streamlit as st
+
+from citacoes import extrair_citacoes
+from comum import (abrir_pagina, diretorio_processos, milhar, obter_analise_textual, obter_citacoes, palavras_chave_acervo,
+                   processo_selecionado)
+
+entrada, processo, _ = processo_selecionado()
+
+# Botões de página por citação
+PAGINAS_CITACAO = 40
+
+
+def grafico_barras(linhas, rotulo):
+    """Barras horizontais, da mais frequente para a menos frequente"""
+    import altair as alt
+    import pandas as pd
+
+    dados = pd.DataFrame(linhas, columns=[rotulo, "Ocorrências", "Páginas"])
+    return alt.Chart(dados).mark_bar().encode(
+        x="Ocorrências:Q",
+        y=alt.Y(f"{rotulo}:N", sort="-x", title=None),
+        tooltip=[rotulo, "Ocorrências", "Páginas"],
+    )
+
+
+# Termos e bigramas do texto das páginas; mudar a quantidade ou o termo refaz
+# apenas este fragmento, sobre a análise já calculada para o conteúdo do arquivo
+@st.fragment
+def termos_das_paginas():
+    analise = obter_analise_textual(entrada, processo)
+    if not analise.total_palavras:
+        st.info("As páginas deste processo não têm texto extraído.")
+        return
+    st.caption(f"{milhar(analise.total_palavras)} palavras em {milhar(len(analise))} páginas, "
+               f"{milhar(len(analise.vocabulario))} termos distintos (sem o timbre, números e palavras vazias).")
+
+    limite = st.slider("Quantidade de termos:", 5, 50, 15, key="limite_termos")
+    col_termos, col_bigramas = st.columns(2)
+    with col_termos:
+        st.markdown("**Termos mais frequentes**")
+        st.altair_chart(grafico_barras(analise.principais_termos(limite), "Termo"), use_container_width=True)
+    with col_bigramas:
+        st.markdown("**Bigramas mais frequentes**")
+        st.altair_chart(grafico_barras(analise.principais_bigramas(limite), "Bigrama"), use_container_width=True)
+
+    termo = st.text_input("Distribuição de um termo pelas páginas:", value=analise.principais_termos(1)[0][0],
+                          key="termo_distribuicao")
+    distribuicao = analise.distribuicao(termo) if termo else None
+    if distribuicao is None:
+        st.info(f'O termo "{termo}" não aparece nas páginas.')
+    else:
+        import pandas as pd
+
+        st.bar_chart(pd.DataFrame({"Página": analise.page_ids, "Ocorrências": distribuicao}).set_index("Página"))
+
+
+# Citações legais encontradas nas páginas, com atalhos para as páginas de cada uma
+@st.fragment
+def citacoes_das_paginas():
+    citacoes = obter_citacoes(entrada, processo)
+    if not len(citacoes):
+        st.info("Nenhuma citação de lei, artigo ou súmula encontrada nas páginas.")
+        return
+    import pandas as pd
+
+    st.dataframe(
+        pd.DataFrame(citacoes.contagens(), columns=["Citação", "Diploma", "Ocorrências", "Páginas"]),
+        use_container_width=True,
+        hide_index=True,
+    )
+    citacao = st.selectbox("Páginas que citam:", [texto for texto, _, _, _ in citacoes.contagens()], key="citacao_paginas")
+    paginas = citacoes.paginas_da(citacao)
+    if len(paginas) > PAGINAS_CITACAO:
+        st.caption(f"Primeiras {PAGINAS_CITACAO} de {milhar(len(paginas))} páginas.")
+    colunas = st.columns(min(len(paginas), 8))
+    for i, page_id in enumerate(paginas[:PAGINAS_CITACAO]):
+        # A consulta destaca a citação na página, como nos resultados da busca
+        colunas[i % len(colunas)].button(f"Página {page_id}", key=f"citacao_pagina_{page_id}", on_click=abrir_pagina,
+                                         args=(page_id, citacao))
+
+
+st.markdown('<h2>📊 Análise Textual</h2>', unsafe_allow_html=True)
+
+st.markdown('<h3>Termos das páginas</h3>', unsafe_allow_html=True)
+termos_das_paginas()
+
+st.markdown('<h3>Citações legais</h3>', unsafe_allow_html=True)
+citacoes_das_paginas()
+
+# Análise de palavras-chave com estilização aprimorada
+st.markdown('<h3>Palavras-chave por categoria</h3>', unsafe_allow_html=True)
+
+# Coletar todas as palavras-chave de todos os subtemas, quaisquer que sejam as categorias
+linhas = [(palavra, categoria) for categoria, itens in processo.metadata.subthemes.items() for palavra in itens]
+
+# Criar um DataFrame com as palavras-chave
+if linhas:
+    # pandas só é importado quando há tabela a exibir
+    import pandas as pd
+
+    df = pd.DataFrame(linhas, columns=["Palavra-chave", "Categoria"])
+
+    st.dataframe(df, use_container_width=True)
+else:
+    st.info("Nenhuma palavra-chave encontrada nos subtemas.")
+
+# Palavras-chave mais frequentes em todos os processos do diretório
+st.markdown('<h3>Palavras-chave do acervo</h3>', unsafe_allow_html=True)
+total_processos, principais = palavras_chave_acervo(diretorio_processos())
+if principais.empty:
+    st.info("Nenhuma palavra-chave encontrada nos processos do acervo.")
+else:
+    categorias = list(principais["categoria"].unique())
+    categoria = st.selectbox("Categoria:", categorias, key="categoria_acervo")
+    st.caption(f"Palavras-chave mais citadas em {total_processos} processo(s) do acervo.")
+    st.dataframe(
+        principais[principais["categoria"] == categoria][["palavra_chave", "processos"]]
+        .rename(columns={"palavra_chave": "Palavra-chave", "processos": "Processos"}),
+        use_container_width=True,
+        hide_index=True,
+    )
+
+# Análise da Base Legal com estilização
+st.markdown('<h3>Base Legal</h3>', unsafe_allow_html=True)
+base_legal = processo.summary.structured_summary.legal_basis
+
+if base_legal:
+    # Citações normalizadas e sem repetição; sem nenhuma reconhecida, o texto separado por vírgulas
+    leis = list(dict.fromkeys(citacao.texto for citacao in extrair_citacoes(base_legal))) or base_legal.split(", ")
+    lei_html = ""
+    for lei in leis:
+        lei_html += f'<li>{lei.strip()}</li>'
+    
+    st.markdown(f'<ul class="destaque">{lei_html}</ul>', unsafe_allow_html=True)
+else:
+    st.info("Nenhuma base legal especificada.")
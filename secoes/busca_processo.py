@@ -0,0 +1,33 @@
+"""Seção Busca no Processo"""
+import streamlit as st
+
+from busca import texto_pagina, trechos
+from comum import abrir_pagina, card, obter_indice_busca, obter_timbre, processo_selecionado
+
+entrada, processo, paginas = processo_selecionado()
+
+st.markdown('<h2>🔎 Busca no Processo</h2>', unsafe_allow_html=True)
+
+consulta = st.text_input("Pesquisar nas páginas:", placeholder="Ex.: tutela antecipada, 926.215.700-20")
+
+if consulta:
+    indice = obter_indice_busca(entrada.caminho, entrada.mtime_ns, entrada.tamanho, processo)
+    resultados = indice.buscar(consulta)
+    
+    if resultados:
+        st.markdown(f"**{len(resultados)} página(s) encontrada(s)**, em ordem de relevância.")
+    else:
+        st.info("Nenhuma página encontrada para a busca.")
+    
+    # Resultados com os trechos destacados e atalho para o visualizador de páginas;
+    # os trechos vêm do texto sem timbre, a mesma parte que o índice considera
+    timbre = obter_timbre(entrada, paginas) if resultados else None
+    for page_id, pontuacao in resultados:
+        pagina = paginas.obter(page_id)
+        trechos_html = "<br>".join(trechos(texto_pagina(pagina, timbre), consulta)) if pagina else ""
+        st.markdown(card(
+            f"Página {page_id}",
+            f'<div class="destaque">{trechos_html}</div><small>Relevância: {pontuacao:.2f}</small>',
+            "📄"
+        ), unsafe_allow_html=True)
+        st.button(f"Abrir página {page_id}", key=f"abrir_{page_id}", on_click=abrir_pagina, args=(page_id, consulta))
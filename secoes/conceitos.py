@@ -0,0 +1,21 @@
+"""Seção Conceitos dos Campos"""
+import streamlit as st
+
+from textos_conceitos import CAMPOS_ESQUEMA, SUBTEMAS_POR_AREA, TEMAS_JURIDICOS, TITULO_SUBTEMAS, TITULO_TEMAS
+
+st.markdown('<h2>📘 Conceitos dos Campos</h2>\n<p style="font-size: 1.1rem; margin-bottom: 2rem;">Explicação detalhada sobre o significado e importância de cada campo do esquema JSON.</p>', unsafe_allow_html=True)
+
+# Uma seção do esquema JSON por expander (textos preparados em textos_conceitos)
+for titulo, conceitos in CAMPOS_ESQUEMA:
+    with st.expander(titulo, expanded=False):
+        st.markdown(conceitos)
+
+# Temas e Subtemas Jurídicos
+with st.expander(TITULO_TEMAS, expanded=False):
+    st.markdown(f"{TEMAS_JURIDICOS}\n\n{TITULO_SUBTEMAS}")
+
+    # Usando tabs para mostrar subtemas em vez de expanders aninhados
+    subtemas_tabs = st.tabs([area for area, _ in SUBTEMAS_POR_AREA])
+    for aba, (_, subtemas) in zip(subtemas_tabs, SUBTEMAS_POR_AREA):
+        with aba:
+            st.markdown(subtemas)
@@ -0,0 +1,27 @@
+"""Seção Metadados"""
+import streamlit as st
+
+from comum import processo_selecionado
+from renderizacao import html_secao
+
+entrada, processo, _ = processo_selecionado()
+html = html_secao("metadados", entrada, processo)
+
+st.markdown('<h2>🔍 Metadados do Processo</h2>', unsafe_allow_html=True)
+
+# Seção de metadados gerais em formato de cards
+col1, col2 = st.columns(2)
+col1.markdown(html["tribunal"], unsafe_allow_html=True)
+col2.markdown(html["caso"], unsafe_allow_html=True)
+
+# Seção de subtemas com design aprimorado
+st.markdown('<h3>Subtemas</h3>', unsafe_allow_html=True)
+if html["subtemas"]:
+    tabs = st.tabs([rotulo for rotulo, _ in html["subtemas"]])
+    for aba, (_, itens) in zip(tabs, html["subtemas"]):
+        if itens:
+            aba.markdown(itens, unsafe_allow_html=True)
+        else:
+            aba.info("Nenhum subtema encontrado nesta categoria.")
+else:
+    st.info("Nenhum subtema encontrado para este processo.")
@@ -0,0 +1,10 @@
+"""Seção Pontos Controversos"""
+import streamlit as st
+
+from comum import processo_selecionado
+from renderizacao import html_secao
+
+entrada, processo, _ = processo_selecionado()
+
+# Título e todos os cards dos pontos em um único elemento
+st.markdown('<h2>⚠️ Pontos Controversos</h2>\n' + html_secao("pontos", entrada, processo), unsafe_allow_html=True)
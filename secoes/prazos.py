@@ -0,0 +1,76 @@
+"""Seção Calendário de Prazos"""
+import os
+from datetime import date, timedelta
+
+import pandas as pd
+import streamlit as st
+
+from comum import abrir_pagina, datas_acervo, diretorio_processos, milhar
+from datas import CAMPOS, RECONHECIDAS, SITUACOES
+
+# Processos listados para abrir; a contagem e o gráfico cobrem o período inteiro
+LIMITE_LISTA = 500
+
+st.markdown('<h2>📅 Calendário de Prazos</h2>\n<p style="font-size: 1.1rem; margin-bottom: 2rem;">Prazos de resposta, distribuições e sentenças de todos os processos do acervo, por período.</p>', unsafe_allow_html=True)
+
+_, tabela = datas_acervo(diretorio_processos())
+
+col1, col2 = st.columns([1, 2])
+with col1:
+    campo = st.selectbox("Data:", list(CAMPOS), format_func=CAMPOS.get, key="campo_prazos")
+with col2:
+    # Do próximo mês por padrão, com o calendário aberto a todas as datas do campo no acervo
+    hoje = date.today()
+    primeira, ultima = tabela.limites(campo) or (hoje, hoje)
+    periodo = st.date_input("Período:", (hoje, hoje + timedelta(days=30)), key="periodo_prazos", format="DD/MM/YYYY",
+                            min_value=min(primeira, hoje), max_value=max(ultima, hoje + timedelta(days=30)))
+
+# Enquanto o usuário escolhe o fim do período, o date_input devolve só o início
+inicio, fim = (periodo[0], periodo[-1]) if isinstance(periodo, (tuple, list)) and periodo else (periodo, periodo)
+situacoes = tabela.situacoes(campo)
+reconhecidas = sum(situacoes[situacao] for situacao in RECONHECIDAS)
+
+colunas = st.columns(3)
+colunas[0].metric("No período", milhar(tabela.contar(campo, inicio, fim)))
+colunas[1].metric("Com a data reconhecida", f"{milhar(reconhecidas)} de {milhar(len(tabela))}")
+colunas[2].metric("Não reconhecidas", milhar(situacoes["invalida"]))
+
+if not reconhecidas:
+    st.info(f"Nenhum processo do acervo tem o campo \"{CAMPOS[campo]}\" com uma data reconhecida.")
+else:
+    st.caption(f"{CAMPOS[campo]} no acervo: de {primeira:%d/%m/%Y} a {ultima:%d/%m/%Y}.")
+
+    # Contagem por dia por busca binária no índice ordenado, inclusive os dias sem processos
+    dias, quantidades = tabela.por_dia(campo, inicio, fim)
+    if len(dias) > 1:
+        st.bar_chart(pd.DataFrame({"Dia": dias, "Processos": quantidades}).set_index("Dia"))
+
+    no_periodo = tabela.contar(campo, inicio, fim)
+    processos = tabela.entre(campo, inicio, fim, limite=LIMITE_LISTA)
+    if not processos:
+        st.info("Nenhum processo com essa data no período.")
+    else:
+        if no_periodo > LIMITE_LISTA:
+            st.caption(f"Mostrando os {LIMITE_LISTA} primeiros de {milhar(no_periodo)} processos do período.")
+        st.dataframe(pd.DataFrame({
+            CAMPOS[campo]: [data for data, _ in processos],
+            "Processo": [p.process_number or os.path.basename(p.caminho) for _, p in processos],
+            "Tribunal": [p.court for _, p in processos],
+            "Tema": [p.theme for _, p in processos],
+            "Texto original": [p.datas.get(campo) for _, p in processos],
+        }), use_container_width=True, hide_index=True)
+
+        indice = st.selectbox("Abrir processo:", range(len(processos)), key="processo_prazos",
+                              format_func=lambda i: f"{processos[i][0]:%d/%m/%Y} · "
+                                                    f"{processos[i][1].process_number or os.path.basename(processos[i][1].caminho)}")
+        st.button("Abrir processo", key="abrir_prazo", on_click=abrir_pagina, args=(1, None, processos[indice][1].caminho))
+
+# Como cada campo foi interpretado: as datas não reconhecidas aparecem aqui em vez de sumirem do calendário
+with st.expander("Interpretação das datas", expanded=False):
+    st.markdown("".join(f"- {SITUACOES[situacao]}: {milhar(situacoes[situacao])}\n" for situacao in SITUACOES))
+    nao_reconhecidas = tabela.nao_reconhecidas(campo)
+    if nao_reconhecidas:
+        st.dataframe(pd.DataFrame({
+            "Processo": [p.process_number or os.path.basename(p.caminho) for p in nao_reconhecidas],
+            "Texto original": [p.datas.get(campo) for p in nao_reconhecidas],
+        }), use_container_width=True, hide_index=True)
@@ -0,0 +1,160 @@
+"""Seção Resultados por Página"""
+import inspect
+
+import streamlit as st
+
+from busca import destacar
+from comum import (buscar_no_acervo, faixa_calor, milhar, obter_estatisticas_busca, obter_estatisticas_paginas, obter_timbre,
+                   processo_selecionado)
+from entidades import extrair_entidades, rotulo
+from instrumentacao import fase, medir_fragmento
+
+# Atalhos de teclado em botões só existem nas versões mais novas do Streamlit
+ATALHOS = "shortcut" in inspect.signature(st.button).parameters
+
+
+# Séries do mapa do documento; "busca" são as ocorrências de um termo, pelo índice de busca
+SERIES_MAPA = {"imagens": "Páginas com imagens", "texto": "Tamanho do texto", "texto_imagem": "Tamanho do texto de imagem",
+               "palavras_chave": "Palavras-chave dos subtemas", "busca": "Ocorrências de um termo"}
+
+
+# Mapa do documento: faixa de calor de uma série por página e somas por intervalo de páginas,
+# respondidas pelas somas acumuladas sem percorrer as páginas
+def mapa_documento(entrada, processo, total):
+    estatisticas = obter_estatisticas_paginas(entrada, processo)
+    col_serie, col_termo = st.columns([1, 1])
+    serie = col_serie.selectbox("Mapa do documento:", list(SERIES_MAPA), format_func=SERIES_MAPA.get, key="serie_mapa")
+    # Palavras-chave e busca percorrem os textos: só são montadas quando escolhidas
+    extra = rotulo_extra = None
+    if serie == "palavras_chave":
+        extra, rotulo_extra = obter_estatisticas_paginas(entrada, processo, serie), "Palavras-chave"
+    elif serie == "busca":
+        termo = col_termo.text_input("Termo:", value=st.session_state.get("destaque") or "", key="termo_mapa",
+                                     placeholder="Ex.: tutela antecipada")
+        if termo:
+            extra, rotulo_extra = obter_estatisticas_busca(entrada, processo, termo), f'"{termo}"'
+    fonte = extra if serie in ("palavras_chave", "busca") else estatisticas
+    if fonte is not None:
+        st.markdown(faixa_calor(fonte.faixa(serie), st.session_state.get("pagina", 1)), unsafe_allow_html=True)
+
+    with st.expander("📐 Estatísticas por intervalo de páginas"):
+        primeira, ultima = st.slider("Páginas:", 1, max(total, 2), (1, max(total, 1)), key="intervalo_paginas")
+        colunas = st.columns(3 if extra else 2)
+        colunas[0].metric("Páginas com imagens", f"{estatisticas.paginas_com('imagens', primeira, ultima)} de "
+                          f"{estatisticas.paginas_no_intervalo(primeira, ultima)}")
+        colunas[1].metric("Caracteres de texto", milhar(estatisticas.soma("texto", primeira, ultima)))
+        if extra:
+            colunas[2].metric(rotulo_extra, f"{milhar(extra.soma(serie, primeira, ultima))} em "
+                              f"{extra.paginas_com(serie, primeira, ultima)} pág.")
+
+
+# Botões de página anterior/próxima (também pelas setas do teclado)
+def mudar_pagina(passo, total):
+    st.session_state.pagina = min(max(st.session_state.get("pagina", 1) + passo, 1), total)
+
+
+# Visualizador de páginas: trocar de página refaz apenas este fragmento,
+# sem executar de novo o app.py, a barra lateral e o restante da seção
+@st.fragment
+def visualizador_paginas():
+    with medir_fragmento("visualizador de páginas"):
+        entrada, processo, paginas = processo_selecionado()
+        total = processo.file.total_pages
+
+        mapa_documento(entrada, processo, total)
+
+        col_anterior, col_pagina, col_proxima = st.columns([1, 4, 1], vertical_alignment="bottom")
+        with col_pagina:
+            # Seleção de página estilizada
+            pagina_selecionada = st.selectbox(
+                "Selecione uma página:",
+                range(1, total + 1),
+                format_func=lambda x: f"Página {x}",
+                key="pagina",
+            )
+        col_anterior.button("◀ Anterior", on_click=mudar_pagina, args=(-1, total), disabled=pagina_selecionada <= 1,
+                            **({"shortcut": "ArrowLeft"} if ATALHOS else {}))
+        col_proxima.button("Próxima ▶", on_click=mudar_pagina, args=(1, total), disabled=pagina_selecionada >= total,
+                           **({"shortcut": "ArrowRight"} if ATALHOS else {}))
+
+        # Sentido da navegação, para a leitura antecipada das páginas vizinhas
+        anterior = st.session_state.get("pagina_exibida")
+        direcao = -1 if anterior is not None and pagina_selecionada < anterior else 1
+        st.session_state.pagina_exibida = pagina_selecionada
+
+        # Arquivos grandes têm as páginas indexadas em segundo plano, à medida que são lidas
+        if paginas.erro_indexacao:
+            st.error(f"Erro ao ler as páginas do arquivo: {paginas.erro_indexacao}")
+        elif not paginas.indexacao_concluida:
+            st.progress(paginas.progresso, text=f"Lendo páginas do arquivo... {paginas.progresso:.0%}")
+
+        # Buscar a página selecionada no índice por page_id
+        with fase("acesso ao modelo (página)"):
+            pagina = paginas.obter(pagina_selecionada, direcao)
+
+        # Exibir os detalhes da página com estilo melhorado
+        if pagina:
+            col1, col2 = st.columns([3, 1])
+
+            with col1:
+                st.markdown(f'<h3>Conteúdo da Página {pagina.page_id}</h3>', unsafe_allow_html=True)
+
+                # Tabs para texto extraído e texto de imagem
+                tabs = st.tabs(["📝 Texto", "🖼️ Texto de Imagem (se houver)"])
+
+                with tabs[0]:
+                    # Cabeçalho e rodapé repetidos em todas as páginas (papel timbrado)
+                    texto = pagina.extracted_text
+                    if st.toggle("Ocultar timbre (cabeçalho e rodapé repetidos)", key="ocultar_timbre"):
+                        texto = obter_timbre(entrada, paginas).remover(texto)
+                    consulta = st.session_state.get("destaque")
+                    marcados = []
+                    if st.toggle("Destacar CPF, CNPJ, OAB, processos e e-mails", value=True, key="destacar_entidades"):
+                        marcados = [(e.inicio, e.fim, rotulo(e.tipo, e.valor)) for e in extrair_entidades(texto)]
+                    if consulta or marcados:
+                        # Texto com as ocorrências da busca e os identificadores destacados
+                        st.markdown(f'<div class="destaque" style="max-height: 400px; overflow-y: auto; white-space: pre-wrap;">{destacar(texto, consulta, marcados)}</div>', unsafe_allow_html=True)
+                        if consulta:
+                            st.button("Limpar destaque", on_click=lambda: st.session_state.update(destaque=None))
+                    else:
+                        st.text_area("Texto Extraído", texto, height=400)
+
+                with tabs[1]:
+                    if pagina.has_images and pagina.extracted_image_text:
+                        st.text_area("Texto Extraído de Imagens", pagina.extracted_image_text, height=400)
+                    else:
+                        st.info("Esta página não contém imagens ou texto extraído de imagens.")
+
+            with col2:
+                # Informações da página usando componentes nativos do Streamlit
+                st.markdown("### ℹ️ Informações da Página")
+                st.markdown(f"**Nome do Arquivo:** {pagina.file_name}")
+                st.markdown(f"**Contém Imagens:** {'Sim' if pagina.has_images else 'Não'}")
+
+                # Linha de separação
+                st.markdown("---")
+
+                # Resumo da página
+                st.markdown("### 📝 Resumo da Página")
+                st.markdown(f"{pagina.summary}")
+
+                # Identificadores da página (texto e texto de imagem), com atalho para a busca no acervo
+                entidades = dict.fromkeys((e.tipo, e.valor) for e in extrair_entidades(
+                    f"{pagina.extracted_text}\n{pagina.extracted_image_text or ''}"))
+                if entidades:
+                    st.markdown("---")
+                    st.markdown("### 🪪 Identificadores")
+                    for i, (tipo, valor) in enumerate(entidades):
+                        if st.button(rotulo(tipo, valor), key=f"entidade_{i}", help="Processos do acervo em que aparece"):
+                            # A troca de seção exige executar o app inteiro, não só este fragmento
+                            buscar_no_acervo(valor)
+                            st.rerun()
+        elif not paginas.indexacao_concluida:
+            st.info(f"A página {pagina_selecionada} ainda não foi lida do arquivo.")
+            st.button("Atualizar")
+        else:
+            st.error(f"Página {pagina_selecionada} não encontrada nos resultados.")
+
+
+st.markdown('<h2>📄 Resultados por Página</h2>', unsafe_allow_html=True)
+visualizador_paginas()
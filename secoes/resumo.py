@@ -0,0 +1,32 @@
+"""Seção Resumo do Processo"""
+import streamlit as st
+
+from comum import processo_selecionado
+from renderizacao import html_secao
+
+entrada, processo, _ = processo_selecionado()
+html = html_secao("resumo", entrada, processo)
+
+st.markdown('<h2>📝 Resumo do Processo</h2>', unsafe_allow_html=True)
+
+# Informações básicas com métricas estilizadas
+col1, col2, col3 = st.columns(3)
+with col1:
+    st.metric("📄 Total de Páginas", processo.file.total_pages)
+with col2:
+    st.metric("🖼️ Páginas com Imagens", processo.summary.pages_with_images)
+with col3:
+    st.metric("⚠️ Páginas com Erros", processo.summary.pages_with_errors)
+
+# Resumo estruturado em formato de cards
+st.markdown('<h3>Resumo Estruturado</h3>', unsafe_allow_html=True)
+
+# Criação de tabs para organizar o resumo estruturado; os cards de cada aba vão em um único elemento
+tabs = st.tabs(["📋 Visão Geral", "📃 Detalhes", "⚖️ Aspectos Legais"])
+for aba, cards in zip(tabs, html["abas"]):
+    aba.markdown(cards, unsafe_allow_html=True)
+
+# Resumo completo
+st.markdown('<h3>Resumo Completo</h3>', unsafe_allow_html=True)
+with st.expander("Expandir para ver o resumo completo"):
+    st.markdown(html["resumo_completo"], unsafe_allow_html=True)
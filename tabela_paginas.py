@@ -0,0 +1,163 @@
+"""Tabela compacta e somente leitura das páginas de um processo
+
+Em vez de uma lista de PageResult (um modelo com __dict__ por página), as
+páginas ficam em colunas:
+
+- page_id em um array('q') (o modelo aceita qualquer int, inclusive negativo);
+- has_images e a presença de extracted_image_text em arrays de bits;
+- file_name derivado de um modelo (prefixo + page_id + sufixo), guardando
+  por extenso apenas os nomes fora do padrão;
+- textos de cada campo concatenados em UTF-8, com as posições em array('Q');
+- o extracted_text sem o timbre (cabeçalho e rodapé repetidos, ver
+  timbre.py): cada linha de timbre distinta é guardada uma vez, e cada
+  página guarda só pares (posição da linha, número da linha).
+
+Cada acesso monta o PageResult com model_construct, sem nova validação,
+então as seções continuam recebendo o mesmo modelo de sempre.
+"""
+from array import array
+from collections.abc import Sequence
+
+from modelos import PageResult
+from timbre import AMOSTRA, Timbre, recompor
+
+_CAMPOS_TEXTO = ("extracted_text", "extracted_image_text", "summary")
+
+
+def _modelo_nome(pagina):
+    """(prefixo, sufixo) do file_name em torno do page_id, ou None se o nome não contém o page_id"""
+    numero = str(pagina.page_id)
+    posicao = pagina.file_name.rfind(numero)
+    if posicao < 0:
+        return None
+    return pagina.file_name[:posicao], pagina.file_name[posicao + len(numero):]
+
+
+def _ler_bit(bits, indice):
+    return bits[indice >> 3] >> (indice & 7) & 1
+
+
+class TabelaPaginas(Sequence):
+    """Páginas em colunas; funciona como processo.results e como fonte de páginas do navegador"""
+
+    __slots__ = ("page_ids", "_imagens", "_com_texto_imagem", "_prefixo", "_sufixo", "_nomes_fora_do_padrao",
+                 "_textos", "_posicoes", "_primeiro_id", "_indice_por_id",
+                 "timbre", "_linhas_timbre", "_referencias", "_inicio_referencias")
+
+    indexacao_concluida = True
+    progresso = 1.0
+    erro_indexacao = None
+
+    def __init__(self, paginas, separar_timbre=True):
+        paginas = list(paginas)
+        total = len(paginas)
+        self.timbre = Timbre.detectar(p.extracted_text for p in paginas[:AMOSTRA]) if separar_timbre else Timbre()
+        # Linhas de timbre distintas e, por página, pares planos (posição da linha, número da linha)
+        self._linhas_timbre = []
+        numeros_linhas = {}
+        self._referencias = array("I")
+        self._inicio_referencias = array("I", [0])
+        self.page_ids = array("q", (pagina.page_id for pagina in paginas))
+        self._imagens = bytearray((total + 7) // 8)
+        self._com_texto_imagem = bytearray((total + 7) // 8)
+
+        modelo = _modelo_nome(paginas[0]) if paginas else None
+        self._prefixo, self._sufixo = modelo or ("", "")
+        self._nomes_fora_do_padrao = {}
+
+        textos = {campo: [] for campo in _CAMPOS_TEXTO}
+        for indice, pagina in enumerate(paginas):
+            if pagina.has_images:
+                self._imagens[indice >> 3] |= 1 << (indice & 7)
+            if pagina.extracted_image_text is not None:
+                self._com_texto_imagem[indice >> 3] |= 1 << (indice & 7)
+            if modelo is None or pagina.file_name != f"{self._prefixo}{pagina.page_id}{self._sufixo}":
+                self._nomes_fora_do_padrao[indice] = pagina.file_name
+            conteudo, referencias = self.timbre.separar(pagina.extracted_text)
+            for posicao, linha in referencias:
+                numero = numeros_linhas.get(linha)
+                if numero is None:
+                    numero = numeros_linhas[linha] = len(self._linhas_timbre)
+                    self._linhas_timbre.append(linha)
+                self._referencias.extend((posicao, numero))
+            self._inicio_referencias.append(len(self._referencias))
+            textos["extracted_text"].append(conteudo.encode("utf-8"))
+            for campo in ("extracted_image_text", "summary"):
+                textos[campo].append((getattr(pagina, campo) or "").encode("utf-8"))
+
+        self._textos = {}
+        self._posicoes = {}
+        for campo, trechos in textos.items():
+            posicoes = array("Q", [0])
+            for trecho in trechos:
+                posicoes.append(posicoes[-1] + len(trecho))
+            self._textos[campo] = b"".join(trechos)
+            self._posicoes[campo] = posicoes
+
+        # page_ids consecutivos (o caso comum) dispensam o dicionário page_id -> índice
+        self._primeiro_id = self.page_ids[0] if total else 0
+        consecutivos = all(page_id == self._primeiro_id + i for i, page_id in enumerate(self.page_ids))
+        self._indice_por_id = None if consecutivos else {page_id: i for i, page_id in enumerate(self.page_ids)}
+
+    def __len__(self):
+        return len(self.page_ids)
+
+    def _texto(self, campo, indice):
+        posicoes = self._posicoes[campo]
+        return str(self._textos[campo][posicoes[indice]:posicoes[indice + 1]], "utf-8")
+
+    def texto_sem_timbre(self, indice):
+        """extracted_text da página sem as linhas de timbre"""
+        return self._texto("extracted_text", indice)
+
+    def texto_extraido(self, indice):
+        """extracted_text original da página, com o timbre recolocado"""
+        inicio, fim = self._inicio_referencias[indice], self._inicio_referencias[indice + 1]
+        referencias = [(self._referencias[i], self._linhas_timbre[self._referencias[i + 1]]) for i in range(inicio, fim, 2)]
+        return recompor(self._texto("extracted_text", indice), referencias)
+
+    def nome_arquivo(self, indice):
+        nome = self._nomes_fora_do_padrao.get(indice)
+        if nome is None:
+            nome = f"{self._prefixo}{self.page_ids[indice]}{self._sufixo}"
+        return nome
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return [self[i] for i in range(*indice.indices(len(self)))]
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError(indice)
+        # Dados já validados na montagem da tabela: dispensa nova validação
+        return PageResult.model_construct(
+            page_id=self.page_ids[indice],
+            file_name=self.nome_arquivo(indice),
+            has_images=bool(_ler_bit(self._imagens, indice)),
+            extracted_text=self.texto_extraido(indice),
+            extracted_image_text=self._texto("extracted_image_text", indice) if _ler_bit(self._com_texto_imagem, indice) else None,
+            summary=self._texto("summary", indice),
+        )
+
+    def indice(self, page_id):
+        """Posição da página na tabela, ou None se o page_id não existe"""
+        if self._indice_por_id is not None:
+            return self._indice_por_id.get(page_id)
+        indice = page_id - self._primeiro_id
+        return indice if 0 <= indice < len(self) else None
+
+    def obter(self, page_id, direcao=1):
+        indice = self.indice(page_id)
+        return None if indice is None else self[indice]
+
+    @property
+    def bytes_residentes(self):
+        """Memória aproximada da tabela (colunas, textos e timbre)"""
+        return (
+            self.page_ids.itemsize * len(self.page_ids) + 2 * len(self._imagens)
+            + sum(len(textos) for textos in self._textos.values())
+            + sum(p.itemsize * len(p) for p in self._posicoes.values())
+            + sum(len(nome) for nome in self._nomes_fora_do_padrao.values())
+            + sum(len(linha) for linha in self._linhas_timbre)
+            + self._referencias.itemsize * (len(self._referencias) + len(self._inicio_referencias))
+        )
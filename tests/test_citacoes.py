@@ -0,0 +1,85 @@
+"""Testes da extração e normalização das citações legais (citacoes.py)"""
+import unittest
+
+from citacoes import extrair_citacoes
+
+
+def textos(texto):
+    return [citacao.texto for citacao in extrair_citacoes(texto)]
+
+
+class TestListasDeArtigos(unittest.TestCase):
+    def test_dois_artigos_com_e(self):
+        self.assertEqual(textos("nos termos dos arts. 186 e 927 do Código Civil"), ["Art. 186 do CC", "Art. 927 do CC"])
+
+    def test_lista_com_virgulas(self):
+        self.assertEqual(textos("Arts. 186, 187 e 927 do CC"), ["Art. 186 do CC", "Art. 187 do CC", "Art. 927 do CC"])
+
+    def test_virgula_antes_do_e(self):
+        self.assertEqual(textos("art. 5º, § 1º, e 37 da CF"), ["Art. 5 da CF", "Art. 37 da CF"])
+
+    def test_lista_de_artigos_de_lei(self):
+        self.assertEqual(textos("arts. 1º e 3º da Lei 8.078/90"), ["Art. 1 da Lei 8.078", "Art. 3 da Lei 8.078"])
+
+    def test_paragrafos_nao_viram_artigos(self):
+        self.assertEqual(textos("art. 1.022, §§ 1º e 2º do CPC"), ["Art. 1.022 do CPC"])
+
+    def test_artigos_repetidos_na_lista(self):
+        self.assertEqual(textos("arts. 300 e 300 do CPC"), ["Art. 300 do CPC"])
+
+
+class TestSeguintes(unittest.TestCase):
+    def test_e_seguintes(self):
+        self.assertEqual(textos("art. 98 e seguintes do CPC"), ["Art. 98 do CPC"])
+
+    def test_ss(self):
+        self.assertEqual(textos("arts. 98 e ss. do CPC"), ["Art. 98 do CPC"])
+        self.assertEqual(textos("art. 98, ss., do CPC"), ["Art. 98 do CPC"])
+
+
+class TestFormasSimples(unittest.TestCase):
+    def test_artigo_com_complementos(self):
+        for texto in ("art. 300 do CPC", "artigo 300 do Código de Processo Civil", "art. 300, caput, do CPC"):
+            self.assertEqual(textos(texto), ["Art. 300 do CPC"], texto)
+
+    def test_lei_e_sumula(self):
+        self.assertEqual(textos("Lei nº 8.245/91 e Súmula 479 do STJ"), ["Lei 8.245", "Súmula 479 do STJ"])
+
+
+class TestAnoDoDiploma(unittest.TestCase):
+    def test_ano_com_quatro_digitos(self):
+        self.assertEqual(textos("art. 300 do CPC/2015"), ["Art. 300 do CPC"])
+
+    def test_ano_com_dois_digitos(self):
+        self.assertEqual(textos("art. 300 do CPC/15"), ["Art. 300 do CPC"])
+        self.assertEqual(textos("artigos 186 e 927 do CC/02"), ["Art. 186 do CC", "Art. 927 do CC"])
+        self.assertEqual(textos("art. 5º da CF/88"), ["Art. 5 da CF"])
+
+    def test_sigla_grudada_nao_e_diploma(self):
+        self.assertEqual(textos("art. 300 do CPC/2015x"), [])
+
+
+class TestLeis(unittest.TestCase):
+    def test_lei_federal(self):
+        self.assertEqual(textos("Lei Federal nº 8.245/91"), ["Lei 8.245"])
+
+    def test_lei_estadual_tem_chave_propria(self):
+        self.assertEqual(textos("Lei Estadual nº 1.234/2000"), ["Lei Estadual 1.234"])
+
+    def test_ambos_do(self):
+        self.assertEqual(textos("arts. 319 e 320, ambos do CPC"), ["Art. 319 do CPC", "Art. 320 do CPC"])
+        self.assertEqual(textos("arts. 1º e 3º, ambos da Lei 8.078/90"), ["Art. 1 da Lei 8.078", "Art. 3 da Lei 8.078"])
+
+
+class TestTribunais(unittest.TestCase):
+    def test_tribunal_por_extenso(self):
+        self.assertEqual(textos("Súmula 479 do Superior Tribunal de Justiça"), ["Súmula 479 do STJ"])
+        self.assertEqual(textos("Súmula 331 do Tribunal Superior do Trabalho"), ["Súmula 331 do TST"])
+
+    def test_tratamento_abreviado(self):
+        for texto in ("Súmula 479 do E. STJ", "Súmula nº 479 do C. STJ", "Súmula 479 do egrégio STJ"):
+            self.assertEqual(textos(texto), ["Súmula 479 do STJ"], texto)
+
+
+if __name__ == "__main__":
+    unittest.main()
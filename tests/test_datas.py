@@ -0,0 +1,40 @@
+"""Testes da interpretação dos campos de data (datas.py)"""
+import unittest
+from datetime import date
+
+from datas import interpretar_data
+
+
+class TestIntervalos(unittest.TestCase):
+    def test_vale_o_ultimo_dia(self):
+        for texto in ("02/10/2025 a 05/10/2025", "02/10/2025 - 05/10/2025", "2025-10-02 a 2025-10-05",
+                      "de 2 de outubro de 2025 até 5 de outubro de 2025"):
+            self.assertEqual(interpretar_data(texto), (date(2025, 10, 5), "intervalo"), texto)
+
+    def test_datas_soltas_no_texto_nao_sao_intervalo(self):
+        self.assertEqual(interpretar_data("Distribuído em 01/02/2025, sentença em 05/06/2025"),
+                         (date(2025, 2, 1), "no_texto"))
+
+
+class TestDatasInvalidas(unittest.TestCase):
+    def test_dia_fora_do_mes(self):
+        self.assertEqual(interpretar_data("31/02/2025"), (None, "invalida"))
+        self.assertEqual(interpretar_data("2025-13-01"), (None, "invalida"))
+
+    def test_texto_sem_data(self):
+        self.assertEqual(interpretar_data("15 dias úteis"), (None, "invalida"))
+        self.assertEqual(interpretar_data("  "), (None, "vazia"))
+
+    def test_data_valida_depois_de_uma_invalida(self):
+        self.assertEqual(interpretar_data("31/02/2025, corrigido para 03/03/2025"), (date(2025, 3, 3), "no_texto"))
+
+
+class TestAnoComDoisDigitos(unittest.TestCase):
+    def test_seculo(self):
+        self.assertEqual(interpretar_data("10/02/25"), (date(2025, 2, 10), "numerica"))
+        self.assertEqual(interpretar_data("10.02.69"), (date(2069, 2, 10), "numerica"))
+        self.assertEqual(interpretar_data("10-02-70"), (date(1970, 2, 10), "numerica"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+"""Testes dos identificadores (entidades.py)"""
+import unittest
+
+from entidades import extrair_entidades
+
+
+def valores(texto, tipo):
+    return [entidade.valor for entidade in extrair_entidades(texto) if entidade.tipo == tipo]
+
+
+class TestEmail(unittest.TestCase):
+    def test_email_grudado_na_palavra_seguinte(self):
+        self.assertEqual(valores("barbarabuenno@gmail.compor meio deste", "email"), ["barbarabuenno@gmail.com"])
+        self.assertEqual(valores("X@GMAIL.COMAdvogado", "email"), ["x@gmail.com"])
+
+    def test_dominio_com_codigo_de_pais(self):
+        self.assertEqual(valores("contato@escritorio.com.br.", "email"), ["contato@escritorio.com.br"])
+        self.assertEqual(valores("intimação: joao@tjsp.jus.br, ", "email"), ["joao@tjsp.jus.br"])
+        self.assertEqual(valores("x@adv.oabsp.org.br", "email"), ["x@adv.oabsp.org.br"])
+
+    def test_codigo_de_pais_grudado_na_palavra_seguinte(self):
+        self.assertEqual(valores("contato@escritorio.com.brpor meio", "email"), ["contato@escritorio.com.br"])
+        self.assertEqual(valores("x@tjsp.jus.brfls. 12", "email"), ["x@tjsp.jus.br"])
+        self.assertEqual(valores("socio@advocacia.adv.brOAB/SP", "email"), ["socio@advocacia.adv.br"])
+        self.assertEqual(valores("X@TJSP.JUS.BRProcesso", "email"), ["x@tjsp.jus.br"])
+
+    def test_usuario_e_subdominio(self):
+        self.assertEqual(valores("maria.silva+juridico@mail.gmail.com", "email"), ["maria.silva+juridico@mail.gmail.com"])
+
+    def test_sem_tld(self):
+        self.assertEqual(valores("a@b.c", "email"), [])
+
+
+class TestNumeros(unittest.TestCase):
+    def test_cpf_com_e_sem_pontuacao(self):
+        self.assertEqual(valores("CPF 926.215.700-20 e 92621570020", "cpf"), ["926.215.700-20", "926.215.700-20"])
+
+    def test_digito_verificador_errado(self):
+        self.assertEqual(valores("CPF 926.215.700-21", "cpf"), [])
+
+    def test_oab(self):
+        self.assertEqual(valores("OAB/SP 364.171", "oab"), ["OAB/SP 364.171"])
+
+
+if __name__ == "__main__":
+    unittest.main()
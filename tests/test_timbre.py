@@ -0,0 +1,46 @@
+"""Testes da detecção e separação do timbre (timbre.py)"""
+import unittest
+
+from modelos import PageResult
+from timbre import AMOSTRA, Timbre, com_timbre, recompor
+
+CABECALHO = ["SILVA & SOUZA ADVOGADOS ASSOCIADOS", "Rua das Flores, 100 - São Paulo/SP"]
+RODAPE = ["Tel. (11) 3333-4444 | contato@silvasouza.adv.br"]
+
+
+def corpo(numero):
+    # Sem dígitos, que a normalização trocaria por "#": cada linha de conteúdo é única
+    return [f"Parágrafo {''.join(chr(97 + int(d)) for d in str(numero * 8 + i))} do conteúdo da petição."
+            for i in range(8)]
+
+
+def pagina(numero, timbrada=True):
+    linhas = corpo(numero)
+    if timbrada:
+        linhas = CABECALHO + linhas + RODAPE + [f"fls. {numero}"]
+    return PageResult(page_id=numero, file_name=f"pagina_{numero}.png", extracted_text="\n".join(linhas),
+                      has_images=False, summary="")
+
+
+class TestTimbre(unittest.TestCase):
+    def test_remove_o_timbre_e_recompoe_o_original(self):
+        paginas = [pagina(n) for n in range(1, 11)]
+        timbre, paginas = com_timbre(paginas)
+        for p in paginas:
+            conteudo, referencias = timbre.separar(p.extracted_text)
+            self.assertEqual(conteudo.split("\n"), corpo(p.page_id))
+            self.assertEqual(recompor(conteudo, referencias), p.extracted_text)
+
+    def test_timbre_so_em_parte_das_secoes(self):
+        # Os primeiros 40 documentos sem timbre (anexos) e a petição timbrada depois deles
+        paginas = [pagina(n, timbrada=n > 40) for n in range(1, AMOSTRA + 1)]
+        timbre, _ = com_timbre(paginas)
+        self.assertEqual(timbre.remover(paginas[-1].extracted_text).split("\n"), corpo(AMOSTRA))
+        self.assertEqual(timbre.remover(paginas[0].extracted_text), paginas[0].extracted_text)
+
+    def test_sem_timbre(self):
+        self.assertFalse(Timbre.detectar(pagina(n, timbrada=False).extracted_text for n in range(1, 11)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,679 @@
+"""Textos estáticos da seção Conceitos dos Campos, preparados uma vez por processo"""
+import textwrap
+
+
+def _markdown(texto):
+    return textwrap.dedent(texto).strip()
+
+
+# Expanders com o conceito dos campos de cada parte do JSON: (título, Markdown)
+CAMPOS_ESQUEMA = [
+    ("📁 Seção FILE", _markdown("""
+    ### Arquivo Original
+    Esta seção contém informações básicas sobre o arquivo original processado.
+    
+    | Campo | Conceito |
+    |-------|----------|
+    | `file_name` | Nome do arquivo original submetido para análise. Geralmente contém o número do processo como identificador. |
+    | `file_type` | Formato do arquivo original, como PDF, DOCX, JPG. Importante para determinar o método de extração adequado. |
+    | `total_pages` | Quantidade total de páginas do documento, utilizado para controle de processamento e verificação de integridade. |
+    """)),
+    ("📊 Seção RESULTS", _markdown("""
+    ### Resultados por Página
+    Lista de resultados do processamento de cada página individual do documento.
+    
+    | Campo | Conceito |
+    |-------|----------|
+    | `page_id` | Identificador sequencial único para cada página, facilitando referências e organização dos dados. |
+    | `file_name` | Nome específico do arquivo da página atual, geralmente o nome original acrescido do número da página. |
+    | `has_images` | Indicador booleano que sinaliza a presença de elementos visuais como carimbos, assinaturas ou imagens na página. |
+    | `extracted_text` | Conteúdo textual extraído diretamente da página usando tecnologias de OCR (Optical Character Recognition). Representa o texto principal do documento. |
+    | `extracted_image_text` | Texto obtido especificamente de elementos visuais na página através de OCR especializado. Pode conter informações cruciais como assinaturas, carimbos oficiais ou anotações manuscritas. |
+    | `summary` | Resumo conciso do conteúdo principal da página, facilitando a navegação rápida pelo documento sem necessidade de ler o texto completo. |
+    """)),
+    ("🏷️ Seção METADATA", _markdown("""
+    ### Metadados do Processo
+    Contém metadados estruturados e dados críticos extraídos do documento judicial.
+    
+    | Campo | Conceito |
+    |-------|----------|
+    | `is_approved` | Indicador de validação que confirma se os campos obrigatórios (número do processo, tribunal e jurisdição) foram extraídos com sucesso. |
+    | `process_number` | Identificador oficial único do processo judicial no formato padronizado do CNJ (ex: NNNNNNN-DD.AAAA.J.TR.OOOO). Campo crítico para rastreamento e referência. |
+    | `court` | Tribunal responsável pelo julgamento do processo. Determina a competência jurisdicional e as regras procedimentais aplicáveis. |
+    | `jurisdiction` | Área geográfica ou especialidade jurídica sob a qual o caso está sendo julgado. Importante para determinar precedentes aplicáveis. |
+    | `distribution_date` | Data em que o processo foi distribuído a um juiz ou vara específica. Marco inicial do prazo processual. |
+    | `response_deadline` | Data limite para apresentação de resposta ou manifestação. Crucial para controle de prazos processuais e evitar preclusão. |
+    | `responsible` | Advogado, procurador ou parte responsável pelo acompanhamento do processo. Essencial para atribuição interna de responsabilidades. |
+    | `judge_name` | Nome do magistrado responsável pelo julgamento. Relevante para análise de tendências decisórias e possíveis impedimentos. |
+    | `case_value` | Valor monetário atribuído à causa. Determina aspectos como custas processuais, competência de juizados e alçada recursal. |
+    | `sentence_date` | Data em que foi proferida a sentença ou decisão principal. Marco importante para contagem de prazos recursais. |
+    | `theme` | Categoria jurídica principal do processo (Civil, Criminal, Trabalhista, etc). Facilita a classificação e agrupamento temático. |
+    | `subthemes` | Objeto contendo subcategorias temáticas com palavras-chave relacionadas. Permite classificação mais granular e específica do conteúdo. |
+    | `priority` | Nível de prioridade de tramitação do processo. Identifica casos com tramitação prioritária por lei (idosos, doenças graves, etc). |
+    | `related_cases` | Lista de processos relacionados ou conexos. Importante para análise contextual e estratégica do litígio. |
+    """)),
+    ("📝 Seção SUMMARY", _markdown("""
+    ### Resumo Consolidado
+    Contém resumos e análises consolidadas do documento processado.
+    
+    | Campo | Conceito |
+    |-------|----------|
+    | `total_pages_processed` | Quantidade de páginas efetivamente processadas com sucesso. Utilizado para verificação de integridade do processamento. |
+    | `pages_with_errors` | Número de páginas que apresentaram problemas durante o processamento. Útil para identificar necessidade de revisão manual. |
+    | `pages_with_images` | Contagem de páginas que contêm elementos visuais. Indica complexidade do documento e potencial necessidade de análise especializada. |
+    | `summary_all` | Resumo abrangente de todo o conteúdo do documento. Fornece visão geral e contextualização do caso em linguagem natural. |
+    """)),
+    ("📋 Seção STRUCTURED_SUMMARY", _markdown("""
+    ### Resumo Estruturado
+    Esta subseção organiza o resumo em categorias específicas para facilitar a compreensão rápida do caso.
+    
+    | Campo | Conceito |
+    |-------|----------|
+    | `parties` | Identificação completa das partes envolvidas no processo (autores, réus, terceiros interessados). Crucial para análise de conflitos de interesse. |
+    | `object` | Descrição concisa do objeto da ação ou propósito principal do processo. Resume "sobre o que trata" o caso judicial. |
+    | `decision` | Resumo das principais decisões ou eventos processuais ocorridos. Fornece histórico decisório resumido e atual status processual. |
+    | `requests` | Compilação dos pedidos formulados pelas partes. Essencial para entender o que está sendo pleiteado e os riscos envolvidos. |
+    | `next_steps_deadlines` | Indicação dos próximos atos processuais esperados e seus respectivos prazos. Fundamental para planejamento estratégico e controle de agenda. |
+    | `legal_basis` | Resumo dos fundamentos legais e jurisprudência citados no documento. Identifica as bases normativas relevantes para o caso. |
+    """)),
+    ("⚠️ Campo CONTROVERSIAL_POINTS", _markdown("""
+    ### Pontos Controversos
+    
+    | Campo | Conceito |
+    |-------|----------|
+    | `controversial_points` | Lista de questões controversas ou pontos críticos identificados que podem impactar significativamente o resultado do caso. Orienta a análise de riscos e a estratégia processual. |
+    """)),
+]
+
+# Expander de temas e subtemas jurídicos
+TITULO_TEMAS = "📚 Temas e Subtemas Jurídicos"
+TEMAS_JURIDICOS = _markdown("""
+    ### Temas Jurídicos
+    Os temas representam as principais áreas do direito às quais um processo pode pertencer:
+    
+    - Cível
+    - Trabalhista
+    - Criminal
+    - Tributário
+    - Administrativo
+    - Previdenciário
+    - Constitucional
+    - Empresarial
+    - Consumidor
+    - Família
+    - Ambiental
+    - Eleitoral
+    - Militar
+    - Internacional
+    - Saúde
+    - Imobiliário
+    - Propriedade Intelectual
+    - Bancário
+    - Digital
+    - Agrário
+    """)
+TITULO_SUBTEMAS = "### Subtemas por Área Jurídica"
+
+# Subtemas de cada área, uma aba por área: (área, Markdown)
+SUBTEMAS_POR_AREA = [
+    ("Cível", _markdown("""
+        **Subtemas da área Cível:**
+        - Contratos
+        - Responsabilidade Civil
+        - Posse e Propriedade
+        - Obrigações
+        - Danos Morais
+        - Danos Materiais
+        - Indenização
+        - Locação
+        - Usucapião
+        - Condomínio
+        - Servidão
+        - Penhor
+        - Hipoteca
+        - Caução
+        - Arbitragem
+        - Mediação
+        - Cumprimento de Sentença
+        - Ação de Cobrança
+        - Ação Monitória
+        - Ação de Despejo
+        - Reintegração de Posse
+        - Interdito Proibitório
+        - Ação de Nunciação de Obra Nova
+        - Ação de Divisão de Terras
+        - Ação de Demarcação
+        """)),
+    ("Trabalhista", _markdown("""
+        **Subtemas da área Trabalhista:**
+        - Horas Extras
+        - Rescisão Contratual
+        - Acidente de Trabalho
+        - Assédio Moral
+        - Férias
+        - Décimo Terceiro Salário
+        - FGTS (Fundo de Garantia)
+        - Insalubridade
+        - Periculosidade
+        - Estabilidade Provisória
+        - Gestante
+        - Aposentado
+        - Dispensa Discriminatória
+        - Jornada de Trabalho
+        - Intervalo Intrajornada
+        - Trabalho Infantil
+        - Trabalho Escravo
+        - Greve
+        - Negociação Coletiva
+        - Contrato de Experiência
+        - Terceirização
+        - Pejotização
+        - Aviso Prévio
+        - Reversão de Justa Causa
+        - Dano Moral Coletivo
+        """)),
+    ("Criminal", _markdown("""
+        **Subtemas da área Criminal:**
+        - Crimes contra a Pessoa
+        - Crimes contra o Patrimônio
+        - Crimes contra a Administração Pública
+        - Tráfico de Drogas
+        - Crimes Ambientais
+        - Homicídio
+        - Lesão Corporal
+        - Estupro
+        - Roubo
+        - Furto
+        - Extorsão
+        - Apropriação Indébita
+        - Estelionato
+        - Receptação
+        - Corrupção Ativa
+        - Corrupção Passiva
+        - Peculato
+        - Prevaricação
+        - Lavagem de Dinheiro
+        - Organização Criminosa
+        - Crimes Eleitorais
+        - Crimes de Trânsito
+        - Porte Ilegal de Arma
+        - Falsidade Ideológica
+        - Falsificação de Documento
+        """)),
+    ("Tributário", _markdown("""
+        **Subtemas da área Tributária:**
+        - Impostos Federais
+        - Impostos Estaduais
+        - Impostos Municipais
+        - Planejamento Tributário
+        - Execução Fiscal
+        - ICMS
+        - IPI
+        - ISS
+        - IPTU
+        - IPVA
+        - IRPF (Imposto de Renda Pessoa Física)
+        - IRPJ (Imposto de Renda Pessoa Jurídica)
+        - Contribuições Previdenciárias
+        - PIS/COFINS
+        - Taxas Públicas
+        - Multas Tributárias
+        - Sonegação Fiscal
+        - Auto de Infração
+        - Compensação Tributária
+        - Restituição de Tributos
+        - Isenção Fiscal
+        - Imunidade Tributária
+        - Parcelamento de Débitos
+        - Contencioso Administrativo
+        - Contencioso Judicial
+        """)),
+    ("Administrativo", _markdown("""
+        **Subtemas da área Administrativa:**
+        - Licitações
+        - Atos Administrativos
+        - Processo Administrativo
+        - Improbidade Administrativa
+        - Concessões Públicas
+        - Permissões Públicas
+        - Parcerias Público-Privadas (PPP)
+        - Contratos Administrativos
+        - Expropriação
+        - Desapropriação
+        - Serviços Públicos
+        - Responsabilidade do Estado
+        - Sanções Administrativas
+        - Controle Interno
+        - Controle Externo
+        - Tribunal de Contas
+        - Ato Normativo
+        - Regulamentação
+        - Consulta Pública
+        - Audiência Pública
+        - Intervenção Estatal
+        - Revogação de Ato
+        - Anulação de Ato
+        - Concurso Público
+        - Nomeação e Posse
+        """)),
+    ("Previdenciário", _markdown("""
+        **Subtemas da área Previdenciária:**
+        - Aposentadoria por Idade
+        - Aposentadoria por Tempo de Contribuição
+        - Aposentadoria por Invalidez
+        - Pensão por Morte
+        - Auxílio-Doença
+        - Benefício Assistencial (LOAS)
+        - Revisão de Benefícios
+        - Salário-Maternidade
+        - Auxílio-Reclusão
+        - Aposentadoria Especial
+        - Contagem de Tempo de Serviço
+        - Contribuições em Atraso
+        - Desaposentação
+        - Reforma da Previdência
+        - Averbação de Tempo
+        - Certidão de Tempo de Contribuição
+        - Invalidez Permanente
+        - Doença Ocupacional
+        - Acidente de Trabalho
+        - Revisão de Cálculo
+        - Aposentadoria Rural
+        - Benefício Negado
+        - Processo Administrativo Previdenciário
+        - Recurso ao INSS
+        - Planejamento Previdenciário
+        """)),
+    ("Constitucional", _markdown("""
+        **Subtemas da área Constitucional:**
+        - Direitos Fundamentais
+        - Controle de Constitucionalidade
+        - Ação Direta de Inconstitucionalidade (ADI)
+        - Ação Declaratória de Constitucionalidade (ADC)
+        - Habeas Data
+        - Mandado de Injunção
+        - Mandado de Segurança Individual
+        - Mandado de Segurança Coletivo
+        - Direito de Petição
+        - Separação de Poderes
+        - Estado de Defesa
+        - Estado de Sítio
+        - Intervenção Federal
+        - Garantias Constitucionais
+        - Princípios Constitucionais
+        - Ação Popular
+        - Direitos Sociais
+        - Direitos Políticos
+        - Direitos Individuais
+        - Direitos Coletivos
+        - Cláusulas Pétreas
+        - Revisão Constitucional
+        - Poder Constituinte
+        - Tratados Internacionais
+        - Supremacia Constitucional
+        """)),
+    ("Empresarial", _markdown("""
+        **Subtemas da área Empresarial:**
+        - Falência
+        - Recuperação Judicial
+        - Recuperação Extrajudicial
+        - Sociedades Anônimas
+        - Sociedades Limitadas
+        - Contratos Comerciais
+        - Títulos de Crédito
+        - Cheque
+        - Nota Promissória
+        - Duplicata
+        - Propriedade Industrial
+        - Concorrência Desleal
+        - Dissolução de Sociedade
+        - Fusão e Aquisição
+        - Incorporação
+        - Cisão Empresarial
+        - Governança Corporativa
+        - Responsabilidade dos Sócios
+        - Contrato Social
+        - Registro Empresarial
+        - Planejamento Sucessório
+        - Mediação Empresarial
+        - Arbitragem Comercial
+        - Dívidas Empresariais
+        - Liquidação de Empresa
+        """)),
+    ("Consumidor", _markdown("""
+        **Subtemas da área do Consumidor:**
+        - Garantia de Produto
+        - Vício do Produto
+        - Defeito do Produto
+        - Propaganda Enganosa
+        - Práticas Abusivas
+        - Contrato de Adesão
+        - Cláusulas Abusivas
+        - Responsabilidade do Fornecedor
+        - Dano Moral
+        - Dano Material
+        - Relações de Consumo
+        - Recall
+        - Serviços Públicos
+        - Telefonia
+        - Energia Elétrica
+        - Planos de Saúde
+        - Transporte
+        - Compras Online
+        - Atraso na Entrega
+        - Cancelamento de Contrato
+        - Cobrança Indevida
+        - Inscrição indevida em Cadastro de Inadimplentes
+        - Direito de Arrependimento
+        - Oferta e Publicidade
+        - Proteção Contratual
+        """)),
+    ("Família", _markdown("""
+        **Subtemas da área de Família:**
+        - Divórcio
+        - Guarda de Menores
+        - Pensão Alimentícia
+        - União Estável
+        - Casamento
+        - Inventário
+        - Partilha de Bens
+        - Regime de Bens
+        - Adoção
+        - Investigação de Paternidade
+        - Alienação Parental
+        - Interdição
+        - Tutela
+        - Curatela
+        - Separação de Corpos
+        - Mediação Familiar
+        - Violência Doméstica
+        - Planejamento Familiar
+        - Reconhecimento de Filho
+        - Alteração de Nome
+        - Dissolução de União Estável
+        - Testamento
+        - Sucessão
+        - Doação de Bens
+        - Abandono Afetivo
+        """)),
+    ("Ambiental", _markdown("""
+        **Subtemas da área Ambiental:**
+        - Desmatamento
+        - Poluição
+        - Licenciamento Ambiental
+        - Áreas Protegidas
+        - Crimes Ambientais
+        - Dano Ambiental
+        - Responsabilidade Ambiental
+        - Recursos Hídricos
+        - Gestão de Resíduos
+        - Mudanças Climáticas
+        - Zoneamento Ambiental
+        - Unidades de Conservação
+        - Multas Ambientais
+        - Ação Civil Pública Ambiental
+        - Recuperação de Área Degradada
+        - Impacto Ambiental
+        - Estudo de Impacto Ambiental (EIA)
+        - Compensação Ambiental
+        - Fauna e Flora
+        - Pesca Ilegal
+        - Mineração Ilegal
+        - Sustentabilidade
+        - Política Nacional do Meio Ambiente
+        - Conflitos Fundiários
+        - Direito das Águas
+        """)),
+    ("Eleitoral", _markdown("""
+        **Subtemas da área Eleitoral:**
+        - Propaganda Eleitoral
+        - Abuso de Poder Econômico
+        - Abuso de Poder Político
+        - Compra de Votos
+        - Inelegibilidade
+        - Registro de Candidatura
+        - Impugnação de Mandato
+        - Cassação de Mandato
+        - Financiamento de Campanha
+        - Prestação de Contas
+        - Ficha Limpa
+        - Crimes Eleitorais
+        - Urna Eletrônica
+        - Revisão de Eleitorado
+        - Alistamento Eleitoral
+        - Partidos Políticos
+        - Coligações
+        - Fidelidade Partidária
+        - Horário Eleitoral
+        - Pesquisas Eleitorais
+        - Ação de Investigação Judicial Eleitoral
+        - Recurso contra Diplomação
+        - Sistema Eleitoral
+        - Cotas de Gênero
+        - Justiça Eleitoral
+        """)),
+    ("Militar", _markdown("""
+        **Subtemas da área Militar:**
+        - Crimes Militares
+        - Deserção
+        - Insubordinação
+        - Peculato Militar
+        - Abuso de Autoridade
+        - Processo Disciplinar
+        - Reforma Militar
+        - Pensão Militar
+        - Promoção
+        - Transferência
+        - Licenciamento
+        - Serviço Militar Obrigatório
+        - Habeas Corpus Militar
+        - Conselho de Justificação
+        - Conselho de Disciplina
+        - Aposentadoria Militar
+        - Reserva Remunerada
+        - Invalidez Militar
+        - Hierarquia e Disciplina
+        - Justiça Militar
+        - Missões de Paz
+        - Operações Militares
+        - Regulamentos Disciplinares
+        - Uniformes e Insígnias
+        - Patrimônio Militar
+        """)),
+    ("Internacional", _markdown("""
+        **Subtemas da área Internacional:**
+        - Tratados Internacionais
+        - Direitos Humanos Internacionais
+        - Comércio Internacional
+        - Extradition
+        - Asilo Político
+        - Refugiados
+        - Nacionalidade
+        - Conflitos Armados
+        - Direito do Mar
+        - Tribunais Internacionais
+        - Arbitragem Internacional
+        - Investimento Estrangeiro
+        - Cooperação Jurídica
+        - Reconhecimento de Sentenças Estrangeiras
+        - Imunidade Diplomática
+        - Relações Diplomáticas
+        - Organizações Internacionais
+        - Sanções Internacionais
+        - Direito Humanitário
+        - Crimes Transnacionais
+        - Contratos Internacionais
+        - Conflitos de Jurisdição
+        - Protocolos Internacionais
+        - Mediação Internacional
+        - Direito Aéreo Internacional
+        """)),
+    ("Saúde", _markdown("""
+        **Subtemas da área da Saúde:**
+        - Plano de Saúde
+        - Negativa de Cobertura
+        - Tratamento Médico
+        - Fornecimento de Medicamentos
+        - Erro Médico
+        - Responsabilidade Médica
+        - Internação
+        - Cirurgia
+        - Saúde Pública
+        - SUS (Sistema Único de Saúde)
+        - Vigilância Sanitária
+        - Regulação de Medicamentos
+        - Vacinação
+        - Doação de Órgãos
+        - Transplante
+        - Pesquisa Clínica
+        - Direito à Vida
+        - Direito à Saúde
+        - Bioética
+        - Saúde Mental
+        - Epidemiologia
+        - Controle de Doenças
+        - Ações contra Hospitais
+        - Ações contra Clínicas
+        - Reajuste de Planos
+        """)),
+    ("Imobiliário", _markdown("""
+        **Subtemas da área de Imobiliário:**
+        - Compra e Venda
+        - Locação Residencial
+        - Locação Comercial
+        - Usucapião
+        - Despejo
+        - Reintegração de Posse
+        - Condomínio
+        - Incorporação Imobiliária
+        - Loteamento
+        - Regularização Fundiária
+        - Hipoteca
+        - Penhor Imobiliário
+        - Distrato Imobiliário
+        - Atraso na Entrega de Imóvel
+        - Vícios de Construção
+        - Imissão na Posse
+        - Ação de Divisão
+        - Ação de Demarcação
+        - Servidão de Passagem
+        - Direito de Vizinhança
+        - Registro de Imóveis
+        - Escritura Pública
+        - Contrato de Promessa
+        - Financiamento Imobiliário
+        - Leilão de Imóveis
+        """)),
+    ("Propriedade Intelectual", _markdown("""
+        **Subtemas da área de Propriedade Intelectual:**
+        - Patentes
+        - Marcas
+        - Direitos Autorais
+        - Desenhos Industriais
+        - Software
+        - Plágio
+        - Contrafação
+        - Licenciamento
+        - Transferência de Tecnologia
+        - Segredo Industrial
+        - Registro de Marca
+        - Registro de Patente
+        - Inovação
+        - Propriedade Industrial
+        - Concorrência Desleal
+        - Proteção de Dados Criativos
+        - Domínio na Internet
+        - Publicação de Obras
+        - Direitos Morais
+        - Direitos Patrimoniais
+        - Exploração Comercial
+        - Ações de Nulidade
+        - Ações de Infrações
+        - Mediação em PI
+        - Arbitragem em PI
+        """)),
+    ("Bancário", _markdown("""
+        **Subtemas da área de Bancário:**
+        - Revisão de Contrato
+        - Juros Abusivos
+        - Cobrança Indevida
+        - Financiamento
+        - Empréstimo
+        - Consórcio
+        - Cheque Especial
+        - Cartão de Crédito
+        - Tarifas Bancárias
+        - Execução de Dívida
+        - Alienação Fiduciária
+        - Leasing
+        - Câmbio
+        - Investimentos
+        - Fundos de Investimento
+        - Ações contra Bancos
+        - Fraudes Bancárias
+        - Sustação de Protesto
+        - Renegociação de Dívida
+        - Busca e Apreensão
+        - Liquidação Extrajudicial
+        - Responsabilidade Bancária
+        - Seguros Bancários
+        - Ações de Indenização
+        - Regulação Bancária
+        """)),
+    ("Digital", _markdown("""
+        **Subtemas da área de Digital:**
+        - Crimes Cibernéticos
+        - Proteção de Dados
+        - LGPD (Lei Geral de Proteção de Dados)
+        - Privacidade Online
+        - Contratos Digitais
+        - Assinatura Eletrônica
+        - Comércio Eletrônico
+        - Fraudes Online
+        - Hacking
+        - Phishing
+        - Difamação Online
+        - Cyberbullying
+        - Pornografia Infantil
+        - Propriedade Intelectual Digital
+        - Registro de Domínio
+        - Remoção de Conteúdo
+        - Responsabilidade de Provedores
+        - Acesso Não Autorizado
+        - Segurança da Informação
+        - Certificação Digital
+        - Blockchain
+        - Criptomoedas
+        - Direito ao Esquecimento
+        - Monitoramento Digital
+        - Regulação de Plataformas
+        """)),
+    ("Agrário", _markdown("""
+        **Subtemas da área de Agrário:**
+        - Posse de Terra
+        - Propriedade Rural
+        - Reforma Agrária
+        - Usucapião Rural
+        - Arrendamento Rural
+        - Parceria Agrícola
+        - Conflitos Fundiários
+        - Desapropriação Rural
+        - Zoneamento Agrícola
+        - Regularização de Terras
+        - Registro Rural
+        - Financiamento Agrícola
+        - Seguro Agrícola
+        - Produção Agropecuária
+        - Cooperativas Agrícolas
+        - Trabalho Rural
+        - Aposentadoria Rural
+        - Exploração Sustentável
+        - Danos Ambientais Rurais
+        - Irrigação
+        - Assentamentos Rurais
+        - Demarcação de Terras
+        - Terras Indígenas
+        - Quilombolas
+        - Política Agrária
+        """)),
+]
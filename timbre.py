@@ -0,0 +1,118 @@
+"""Timbre das páginas: linhas de cabeçalho e rodapé repetidas em quase todas as páginas
+
+Petições em papel timbrado repetem, em cada página do extracted_text, o
+nome do advogado, o endereço, o telefone e a numeração ("fls. N"). Uma
+linha entre as LINHAS_BORDA primeiras ou últimas de uma página é timbre
+quando, normalizada (minúsculas, espaços e dígitos), aparece nas bordas de
+pelo menos PROPORCAO_MINIMA das páginas. A detecção usa as primeiras
+AMOSTRA páginas do processo, para que as páginas possam ser lidas uma vez
+só, em sequência.
+
+Cada página é separada em conteúdo e referências (posição da linha, linha);
+recompor() devolve o texto original exato.
+"""
+import re
+import sys
+from collections import Counter
+from itertools import chain, islice
+
+LINHAS_BORDA = 6
+# Linhas mais longas são parágrafos, não timbre, e nem chegam a ser normalizadas
+TAMANHO_MAXIMO_LINHA = 160
+PROPORCAO_MINIMA = 0.5
+# Menos páginas que isso não bastam para distinguir timbre de coincidência
+PAGINAS_MINIMAS = 3
+AMOSTRA = 200
+
+_digitos = re.compile(r"\d+")
+_espacos = re.compile(r"\s+")
+
+
+def normalizar_linha(linha):
+    """Forma comparável da linha: "fls. 12" e "fls. 13" viram "fls. #" """
+    return _digitos.sub("#", _espacos.sub(" ", linha.strip().lower()))
+
+
+def _bordas(total):
+    """Posições das linhas de cabeçalho e rodapé de uma página com total linhas"""
+    if total <= 2 * LINHAS_BORDA:
+        return range(total)
+    return chain(range(LINHAS_BORDA), range(total - LINHAS_BORDA, total))
+
+
+class Timbre:
+    """Conjunto das linhas normalizadas de timbre de um processo"""
+
+    __slots__ = ("normalizadas",)
+
+    def __init__(self, normalizadas=()):
+        self.normalizadas = frozenset(normalizadas)
+
+    def __bool__(self):
+        return bool(self.normalizadas)
+
+    def __len__(self):
+        return len(self.normalizadas)
+
+    @classmethod
+    def detectar(cls, textos):
+        """Detecta o timbre em um iterável de textos de páginas"""
+        contagem = Counter()
+        paginas = 0
+        for texto in textos:
+            linhas = texto.split("\n") if texto else []
+            # Páginas de uma ou duas linhas ("<Imagem>") não têm cabeçalho nem rodapé
+            if len(linhas) < 3:
+                continue
+            paginas += 1
+            contagem.update({normalizar_linha(linhas[i]) for i in _bordas(len(linhas))
+                             if len(linhas[i]) <= TAMANHO_MAXIMO_LINHA} - {""})
+        minimo = max(PAGINAS_MINIMAS, PROPORCAO_MINIMA * paginas)
+        return cls(linha for linha, vezes in contagem.items() if vezes >= minimo)
+
+    def separar(self, texto):
+        """(conteúdo, referências) do texto; referências é uma tupla de (posição, linha)
+
+        As linhas de timbre são internadas: a mesma linha em várias páginas
+        (e em vários processos) fica uma vez só em memória. Uma página feita
+        só de timbre fica inteira no conteúdo.
+        """
+        if not self.normalizadas or not texto:
+            return texto, ()
+        linhas = texto.split("\n")
+        bordas = set(_bordas(len(linhas)))
+        conteudo = []
+        referencias = []
+        for posicao, linha in enumerate(linhas):
+            if posicao in bordas and len(linha) <= TAMANHO_MAXIMO_LINHA and normalizar_linha(linha) in self.normalizadas:
+                referencias.append((posicao, sys.intern(linha)))
+            else:
+                conteudo.append(linha)
+        if not referencias or not conteudo:
+            return texto, ()
+        return "\n".join(conteudo), tuple(referencias)
+
+    def remover(self, texto):
+        """Texto sem as linhas de timbre"""
+        return self.separar(texto)[0]
+
+
+def recompor(conteudo, referencias):
+    """Texto original a partir do conteúdo e das referências de separar()"""
+    if not referencias:
+        return conteudo
+    linhas = conteudo.split("\n")
+    for posicao, linha in referencias:
+        linhas.insert(posicao, linha)
+    return "\n".join(linhas)
+
+
+def com_timbre(paginas, amostra=AMOSTRA):
+    """Detecta o timbre nas primeiras páginas de um iterável de PageResult
+
+    Devolve (timbre, páginas), onde páginas percorre de novo todas as
+    páginas, inclusive as da amostra, sem ler a fonte duas vezes.
+    """
+    paginas = iter(paginas)
+    primeiras = list(islice(paginas, amostra))
+    return Timbre.detectar(p.extracted_text for p in primeiras), chain(primeiras, paginas)
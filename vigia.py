@@ -0,0 +1,215 @@
+"""Vigia do diretório do acervo: detecta arquivos novos, alterados e removidos
+
+Uma thread em segundo plano varre o diretório a cada intervalo e compara
+(mtime, tamanho) de cada *_resultado.json com o catálogo. Só os arquivos
+cuja assinatura mudou são lidos: primeiro o hash do conteúdo, depois, se o
+conteúdo de fato mudou, a extração da entrada do catálogo. Os ouvintes
+inscritos (índice do acervo, tabelas agregadas, caches) recebem apenas as
+alterações de cada varredura. Um arquivo que não pôde ser lido só é tentado
+de novo quando a assinatura dele muda.
+"""
+import os
+import threading
+from typing import List, NamedTuple, Tuple
+
+from compressao import e_resultado
+from corpus import EntradaCatalogo, carregar_catalogo, chave_ordenacao, criar_entrada, hash_arquivo, salvar_catalogo
+
+# Segundos entre duas varreduras do diretório
+INTERVALO_PADRAO = 5.0
+
+
+class Alteracoes(NamedTuple):
+    """Resultado de uma varredura, em relação ao catálogo anterior"""
+    adicionadas: List[EntradaCatalogo]
+    # (entrada anterior, entrada nova) de arquivos cujo conteúdo mudou
+    alteradas: List[Tuple[EntradaCatalogo, EntradaCatalogo]]
+    removidas: List[EntradaCatalogo]
+    # (entrada anterior, entrada nova) de arquivos com novo mtime, mas o mesmo conteúdo
+    tocadas: List[Tuple[EntradaCatalogo, EntradaCatalogo]]
+
+    def __bool__(self):
+        return any((self.adicionadas, self.alteradas, self.removidas, self.tocadas))
+
+
+class VigiaAcervo:
+    """Mantém o catálogo de um diretório atualizado e avisa os ouvintes a cada mudança
+
+    Uma única instância por diretório é compartilhada por todas as sessões
+    (via st.cache_resource). A versão é incrementada depois que todos os
+    ouvintes foram avisados, então quem a observa mudar já encontra os
+    índices e as tabelas atualizados.
+    """
+
+    def __init__(self, diretorio, intervalo=INTERVALO_PADRAO):
+        self.diretorio = diretorio
+        self.intervalo = intervalo
+        self.versao = 0
+        self._entradas = {e.caminho: e for e in carregar_catalogo(diretorio)}
+        self._ordenado = sorted(self._entradas.values(), key=chave_ordenacao)
+        # Assinaturas vistas na última varredura: um arquivo só é lido quando
+        # a assinatura se repete em duas varreduras (cópia já concluída)
+        self._pendentes = {}
+        # caminho -> assinatura dos arquivos que não puderam ser lidos: ficam de
+        # fora das varreduras até a assinatura mudar
+        self._falhas = {}
+        # Entradas do catálogo salvo podem vir sem hash_conteudo (ver _completar_hashes)
+        self._hashes_completos = False
+        self._ouvintes = []
+        self._trava = threading.Lock()
+        self._parar = threading.Event()
+        self._thread = None
+
+    def iniciar(self):
+        """Inicia a varredura periódica em uma thread daemon (intervalo 0 desativa)"""
+        if self.intervalo > 0 and self._thread is None:
+            self._thread = threading.Thread(target=self._executar, name=f"vigia:{self.diretorio}", daemon=True)
+            self._thread.start()
+        return self
+
+    def parar(self):
+        self._parar.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _executar(self):
+        while not self._parar.wait(self.intervalo):
+            try:
+                self.verificar()
+            except OSError:
+                # Diretório temporariamente inacessível (montagem de rede, por exemplo)
+                continue
+
+    def catalogo(self) -> List[EntradaCatalogo]:
+        """Catálogo atual, na ordem do seletor de processos"""
+        return self._ordenado
+
+    def inscrever(self, ouvinte):
+        """Registra ouvinte(alteracoes), chamado da thread do vigia a cada varredura com mudanças"""
+        with self._trava:
+            self._ouvintes.append(ouvinte)
+
+    def acompanhar(self, criar):
+        """Cria um recurso a partir do catálogo atual e inscreve recurso.aplicar
+
+        criar(catalogo) roda sob a mesma trava das varreduras, então nenhuma
+        alteração fica entre o catálogo usado na criação e o primeiro aviso.
+        """
+        with self._trava:
+            recurso = criar(list(self._ordenado))
+            self._ouvintes.append(recurso.aplicar)
+            return recurso
+
+    def _varrer(self):
+        """Assinaturas (mtime_ns, tamanho) dos arquivos de resultado do diretório"""
+        assinaturas = {}
+        with os.scandir(self.diretorio) as itens:
+            for item in itens:
+                if e_resultado(item.name) and item.is_file():
+                    info = item.stat()
+                    assinaturas[item.path] = (info.st_mtime_ns, info.st_size)
+        return assinaturas
+
+    def _completar_hashes(self):
+        """Calcula o hash_conteudo das entradas do catálogo salvo que ainda não o têm
+
+        Sem o hash, um arquivo só tocado (mesmo conteúdo, outro mtime) pareceria
+        alterado e seria recarregado por inteiro. O hash só vale se o arquivo
+        ainda tem a assinatura da entrada, e é calculado fora da trava, para não
+        segurar as sessões enquanto o acervo é lido.
+        """
+        calculados = {}
+        for entrada in [e for e in self._ordenado if e.hash_conteudo is None]:
+            assinatura = (entrada.mtime_ns, entrada.tamanho)
+            try:
+                if _assinatura(entrada.caminho) != assinatura:
+                    # Já mudou: o hash do conteúdo anterior não pode mais ser conhecido
+                    continue
+                hash_conteudo = hash_arquivo(entrada.caminho)
+                if _assinatura(entrada.caminho) == assinatura:
+                    calculados[entrada.caminho] = (assinatura, hash_conteudo)
+            except OSError:
+                continue
+        with self._trava:
+            for caminho, (assinatura, hash_conteudo) in calculados.items():
+                entrada = self._entradas.get(caminho)
+                if entrada is not None and entrada.hash_conteudo is None and (entrada.mtime_ns, entrada.tamanho) == assinatura:
+                    self._entradas[caminho] = entrada.model_copy(update={"hash_conteudo": hash_conteudo})
+            if calculados:
+                self._ordenado = sorted(self._entradas.values(), key=chave_ordenacao)
+                salvar_catalogo(self.diretorio, self._ordenado)
+            self._hashes_completos = True
+
+    def verificar(self) -> Alteracoes:
+        """Faz uma varredura e aplica as alterações encontradas"""
+        if not self._hashes_completos:
+            self._completar_hashes()
+        with self._trava:
+            alteracoes = self._comparar(self._varrer())
+            if alteracoes:
+                for anterior, _ in alteracoes.alteradas + alteracoes.tocadas:
+                    del self._entradas[anterior.caminho]
+                for entrada in alteracoes.removidas:
+                    del self._entradas[entrada.caminho]
+                for entrada in alteracoes.adicionadas + [nova for _, nova in alteracoes.alteradas + alteracoes.tocadas]:
+                    self._entradas[entrada.caminho] = entrada
+                self._ordenado = sorted(self._entradas.values(), key=chave_ordenacao)
+                salvar_catalogo(self.diretorio, self._ordenado)
+                for ouvinte in self._ouvintes:
+                    try:
+                        ouvinte(alteracoes)
+                    except Exception:
+                        # Um ouvinte com problema não pode interromper a vigia;
+                        # o recurso dele volta a ser conferido no próximo uso
+                        continue
+                self.versao += 1
+        return alteracoes
+
+    def _comparar(self, assinaturas):
+        alteracoes = Alteracoes([], [], [], [])
+        for caminho, entrada in self._entradas.items():
+            if caminho not in assinaturas:
+                alteracoes.removidas.append(entrada)
+
+        pendentes = {}
+        falhas = {}
+        for caminho, assinatura in assinaturas.items():
+            anterior = self._entradas.get(caminho)
+            if anterior is not None and (anterior.mtime_ns, anterior.tamanho) == assinatura:
+                continue
+            if self._falhas.get(caminho) == assinatura:
+                # Já falhou com esta assinatura: não é lido de novo até o arquivo mudar
+                falhas[caminho] = assinatura
+                continue
+            if self._pendentes.get(caminho) != assinatura:
+                # Primeira vez com esta assinatura: o arquivo pode estar sendo gravado
+                pendentes[caminho] = assinatura
+                continue
+            try:
+                hash_conteudo = hash_arquivo(caminho)
+                if anterior is not None and anterior.hash_conteudo == hash_conteudo:
+                    nova = anterior.model_copy(update={"mtime_ns": assinatura[0], "tamanho": assinatura[1]})
+                    alteracoes.tocadas.append((anterior, nova))
+                    continue
+                nova = criar_entrada(caminho).model_copy(update={"hash_conteudo": hash_conteudo})
+            except (OSError, ValueError):
+                # Arquivo incompleto ou inválido: tenta de novo quando a assinatura mudar
+                falhas[caminho] = assinatura
+                continue
+            if (nova.mtime_ns, nova.tamanho) != assinatura:
+                # Mudou entre o hash e a extração: fica para a próxima varredura
+                pendentes[caminho] = (nova.mtime_ns, nova.tamanho)
+                continue
+            if anterior is None:
+                alteracoes.adicionadas.append(nova)
+            else:
+                alteracoes.alteradas.append((anterior, nova))
+        self._pendentes = pendentes
+        self._falhas = falhas
+        return alteracoes
+
+
+def _assinatura(caminho):
+    info = os.stat(caminho)
+    return info.st_mtime_ns, info.st_size